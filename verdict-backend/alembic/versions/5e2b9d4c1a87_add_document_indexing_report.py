@@ -0,0 +1,28 @@
+"""add_document_indexing_report
+
+Revision ID: 5e2b9d4c1a87
+Revises: c79765637bac
+Create Date: 2026-10-17
+
+Adds Document.indexingReport, a JSON summary of the batched vector-index
+upsert run during ingestion (upserted / failed counts and the per-record
+failures), so partially indexed documents are visible instead of silently
+reported as READY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "5e2b9d4c1a87"
+down_revision: Union[str, None] = "c79765637bac"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("Document", sa.Column("indexingReport", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("Document", "indexingReport")
@@ -0,0 +1,55 @@
+"""add_transcript_segments
+
+Revision ID: 684dd2fba3a7
+Revises: c7f3a1d82e04
+Create Date: 2026-10-17
+
+Adds an append-only TranscriptSegment table so each interrogator question /
+witness answer is stored as its own row instead of rewriting the whole
+Session.transcriptRaw string on every turn.  transcriptRaw is kept as a
+materialized copy rebuilt from the segments on demand.
+
+Existing transcripts are backfilled as a single segment per session so the
+segment store is the source of truth going forward.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "684dd2fba3a7"
+down_revision: Union[str, None] = "c7f3a1d82e04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "TranscriptSegment",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("sessionId", sa.String(), sa.ForeignKey("Session.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("firmId", sa.String(), nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=False),
+        sa.Column(
+            "speakerRole",
+            postgresql.ENUM(name="SpeakerRole", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.Column("createdAt", sa.DateTime(), server_default=sa.text("NOW()"), nullable=False),
+        sa.UniqueConstraint("sessionId", "sequence", name="TranscriptSegment_sessionId_sequence_key"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO "TranscriptSegment" ("id", "sessionId", "firmId", "sequence", "speakerRole", "content")
+        SELECT gen_random_uuid()::text, "id", "firmId", 1, NULL, "transcriptRaw"
+        FROM "Session"
+        WHERE "transcriptRaw" IS NOT NULL AND "transcriptRaw" <> ''
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("TranscriptSegment")
@@ -0,0 +1,45 @@
+"""add_ingestion_dedupe
+
+Revision ID: 9d41c6e2b7f3
+Revises: 5e2b9d4c1a87
+Create Date: 2026-10-17
+
+Content-hash deduplication for document ingestion.
+
+  TABLE   IngestionArtifact — storage key of the extracted pages (JSONL) +
+          Claude facts per (firmId, fileHash, mimeType), reused across
+          documents and cases
+  COLUMN  Document.chunkHashes — {recordId: contentHash, or "" if not in the
+          vector index} of every record the document references, so chunks
+          already indexed for the case are skipped
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "9d41c6e2b7f3"
+down_revision: Union[str, None] = "5e2b9d4c1a87"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "IngestionArtifact",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("firmId", sa.String(), nullable=False),
+        sa.Column("fileHash", sa.String(), nullable=False),
+        sa.Column("mimeType", sa.String(), nullable=False),
+        sa.Column("pageCount", sa.Integer(), nullable=True),
+        sa.Column("textKey", sa.String(), nullable=True),
+        sa.Column("extractedFacts", sa.JSON(), nullable=True),
+        sa.Column("createdAt", sa.DateTime(), server_default=sa.text("NOW()"), nullable=False),
+        sa.UniqueConstraint("firmId", "fileHash", "mimeType", name="IngestionArtifact_firmId_fileHash_mimeType_key"),
+    )
+    op.add_column("Document", sa.Column("chunkHashes", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("Document", "chunkHashes")
+    op.drop_table("IngestionArtifact")
@@ -0,0 +1,39 @@
+"""add_case_facts
+
+Revision ID: b8e4f1a2c6d9
+Revises: 9d41c6e2b7f3
+Create Date: 2026-10-17
+
+Per-case aggregate of extracted document facts.
+
+  TABLE   CaseFacts — one row per case: merged parties, key dates, disputed
+          facts and prior statements with dedupe keys and source document
+          ids, plus the READY documents merged in.  Built lazily on first
+          read for existing cases, then maintained as documents finish
+          ingestion or are deleted.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b8e4f1a2c6d9"
+down_revision: Union[str, None] = "9d41c6e2b7f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "CaseFacts",
+        sa.Column("caseId", sa.String(), sa.ForeignKey("Case.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("firmId", sa.String(), nullable=False),
+        sa.Column("facts", sa.JSON(), nullable=False),
+        sa.Column("documents", sa.JSON(), nullable=False),
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        sa.Column("updatedAt", sa.DateTime(), server_default=sa.text("NOW()"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("CaseFacts")
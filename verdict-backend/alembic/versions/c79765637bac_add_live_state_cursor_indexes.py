@@ -0,0 +1,39 @@
+"""add_live_state_cursor_indexes
+
+Revision ID: c79765637bac
+Revises: 684dd2fba3a7
+Create Date: 2026-10-17
+
+Backs the cursor-based GET /sessions/{id}/live-state?since=... delta feed.
+
+  INDEX   SessionEvent ("sessionId", "createdAt")
+  INDEX   Alert        ("sessionId", "createdAt")
+  DEFAULT "createdAt" -> clock_timestamp() on both tables
+
+NOW() is the transaction start time, so a row committed at the end of a long
+request (e.g. a streamed question) could be stamped earlier than a cursor a
+client already holds and never be delivered.  clock_timestamp() stamps the
+actual insert time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "c79765637bac"
+down_revision: Union[str, None] = "684dd2fba3a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["SessionEvent", "Alert"]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f"{table}_sessionId_createdAt_idx", table, ["sessionId", "createdAt"])
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "createdAt" SET DEFAULT clock_timestamp()')
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "createdAt" SET DEFAULT NOW()')
+        op.drop_index(f"{table}_sessionId_createdAt_idx", table_name=table)
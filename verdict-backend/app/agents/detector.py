@@ -1,7 +1,15 @@
+import asyncio
 import json
+import logging
+from app.agents.prescreen import prescreen_contradiction
+from app.config import settings
 from app.services.databricks_vector import search_prior_statements
 from app.services.nemotron import score_contradiction
 from app.services.claude import claude_chat
+from app.services.rate_limiter import Priority
+from app.services.circuit_breaker import CircuitOpenError, get_breaker
+
+logger = logging.getLogger(__name__)
 
 CONFIDENCE_THRESHOLD_LIVE = 0.75
 CONFIDENCE_THRESHOLD_SECONDARY = 0.5
@@ -17,6 +25,78 @@ _EMPTY_RESULT = {
     "impeachmentRisk": "LOW",
 }
 
+_hedge_stats = {"scored": 0, "hedged": 0, "claudeWins": 0, "fallbacks": 0}
+
+
+def hedge_stats() -> dict:
+    return dict(_hedge_stats)
+
+
+async def _claude_score(answer_text: str, prior_statements: list[dict]) -> dict:
+    result = await claude_chat(
+        'Score contradiction confidence 0-1. Return only JSON: {"contradiction_confidence": number, "best_match_index": number}',
+        f'Answer: "{answer_text}"\nPrior:\n' + "\n".join(
+            f"[{i}] {s.get('content', '')}" for i, s in enumerate(prior_statements)
+        ),
+        priority=Priority.DETECTION,
+        circuit_breaker=True,
+    )
+    return json.loads(result)
+
+
+def _hedge_delay() -> float | None:
+    """Seconds to give Nemotron before racing Claude, or None to not hedge."""
+    if not settings.DETECTOR_HEDGE_ENABLED or get_breaker("claude").is_open:
+        return None
+    p95 = get_breaker("nemotron").latency_p95()
+    low, high = settings.DETECTOR_HEDGE_MIN_MS / 1000, settings.DETECTOR_HEDGE_MAX_MS / 1000
+    return high if p95 is None else min(max(p95, low), high)
+
+
+async def _score(answer_text: str, prior_statements: list[dict], case_type: str) -> tuple[dict, bool]:
+    """Contradiction score and whether it came from the Claude fallback.
+
+    Nemotron answers unless it fails (an open circuit fails at once), in
+    which case Claude is asked — as before, but without waiting out a slow
+    provider.  When hedging, Claude is also started once Nemotron has run
+    past its recent p95, and whichever succeeds first is used.
+    """
+    _hedge_stats["scored"] += 1
+    nemotron = asyncio.create_task(score_contradiction(
+        witness_answer=answer_text,
+        prior_statements=prior_statements,
+        case_context=f"{case_type} deposition",
+    ))
+    pending = {nemotron}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=_hedge_delay())
+        if nemotron in done:
+            if nemotron.exception() is None:
+                return nemotron.result(), False
+            # Nemotron unavailable — fall back to Claude with a raised threshold
+            # (PRD §5.4 graceful degradation).
+            if not isinstance(nemotron.exception(), CircuitOpenError):
+                logger.warning("Nemotron scoring failed, falling back to Claude: %s", nemotron.exception())
+            _hedge_stats["fallbacks"] += 1
+        else:
+            _hedge_stats["hedged"] += 1
+        claude = asyncio.create_task(_claude_score(answer_text, prior_statements))
+        pending.add(claude)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            errors = [task.exception() for task in done if task.exception() is not None]
+            winner = next((task for task in done if task.exception() is None), None)
+            if winner is not None:
+                if winner is claude and nemotron in pending:
+                    _hedge_stats["claudeWins"] += 1
+                return winner.result(), winner is claude
+            error = errors[-1]
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
 
 async def detect_inconsistency(
     question_text: str,
@@ -25,34 +105,24 @@ async def detect_inconsistency(
     case_id: str,          # used to filter Databricks prior_statements_index by case
     case_type: str,
 ) -> dict:
-    # Pull the top-5 semantically similar prior statements for this case.
+    # Pull the top DETECTOR_TOP_K (5) most similar prior statements for this case.
     prior_statements = await search_prior_statements(
         case_id=case_id,
         query=answer_text,
-        top_k=5,
+        top_k=settings.DETECTOR_TOP_K,
     )
 
     if not prior_statements:
         return _EMPTY_RESULT
 
-    using_fallback = False
-    try:
-        score = await score_contradiction(
-            witness_answer=answer_text,
-            prior_statements=prior_statements,
-            case_context=f"{case_type} deposition",
-        )
-    except Exception:
-        # Nemotron unavailable — fall back to Claude with a raised threshold
-        # (PRD §5.4 graceful degradation).
-        using_fallback = True
-        result = await claude_chat(
-            'Score contradiction confidence 0-1. Return only JSON: {"contradiction_confidence": number, "best_match_index": number}',
-            f'Answer: "{answer_text}"\nPrior:\n' + "\n".join(
-                f"[{i}] {s.get('content', '')}" for i, s in enumerate(prior_statements)
-            ),
-        )
-        score = json.loads(result)
+    # Cheap local pass first — non-answers and restatements skip the LLM call.
+    if settings.PRESCREEN_ENABLED:
+        screen = prescreen_contradiction(answer_text, prior_statements)
+        if not screen.escalate:
+            logger.debug("Pre-screen skipped scoring for session %s (%s)", session_id, screen.reason)
+            return _EMPTY_RESULT
+
+    score, using_fallback = await _score(answer_text, prior_statements, case_type)
 
     threshold = CONFIDENCE_THRESHOLD_CLAUDE_FALLBACK if using_fallback else CONFIDENCE_THRESHOLD_LIVE
     confidence = score.get("contradiction_confidence", 0)
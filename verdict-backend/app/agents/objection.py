@@ -1,5 +1,6 @@
 import json
 from app.services.claude import claude_chat
+from app.services.rate_limiter import Priority
 from app.services.databricks_vector import search_fre_rules
 
 OBJECTION_SYSTEM = """You are an expert attorney specializing in evidence law and Federal Rules of Evidence.
@@ -33,7 +34,7 @@ async def analyze_for_objections(question_text: str, session_id: str) -> dict:
     if fre_context:
         prompt += f"\n\nRelevant FRE rules:\n{fre_context}"
 
-    raw = await claude_chat(OBJECTION_SYSTEM, prompt, max_tokens=256)
+    raw = await claude_chat(OBJECTION_SYSTEM, prompt, max_tokens=256, priority=Priority.DETECTION)
     # Strip markdown code fences if Claude wrapped the JSON
     cleaned = raw.strip()
     if cleaned.startswith("```"):
@@ -2,6 +2,7 @@ import json
 import re
 from app.services.claude import claude_chat
 from app.services.elevenlabs import text_to_speech
+from app.services.rate_limiter import Priority
 from app.config import settings
 
 ORCHESTRATOR_SYSTEM = """You are an elite litigation coach reviewing a completed deposition practice session.
@@ -96,7 +97,7 @@ Generate a coaching brief as JSON (ALL strings must be single-line, use \\n for
   "composureAlerts": <integer>
 }}"""
 
-    raw = await claude_chat(ORCHESTRATOR_SYSTEM, prompt, max_tokens=1500)
+    raw = await claude_chat(ORCHESTRATOR_SYSTEM, prompt, max_tokens=1500, priority=Priority.BRIEF)
     brief_data = _extract_json(raw)
 
     narration = (
@@ -104,7 +105,7 @@ Generate a coaching brief as JSON (ALL strings must be single-line, use \\n for
         f"{brief_data.get('narrativeText', '')}"
     )
     try:
-        audio_bytes = await text_to_speech(narration, settings.ELEVENLABS_COACH_VOICE_ID)
+        audio_bytes = await text_to_speech(narration, settings.ELEVENLABS_COACH_VOICE_ID, priority=Priority.BRIEF)
         brief_data["coachAudioBytes"] = audio_bytes
     except Exception:
         brief_data["coachAudioBytes"] = None
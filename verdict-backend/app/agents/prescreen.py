@@ -0,0 +1,170 @@
+"""
+Local contradiction pre-screen for the Inconsistency Detector.
+
+Runs before score_contradiction and skips the LLM call only when the answer
+is confidently consistent with the record.  Everything else is escalated:
+a missed contradiction costs far more than a wasted call.  An answer is
+skipped when it is
+
+  - a stock non-answer ("Yes.", "Correct.", "I don't recall."), which gives
+    the LLM nothing to compare (it never sees the question), or
+  - a restatement of a retrieved prior statement: token overlap (Jaccard)
+    of at least PRESCREEN_CONSISTENT_OVERLAP, no number / date / name the
+    statement lacks, and no disagreement signal,
+
+and no retrieved statement that shares a term with it disagrees on one of
+the cheap signals:
+
+  polarity — one side negated ("not", "never", "n't", "deny"…), the other not
+  number   — both mention numbers / dates and they differ
+  entity   — both name people / places / exhibits and the sets differ
+  antonym  — a known opposite pair (adequate/short, before/after, red/green…)
+
+Negations and "was"/"did" are kept as terms, so "I was not there" does not
+restate "I was there".  Tune against scripts/eval_prescreen.py, and measure
+recall on labeled live turns (--labels) before relying on it.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from app.config import settings
+from app.services.lexical_index import STOPWORDS, tokenize
+
+_NEGATION_RE = re.compile(
+    r"\b(?:not|no|never|none|nobody|nothing|neither|nor|without|deny|denied|denies|"
+    r"refused|cannot)\b|n't\b",
+    re.IGNORECASE,
+)
+# Retrieval drops these; here they carry the polarity / tense of the answer.
+_TERM_STOPWORDS = STOPWORDS - {"no", "not", "never", "was", "did"}
+_WORD_RE = re.compile(r"[A-Za-z0-9]+(?:'[A-Za-z]+)?")
+_NON_ANSWER_RE = re.compile(
+    r"^\W*(?:yes|yeah|no|nope|correct|right|okay|ok|i\s+(?:do\s+not|don't)\s+(?:recall|remember|know)|"
+    r"i'm\s+not\s+sure|not\s+that\s+i\s+(?:recall|remember))(?:,?\s+(?:sir|ma'am))?\W*$",
+    re.IGNORECASE,
+)
+_NUMBER_RE = re.compile(r"\$?\d+(?:[.,:/-]\d+)*%?")
+_MONTH_RE = re.compile(
+    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+    r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b",
+    re.IGNORECASE,
+)
+# Capitalized runs that don't start a sentence or a quote.
+_ENTITY_RE = re.compile(r"(?<![.!?]\s)(?<![\"'])(?<!^)\b[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*")
+_NUMBER_WORDS = {
+    "one": "1", "two": "2", "three": "3", "four": "4", "five": "5", "six": "6",
+    "seven": "7", "eight": "8", "nine": "9", "ten": "10", "twelve": "12",
+}
+_ANTONYMS = [
+    ({"adequate", "sufficient", "enough", "fully"}, {"short", "understaffed", "inadequate", "insufficient"}),
+    ({"before", "prior", "earlier"}, {"after", "later", "afterwards"}),
+    ({"always", "every"}, {"never", "sometimes", "occasionally"}),
+    ({"all", "everything", "everyone"}, {"some", "none", "nothing"}),
+    ({"red"}, {"green", "yellow"}),
+    ({"approved", "authorized", "agreed"}, {"unauthorized", "objected", "refused", "rejected"}),
+    ({"aware", "knew", "informed"}, {"unaware", "unknown"}),
+    ({"passed", "compliant", "licensed"}, {"failed", "violation", "unlicensed"}),
+    ({"involved", "responsible"}, {"uninvolved"}),
+]
+
+
+@dataclass
+class PrescreenResult:
+    escalate: bool
+    reason: str
+    best_index: int = -1
+    signals: list[str] = field(default_factory=list)
+
+
+_stats = {"screened": 0, "escalated": 0}
+
+
+def prescreen_stats() -> dict:
+    screened = _stats["screened"]
+    return {**_stats, "llmCallsSaved": screened - _stats["escalated"]}
+
+
+def _terms(text: str) -> set[str]:
+    # Crude plural folding so "trades" and "trade" count as the same topic.
+    return {
+        t[:-1] if len(t) > 3 and t.endswith("s") and not t.endswith("ss") else t
+        for t in tokenize(text, _TERM_STOPWORDS)
+    }
+
+
+def _numbers(text: str) -> set[str]:
+    found = {n.strip("$%").replace(",", "") for n in _NUMBER_RE.findall(text)}
+    found |= {_NUMBER_WORDS[w] for w in re.findall(r"[a-z]+", text.lower()) if w in _NUMBER_WORDS}
+    found |= {m.lower()[:3] for m in _MONTH_RE.findall(text)}
+    return found
+
+
+def _entities(text: str) -> set[str]:
+    return {e.lower() for e in _ENTITY_RE.findall(text) if e.lower() not in {"i", "i'm", "i've"}}
+
+
+def _negated(text: str) -> bool:
+    return len(_NEGATION_RE.findall(text)) % 2 == 1
+
+
+def _antonym_clash(a: set[str], b: set[str]) -> bool:
+    return any((a & left and b & right) or (a & right and b & left) for left, right in _ANTONYMS)
+
+
+def _signals(answer: str, statement: str) -> list[str]:
+    signals = []
+    if _negated(answer) != _negated(statement):
+        signals.append("polarity")
+    answer_numbers, statement_numbers = _numbers(answer), _numbers(statement)
+    if answer_numbers and statement_numbers and answer_numbers != statement_numbers:
+        signals.append("number")
+    answer_entities, statement_entities = _entities(answer), _entities(statement)
+    if answer_entities and statement_entities and answer_entities - statement_entities:
+        signals.append("entity")
+    if _antonym_clash(set(tokenize(answer)), set(tokenize(statement))):
+        signals.append("antonym")
+    return signals
+
+
+def _restates(answer: str, statement: str, answer_terms: set[str], statement_terms: set[str]) -> bool:
+    overlap = len(answer_terms & statement_terms) / len(answer_terms | statement_terms)
+    return (
+        overlap >= settings.PRESCREEN_CONSISTENT_OVERLAP
+        and _numbers(answer) <= _numbers(statement)
+        and _entities(answer) <= _entities(statement)
+    )
+
+
+def prescreen_contradiction(answer_text: str, prior_statements: list[dict]) -> PrescreenResult:
+    """Decide whether an answer should be sent to the LLM contradiction scorer."""
+    _stats["screened"] += 1
+    if _NON_ANSWER_RE.match(answer_text) or not _WORD_RE.search(answer_text):
+        return PrescreenResult(escalate=False, reason="non_substantive")
+    answer_terms = _terms(answer_text)
+
+    signalled: PrescreenResult | None = None
+    signalled_overlap = 0.0
+    restated = False
+    best_index, best_overlap = -1, 0.0
+    for index, statement in enumerate(prior_statements):
+        content = statement.get("content") or ""
+        statement_terms = _terms(content)
+        shared = answer_terms & statement_terms
+        if not shared:
+            continue
+        overlap = len(shared) / len(answer_terms | statement_terms)
+        if overlap > best_overlap:
+            best_index, best_overlap = index, overlap
+        signals = _signals(answer_text, content)
+        if signals:
+            if signalled is None or overlap > signalled_overlap:
+                signalled = PrescreenResult(escalate=True, reason="signal", best_index=index, signals=signals)
+                signalled_overlap = overlap
+        elif _restates(answer_text, content, answer_terms, statement_terms):
+            restated = True
+
+    if signalled is None and restated:
+        return PrescreenResult(escalate=False, reason="consistent")
+    _stats["escalated"] += 1
+    return signalled or PrescreenResult(escalate=True, reason="uncertain", best_index=best_index)
@@ -10,6 +10,10 @@ class Settings(BaseSettings):
     DIRECT_URL: str = ""
 
     REDIS_URL: str
+    # Short socket timeouts so an unreachable Redis fails a call quickly instead
+    # of hanging it (app/redis_client.py)
+    REDIS_SOCKET_CONNECT_TIMEOUT_S: float = 1.0
+    REDIS_SOCKET_TIMEOUT_S: float = 1.0
 
     JWT_SECRET: str
     JWT_REFRESH_SECRET: str
@@ -20,13 +24,41 @@ class Settings(BaseSettings):
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
     S3_BUCKET_NAME: str = "verdict-documents-hackathon"
+    # Object storage: "auto" (S3 when AWS keys are set, else local — development
+    # only, elsewhere startup fails), "s3" or "local"
+    STORAGE_BACKEND: str = "auto"
+    LOCAL_STORAGE_DIR: str = "data/object_store"
+    # Signs local-storage URLs; falls back to JWT_SECRET
+    STORAGE_URL_SECRET: str = ""
+    # Base URL clients reach this API on, for local-storage URLs
+    PUBLIC_API_URL: str = "http://localhost:8000"
+    S3_MAX_WORKERS: int = 8
+    S3_MULTIPART_THRESHOLD_MB: int = 8
+    S3_MULTIPART_CHUNK_MB: int = 8
+    S3_MULTIPART_CONCURRENCY: int = 4
+    # Background upload queue for fire-and-forget objects (app/services/upload_queue.py)
+    S3_UPLOAD_WORKERS: int = 4
+    S3_UPLOAD_QUEUE_MAX: int = 500
+    S3_UPLOAD_MAX_RETRIES: int = 4
 
     ANTHROPIC_API_KEY: str = ""
     ANTHROPIC_MODEL: str = "claude-sonnet-4-6"
+    ANTHROPIC_PROMPT_CACHE_ENABLED: bool = True
+    # The API will not cache a prefix shorter than this (1024 for Sonnet/Opus);
+    # shorter cached_context is sent as plain system text.
+    ANTHROPIC_PROMPT_CACHE_MIN_TOKENS: int = 1024
 
     ELEVENLABS_API_KEY: str = ""
     ELEVENLABS_INTERROGATOR_VOICE_ID: str = ""
     ELEVENLABS_COACH_VOICE_ID: str = ""
+    ELEVENLABS_TIMEOUT_S: float = 60.0
+    ELEVENLABS_MAX_CONNECTIONS: int = 10
+    # Streaming answer transcription (app/services/streaming_stt.py)
+    STT_STREAM_SAMPLE_RATE: int = 16000
+    STT_VAD_RMS_THRESHOLD: float = 500.0       # int16 RMS counted as speech
+    STT_SEGMENT_PAUSE_MS: int = 350
+    STT_MAX_SEGMENT_MS: int = 6000
+    STT_END_OF_SPEECH_MS: int = 1200
 
     NEMOTRON_API_KEY: str = ""
     NEMOTRON_BASE_URL: str = "https://openrouter.ai/api/v1"
@@ -34,6 +66,16 @@ class Settings(BaseSettings):
     NEMOTRON_TIMEOUT_MS: int = 15000
     NEMOTRON_HTTP_REFERER: str = "https://verdict.law"
     NEMOTRON_X_TITLE: str = "VERDICT"
+    NEMOTRON_MAX_CONNECTIONS: int = 20
+    # Micro-batching of score_contradiction across concurrent sessions
+    NEMOTRON_BATCH_ENABLED: bool = True
+    NEMOTRON_BATCH_WINDOW_MS: int = 30
+    NEMOTRON_BATCH_MAX_SIZE: int = 8
+
+    # Per-agent deadlines for POST /sessions/{id}/turns/analyze
+    TURN_OBJECTION_DEADLINE_MS: int = 8000
+    TURN_INCONSISTENCY_DEADLINE_MS: int = 12000
+    TURN_PREFETCH_DEADLINE_MS: int = 4000
 
     # Databricks Vector Search (via FastAPI retrieval proxy)
     DATABRICKS_HOST: str = ""            # e.g. http://127.0.0.1:8000
@@ -42,6 +84,107 @@ class Settings(BaseSettings):
     DATABRICKS_VECTOR_ENDPOINT: str = "verdict-vector-endpoint"
     DATABRICKS_VECTOR_INDEX: str = "verdict.sessions.prior_statements_index"
     DATABRICKS_FRE_INDEX: str = "verdict.sessions.fre_rules_index"
+    DATABRICKS_TIMEOUT_S: float = 10.0
+    DATABRICKS_MAX_CONNECTIONS: int = 20
+    DATABRICKS_UPSERT_BATCH_SIZE: int = 100
+    DATABRICKS_UPSERT_CONCURRENCY: int = 4
+    DATABRICKS_UPSERT_MAX_RETRIES: int = 3
+
+    # Vector retrieval backend: "databricks" | "local" | "auto" (Databricks
+    # when DATABRICKS_HOST/TOKEN are set, otherwise the local index).
+    VECTOR_BACKEND: str = "auto"
+    LOCAL_VECTOR_DIR: str = "data/vector_index"
+    LOCAL_VECTOR_DIM: int = 512
+
+    # Speculative next-question generation while the witness answers
+    SPECULATION_ENABLED: bool = True
+    SPECULATION_MIN_WORDS: int = 6
+    SPECULATION_MAX_CANDIDATES: int = 3        # per question
+    SPECULATION_MATCH_THRESHOLD: float = 0.85  # share of final-answer terms the basis must cover
+
+    # Hybrid prior-statement retrieval: vector + per-case BM25, fused with RRF
+    HYBRID_RETRIEVAL_ENABLED: bool = True
+    HYBRID_CANDIDATE_MULTIPLIER: int = 4    # candidates per list = top_k * this
+    HYBRID_RRF_K: int = 60
+    LEXICAL_INDEX_DIR: str = "data/lexical_index"
+
+    # Page-parallel PDF extraction (app/services/text_extraction.py)
+    PDF_EXTRACT_WORKERS: int = 0            # 0 = one per CPU
+    # Reuse extraction/facts by file hash and skip unchanged chunk upserts
+    INGESTION_DEDUPE_ENABLED: bool = True
+    # Map-reduce fact extraction (app/services/fact_extraction.py)
+    FACT_WINDOW_TOKENS: int = 3500
+    FACT_EXTRACTION_CONCURRENCY: int = 4
+    # Streaming ingestion indexes chunks every this many records (app/services/ingestion.py)
+    INGEST_FLUSH_RECORDS: int = 500
+    # Durable ingestion queue (app/services/job_queue.py) drained by app/worker.py.
+    # Off = ingest in the API process via unbounded BackgroundTasks, as before;
+    # documents also fall back to that while Redis is unreachable.
+    INGEST_QUEUE_ENABLED: bool = True
+    # "api" = the API process consumes the queue itself in
+    # INGEST_WORKER_CONCURRENCY slots; "worker" = separate `python -m app.worker`
+    # processes, which need shared storage and indexes (S3 + Databricks).
+    INGEST_QUEUE_CONSUMER: str = "api"
+    INGEST_WORKER_SHARED_DISK: bool = False   # local index dirs shared with the API
+    INGEST_WORKER_CONCURRENCY: int = 2
+    INGEST_VISIBILITY_TIMEOUT_S: int = 300
+    INGEST_MAX_ATTEMPTS: int = 4
+    INGEST_RETRY_BASE_S: float = 15.0
+    INGEST_POLL_INTERVAL_S: float = 1.0
+    PDF_PAGES_PER_TASK: int = 25
+    # Retrieval chunking with page:line spans (app/services/chunking.py)
+    CHUNK_MAX_CHARS: int = 800
+    CHUNK_MIN_CHARS: int = 250              # below this, don't break at a new question
+    CHUNK_OVERLAP_LINES: int = 2
+    # Prior statements retrieved per answer for contradiction scoring
+    DETECTOR_TOP_K: int = 5
+
+    # Local contradiction pre-screen ahead of score_contradiction (agents/prescreen.py)
+    PRESCREEN_ENABLED: bool = True
+    # Skip only answers restating a prior statement at this token overlap (Jaccard)
+    PRESCREEN_CONSISTENT_OVERLAP: float = 0.8
+
+    # Retrieval result cache (app/services/retrieval_cache.py)
+    RETRIEVAL_CACHE_ENABLED: bool = True
+    RETRIEVAL_CACHE_LOCAL_MAX_ENTRIES: int = 1024
+    RETRIEVAL_CACHE_LOCAL_TTL_S: float = 60.0
+    RETRIEVAL_CACHE_REDIS_TTL_S: int = 6 * 3600
+    RETRIEVAL_CACHE_GLOBAL_TTL_S: int = 7 * 24 * 3600   # FRE corpus is static
+
+    # Circuit breakers per upstream (app/services/circuit_breaker.py)
+    CIRCUIT_WINDOW_SIZE: int = 50           # recent calls considered
+    CIRCUIT_MIN_CALLS: int = 10
+    CIRCUIT_ERROR_RATE: float = 0.5
+    CIRCUIT_OPEN_S: float = 30.0
+    NEMOTRON_CIRCUIT_P95_TRIP_MS: int = 4000
+    CLAUDE_CIRCUIT_P95_TRIP_MS: int = 0     # 0 = errors only; latency depends on the call
+    # Hedged contradiction scoring: Claude is raced against Nemotron once
+    # Nemotron has taken longer than its p95, clamped to this range.
+    DETECTOR_HEDGE_ENABLED: bool = True
+    DETECTOR_HEDGE_MIN_MS: int = 300
+    DETECTOR_HEDGE_MAX_MS: int = 2000
+
+    # Client-side rate limiting of LLM/TTS upstreams (app/services/rate_limiter.py).
+    # Per-minute budgets are shared by all processes through Redis; 0 = unlimited.
+    RATE_LIMIT_ENABLED: bool = True
+    # A bucket check slower than this fails open (no throttling), and Redis is
+    # then skipped for RATE_LIMIT_REDIS_RETRY_S before it is tried again.
+    RATE_LIMIT_REDIS_TIMEOUT_S: float = 0.25
+    RATE_LIMIT_REDIS_RETRY_S: float = 5.0
+    CLAUDE_REQUESTS_PER_MIN: int = 50
+    CLAUDE_TOKENS_PER_MIN: int = 80000
+    CLAUDE_MAX_CONCURRENCY: int = 16        # per process
+    NEMOTRON_REQUESTS_PER_MIN: int = 60
+    NEMOTRON_TOKENS_PER_MIN: int = 0
+    NEMOTRON_MAX_CONCURRENCY: int = 8
+    ELEVENLABS_REQUESTS_PER_MIN: int = 0
+    ELEVENLABS_CHARS_PER_MIN: int = 0
+    ELEVENLABS_MAX_CONCURRENCY: int = 5
+
+    # Shared upstream HTTP pools (app/services/http_clients.py)
+    HTTP2_ENABLED: bool = True
+    HTTP_CONNECT_TIMEOUT_S: float = 5.0
+    HTTP_KEEPALIVE_EXPIRY_S: float = 30.0
 
     class Config:
         env_file = ".env"
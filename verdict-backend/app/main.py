@@ -1,16 +1,47 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from app.database import engine, AsyncSessionLocal
-from app.routers import auth, cases, sessions, briefs, tts, conversations, documents, witnesses
+from app.redis_client import redis_client
+from app.services.http_clients import init_http_clients, close_http_clients
+from app.services.retrieval_cache import cache_stats
+from app.agents.prescreen import prescreen_stats
+from app.services.nemotron import batcher_stats
+from app.services.claude import prompt_cache_stats
+from app.services.s3 import shutdown_s3
+from app.services.storage_backends import get_storage_backend
+from app.services.text_extraction import shutdown_pdf_pool
+from app.services.upload_queue import start_upload_workers, stop_upload_workers, upload_queue_stats
+from app.services.job_queue import queue_stats
+from app.worker import consume as consume_ingestion
+from app.services.rate_limiter import rate_limiter_stats
+from app.services.circuit_breaker import circuit_breaker_stats
+from app.agents.detector import hedge_stats
+from app.routers import auth, cases, sessions, briefs, tts, conversations, documents, witnesses, storage
 from app.config import settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    get_storage_backend()  # resolve STORAGE_BACKEND now so a misconfiguration fails at startup
+    init_http_clients()
+    start_upload_workers()
+    ingest_stopping = asyncio.Event()
+    ingest_consumer = None
+    if settings.INGEST_QUEUE_ENABLED and settings.INGEST_QUEUE_CONSUMER == "api":
+        ingest_consumer = asyncio.create_task(consume_ingestion(ingest_stopping))
     yield
+    ingest_stopping.set()
+    if ingest_consumer is not None:
+        await ingest_consumer
+    await stop_upload_workers()
+    shutdown_s3()
+    shutdown_pdf_pool()
+    await close_http_clients()
     await engine.dispose()
+    await redis_client.aclose()
 
 
 app = FastAPI(title="VERDICT API", version="1.0.0", lifespan=lifespan)
@@ -25,7 +56,7 @@ app.add_middleware(
         "*"
     ],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "x-request-id"],
 )
 
@@ -37,6 +68,7 @@ app.include_router(tts.router, prefix="/api/v1/tts")
 app.include_router(conversations.router, prefix="/api/v1/conversations")
 app.include_router(documents.router, prefix="/api/v1")
 app.include_router(witnesses.router, prefix="/api/v1/cases")
+app.include_router(storage.router, prefix="/api/v1/storage")
 
 
 @app.get("/api/v1")
@@ -49,6 +81,10 @@ async def health():
     try:
         async with AsyncSessionLocal() as db:
             await db.execute(text("SELECT 1"))
-        return {"status": "ok", "timestamp": __import__("datetime").datetime.utcnow().isoformat(), "version": "1.0.0", "db": "connected"}
     except Exception:
         return {"status": "degraded", "timestamp": __import__("datetime").datetime.utcnow().isoformat(), "version": "1.0.0", "db": "disconnected"}
+    try:
+        ingest_queue = await queue_stats()
+    except Exception as exc:
+        ingest_queue = {"error": f"redis unavailable: {exc}"}
+    return {"status": "ok", "timestamp": __import__("datetime").datetime.utcnow().isoformat(), "version": "1.0.0", "db": "connected", "retrievalCache": cache_stats(), "contradictionPrescreen": prescreen_stats(), "contradictionBatching": batcher_stats(), "promptCache": prompt_cache_stats(), "uploadQueue": upload_queue_stats(), "ingestQueue": ingest_queue, "rateLimiter": rate_limiter_stats(), "circuitBreakers": circuit_breaker_stats(), "contradictionHedging": hedge_stats()}
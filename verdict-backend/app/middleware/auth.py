@@ -1,4 +1,5 @@
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Request, WebSocket, WebSocketException, status
+from starlette.requests import HTTPConnection
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -7,7 +8,7 @@ from app.models.user import User
 from app.config import settings
 
 
-def _extract_token_from_request(request: Request) -> str | None:
+def _extract_token_from_request(request: HTTPConnection) -> str | None:
     """Extract a raw JWT from httpOnly cookie or Authorization Bearer header.
 
     Cookie takes precedence (browser clients). Bearer header is supported as
@@ -24,14 +25,7 @@ def _extract_token_from_request(request: Request) -> str | None:
     return None
 
 
-async def require_auth(
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    token = _extract_token_from_request(request)
-    if not token:
-        raise HTTPException(status_code=401, detail={"code": "TOKEN_MISSING"})
-
+async def _user_from_token(token: str, db: AsyncSession) -> User:
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=["HS256"])
         user_id: str = payload.get("sub")
@@ -47,3 +41,28 @@ async def require_auth(
         raise HTTPException(status_code=403, detail={"code": "ACCOUNT_INACTIVE"})
 
     return user
+
+
+async def require_auth(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    token = _extract_token_from_request(request)
+    if not token:
+        raise HTTPException(status_code=401, detail={"code": "TOKEN_MISSING"})
+    return await _user_from_token(token, db)
+
+
+async def authenticate_websocket(websocket: WebSocket, db: AsyncSession) -> User:
+    """Auth for WebSocket routes.
+
+    Browsers cannot set an Authorization header on a WebSocket, so a
+    ?token= query parameter is accepted after the cookie and header.
+    """
+    token = _extract_token_from_request(websocket) or websocket.query_params.get("token")
+    if not token:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="TOKEN_MISSING")
+    try:
+        return await _user_from_token(token, db)
+    except HTTPException as exc:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=exc.detail["code"])
@@ -9,3 +9,6 @@ from app.models.session_event import SessionEvent
 from app.models.alert import Alert
 from app.models.brief import Brief
 from app.models.attorney_annotation import AttorneyAnnotation
+from app.models.transcript_segment import TranscriptSegment
+from app.models.ingestion_artifact import IngestionArtifact
+from app.models.case_facts import CaseFacts
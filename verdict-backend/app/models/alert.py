@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, JSON, Enum as PgEnum
+from sqlalchemy import Index, String, Integer, Float, DateTime, ForeignKey, JSON, Enum as PgEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -20,6 +20,9 @@ _ALERT_STATUS_ENUM = PgEnum(
 
 class Alert(Base):
     __tablename__ = "Alert"
+    __table_args__ = (
+        Index("Alert_sessionId_createdAt_idx", "sessionId", "createdAt"),
+    )
 
     id: Mapped[str] = mapped_column("id", String, primary_key=True, default=lambda: str(uuid.uuid4()))
     session_id: Mapped[str] = mapped_column("sessionId", String, ForeignKey("Session.id", ondelete="CASCADE"))
@@ -40,7 +43,8 @@ class Alert(Base):
     rejected_at: Mapped[DateTime | None] = mapped_column("rejectedAt", DateTime, nullable=True)
     annotated_at: Mapped[DateTime | None] = mapped_column("annotatedAt", DateTime, nullable=True)
     annotation: Mapped[str | None] = mapped_column("annotation", String, nullable=True)
-    created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.now())
+    # Live-state cursor column — see SessionEvent.created_at.
+    created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.clock_timestamp())
     updated_at: Mapped[DateTime] = mapped_column("updatedAt", DateTime, server_default=func.now(), onupdate=func.now())
 
     session: Mapped["Session"] = relationship("Session", back_populates="alerts")
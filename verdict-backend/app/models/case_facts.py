@@ -0,0 +1,24 @@
+from sqlalchemy import String, Integer, DateTime, ForeignKey, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class CaseFacts(Base):
+    """Merged extracted facts of every READY document in a case, one row per case.
+
+    Maintained incrementally by app/services/case_facts.py as documents finish
+    ingestion or are deleted, so the fact review page reads a single row.
+    """
+
+    __tablename__ = "CaseFacts"
+
+    case_id: Mapped[str] = mapped_column("caseId", String, ForeignKey("Case.id", ondelete="CASCADE"), primary_key=True)
+    firm_id: Mapped[str] = mapped_column("firmId", String)
+    # {"parties" | "keyDates" | "disputedFacts" | "priorStatements":
+    #   [{...extracted fields, "key", "sourceDocument", "sourceDocumentIds"}]}
+    facts: Mapped[dict] = mapped_column("facts", JSON)
+    # {documentId: {"filename", "confirmed"}} — the READY documents merged in
+    documents: Mapped[dict] = mapped_column("documents", JSON)
+    version: Mapped[int] = mapped_column("version", Integer, default=1)
+    updated_at: Mapped[DateTime] = mapped_column("updatedAt", DateTime, server_default=func.now(), onupdate=func.now())
@@ -35,8 +35,14 @@ class Document(Base):
     ingestion_error: Mapped[str | None] = mapped_column("ingestionError", String, nullable=True)
     nia_index_id: Mapped[str | None] = mapped_column("niaIndexId", String, nullable=True)
     extracted_facts: Mapped[dict | None] = mapped_column("extractedFacts", JSON, nullable=True)
+    # {"upserted", "failed", "failures": [{"id", "page", "error"}], "skippedReason",
+    #  "unchanged", "removed", "reusedText", "reusedFacts"}
+    indexing_report: Mapped[dict | None] = mapped_column("indexingReport", JSON, nullable=True)
     facts_confirmed_at: Mapped[DateTime | None] = mapped_column("factsConfirmedAt", DateTime, nullable=True)
     file_hash: Mapped[str | None] = mapped_column("fileHash", String, nullable=True)
+    # {recordId: contentHash, or "" if not in the vector index} of every record
+    # the document references; ids are "<caseId>_<contentHash[:32]>"
+    chunk_hashes: Mapped[dict | None] = mapped_column("chunkHashes", JSON, nullable=True)
     version: Mapped[int] = mapped_column("version", Integer, default=1)
     created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column("updatedAt", DateTime, server_default=func.now(), onupdate=func.now())
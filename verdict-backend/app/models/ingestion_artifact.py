@@ -0,0 +1,30 @@
+from sqlalchemy import String, Integer, DateTime, JSON, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from app.database import Base
+import uuid
+
+
+class IngestionArtifact(Base):
+    """Extraction output for one file, shared by every document in the firm with that content.
+
+    Keyed on (firmId, fileHash, mimeType): re-uploading an exhibit, retrying a
+    failed ingestion or adding the same file to another case reuses the
+    extracted pages and the Claude facts instead of recomputing them.  The
+    pages live in object storage as JSONL under textKey, read back line by
+    line; either field is null until a run produces it in full.
+    """
+
+    __tablename__ = "IngestionArtifact"
+    __table_args__ = (
+        UniqueConstraint("firmId", "fileHash", "mimeType", name="IngestionArtifact_firmId_fileHash_mimeType_key"),
+    )
+
+    id: Mapped[str] = mapped_column("id", String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    firm_id: Mapped[str] = mapped_column("firmId", String)
+    file_hash: Mapped[str] = mapped_column("fileHash", String)
+    mime_type: Mapped[str] = mapped_column("mimeType", String)
+    page_count: Mapped[int | None] = mapped_column("pageCount", Integer, nullable=True)
+    text_key: Mapped[str | None] = mapped_column("textKey", String, nullable=True)
+    extracted_facts: Mapped[dict | None] = mapped_column("extractedFacts", JSON, nullable=True)
+    created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.now())
@@ -53,3 +53,4 @@ class Session(Base):
     alerts: Mapped[list["Alert"]] = relationship("Alert", back_populates="session", cascade="all, delete")
     brief: Mapped["Brief | None"] = relationship("Brief", back_populates="session", uselist=False)
     annotations: Mapped[list["AttorneyAnnotation"]] = relationship("AttorneyAnnotation", back_populates="session", cascade="all, delete")
+    transcript_segments: Mapped[list["TranscriptSegment"]] = relationship("TranscriptSegment", back_populates="session", cascade="all, delete")
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Integer, DateTime, ForeignKey, JSON, Enum as PgEnum
+from sqlalchemy import Index, String, Integer, DateTime, ForeignKey, JSON, Enum as PgEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -17,6 +17,9 @@ _SPEAKER_ROLE_ENUM = PgEnum(
 
 class SessionEvent(Base):
     __tablename__ = "SessionEvent"
+    __table_args__ = (
+        Index("SessionEvent_sessionId_createdAt_idx", "sessionId", "createdAt"),
+    )
 
     id: Mapped[str] = mapped_column("id", String, primary_key=True, default=lambda: str(uuid.uuid4()))
     session_id: Mapped[str] = mapped_column("sessionId", String, ForeignKey("Session.id", ondelete="CASCADE"))
@@ -28,6 +31,8 @@ class SessionEvent(Base):
     audio_s3_key: Mapped[str | None] = mapped_column("audioS3Key", String, nullable=True)
     duration_ms: Mapped[int | None] = mapped_column("durationMs", Integer, nullable=True)
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
-    created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.now())
+    # clock_timestamp() rather than now(): createdAt backs the live-state
+    # cursor, so it must reflect insert time, not transaction start.
+    created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.clock_timestamp())
 
     session: Mapped["Session"] = relationship("Session", back_populates="events")
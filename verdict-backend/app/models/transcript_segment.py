@@ -0,0 +1,34 @@
+from sqlalchemy import String, Integer, DateTime, ForeignKey, UniqueConstraint, Enum as PgEnum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+from app.database import Base
+import uuid
+
+_SPEAKER_ROLE_ENUM = PgEnum(
+    'INTERROGATOR', 'WITNESS', 'SYSTEM',
+    name='SpeakerRole', create_type=False,
+)
+
+
+class TranscriptSegment(Base):
+    """One append-only line of a session transcript.
+
+    Replaces rewriting Session.transcriptRaw on every turn — each turn inserts
+    one fixed-size row and the full transcript is assembled lazily from
+    (sessionId, sequence) when a brief or report needs it.
+    """
+
+    __tablename__ = "TranscriptSegment"
+    __table_args__ = (
+        UniqueConstraint("sessionId", "sequence", name="TranscriptSegment_sessionId_sequence_key"),
+    )
+
+    id: Mapped[str] = mapped_column("id", String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    session_id: Mapped[str] = mapped_column("sessionId", String, ForeignKey("Session.id", ondelete="CASCADE"))
+    firm_id: Mapped[str] = mapped_column("firmId", String)
+    sequence: Mapped[int] = mapped_column("sequence", Integer)
+    speaker_role: Mapped[str | None] = mapped_column("speakerRole", _SPEAKER_ROLE_ENUM, nullable=True)
+    content: Mapped[str] = mapped_column("content", String)
+    created_at: Mapped[DateTime] = mapped_column("createdAt", DateTime, server_default=func.now())
+
+    session: Mapped["Session"] = relationship("Session", back_populates="transcript_segments")
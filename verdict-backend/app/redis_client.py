@@ -1,4 +1,9 @@
 import redis.asyncio as redis
 from app.config import settings
 
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+redis_client = redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT_S,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT_S,
+)
@@ -18,7 +18,8 @@ from app.models.session_event import SessionEvent
 from app.agents.orchestrator import generate_brief
 from app.services.report_generator import generate_rule_based_report
 from app.services.pdf_report import generate_pdf
-from app.services.s3 import upload_bytes
+from app.services.s3 import upload_bytes_async
+from app.services.transcript import materialize_transcript
 
 logger = logging.getLogger(__name__)
 
@@ -206,8 +207,9 @@ async def _generate_brief_background(session_id: str, brief_id: str):
                     }
                 )
 
-            if not transcript and session.transcript_raw:
-                for line in session.transcript_raw.strip().split("\n"):
+            transcript_raw = await materialize_transcript(db, session)
+            if not transcript and transcript_raw:
+                for line in transcript_raw.strip().split("\n"):
                     line = line.strip()
                     if not line:
                         continue
@@ -296,7 +298,7 @@ async def _generate_brief_background(session_id: str, brief_id: str):
                 )
                 pdf_buf = generate_pdf(report)
                 pdf_key = f"briefs/{session.firm_id}/{brief.id}.pdf"
-                upload_bytes(pdf_key, pdf_buf.read(), "application/pdf")
+                await upload_bytes_async(pdf_key, pdf_buf.read(), "application/pdf")
                 brief.pdf_s3_key = pdf_key
             except Exception as exc:
                 logger.error("PDF generation failed", exc_info=True)
@@ -304,7 +306,7 @@ async def _generate_brief_background(session_id: str, brief_id: str):
             if brief_data.get("coachAudioBytes"):
                 try:
                     audio_key = f"briefs/{session.firm_id}/{brief.id}_coach.mp3"
-                    upload_bytes(audio_key, brief_data["coachAudioBytes"], "audio/mpeg")
+                    await upload_bytes_async(audio_key, brief_data["coachAudioBytes"], "audio/mpeg")
                 except Exception:
                     pass
 
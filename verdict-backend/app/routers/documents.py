@@ -6,12 +6,13 @@ Implements P0.4 (Case File Ingestion Pipeline) from the PRD.
 
 import asyncio
 import hashlib
+import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.database import get_db, AsyncSessionLocal
 from app.middleware.auth import require_auth
@@ -19,7 +20,13 @@ from app.models.user import User
 from app.models.case import Case
 from app.models.document import Document
 from app.services.s3 import build_s3_key, generate_presigned_upload, generate_presigned_download
-from app.services.ingestion import run_ingestion
+from app.services.ingestion import deindex_document, run_ingestion
+from app.services.case_facts import load_case_facts, mark_confirmed, remove_document
+from app.services.fact_extraction import FACT_KEYS
+from app.services.job_queue import enqueue_ingestion
+from app.config import settings
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -125,7 +132,7 @@ async def confirm_upload(
             "message": "Document is already being processed.",
         })
 
-    background_tasks.add_task(_run_ingestion_background, document_id)
+    await _start_ingestion(doc, background_tasks)
 
     return {
         "success": True,
@@ -137,6 +144,18 @@ async def confirm_upload(
     }
 
 
+async def _start_ingestion(doc: Document, background_tasks: BackgroundTasks) -> None:
+    """Hand the document to the ingestion queue, or run it in-process when the
+    queue is off or Redis cannot be reached."""
+    if settings.INGEST_QUEUE_ENABLED:
+        try:
+            await enqueue_ingestion(doc.id, doc.firm_id)
+            return
+        except Exception as exc:
+            logger.warning("Ingestion queue unavailable, ingesting %s in-process: %s", doc.id, exc)
+    background_tasks.add_task(_run_ingestion_background, doc.id)
+
+
 async def _run_ingestion_background(document_id: str):
     """Run ingestion in a background task with its own DB session."""
     async with AsyncSessionLocal() as db:
@@ -168,7 +187,7 @@ async def retry_ingestion(
     doc.ingestion_error = None
     await db.commit()
 
-    background_tasks.add_task(_run_ingestion_background, document_id)
+    await _start_ingestion(doc, background_tasks)
 
     return {"success": True, "data": {"documentId": doc.id, "status": "PENDING"}}
 
@@ -244,6 +263,7 @@ async def get_document(
             "ingestionStatus": doc.ingestion_status,
             "ingestionError": doc.ingestion_error,
             "extractedFacts": doc.extracted_facts,
+            "indexingReport": doc.indexing_report,
             "factsConfirmedAt": doc.facts_confirmed_at.isoformat() if doc.facts_confirmed_at else None,
             "downloadUrl": download_url,
             "createdAt": doc.created_at.isoformat() if doc.created_at else None,
@@ -261,47 +281,15 @@ async def get_case_facts(
 ):
     """Get aggregated extracted facts across all READY documents for a case."""
     await _get_case(case_id, user, db)
-
-    result = await db.execute(
-        select(Document).where(
-            Document.case_id == case_id,
-            Document.firm_id == user.firm_id,
-            Document.ingestion_status == "READY",
-        )
-    )
-    docs = result.scalars().all()
-
-    parties = []
-    key_dates = []
-    disputed_facts = []
-    prior_statements = []
-
-    for doc in docs:
-        facts = doc.extracted_facts or {}
-        for p in facts.get("parties", []):
-            p["sourceDocument"] = doc.filename
-            parties.append(p)
-        for d in facts.get("keyDates", []):
-            d["sourceDocument"] = doc.filename
-            key_dates.append(d)
-        for f in facts.get("disputedFacts", []):
-            f["sourceDocument"] = doc.filename
-            disputed_facts.append(f)
-        for s in facts.get("priorStatements", []):
-            s["sourceDocument"] = doc.filename
-            prior_statements.append(s)
-
-    all_confirmed = all(d.facts_confirmed_at is not None for d in docs) if docs else False
+    aggregate = await load_case_facts(db, case_id, user.firm_id)
+    documents = aggregate.documents
 
     return {
         "success": True,
         "data": {
-            "parties": parties,
-            "keyDates": key_dates,
-            "disputedFacts": disputed_facts,
-            "priorStatements": prior_statements,
-            "documentCount": len(docs),
-            "allConfirmed": all_confirmed,
+            **{section: aggregate.facts.get(section, []) for section in FACT_KEYS},
+            "documentCount": len(documents),
+            "allConfirmed": bool(documents) and all(d["confirmed"] for d in documents.values()),
         },
     }
 
@@ -314,34 +302,27 @@ async def confirm_facts(
 ):
     """Mark all extracted facts for a case as confirmed by the attorney."""
     case = await _get_case(case_id, user, db)
+    aggregate = await mark_confirmed(db, case_id, user.firm_id)
 
-    result = await db.execute(
-        select(Document).where(
-            Document.case_id == case_id,
-            Document.firm_id == user.firm_id,
-            Document.ingestion_status == "READY",
-        )
-    )
-    docs = result.scalars().all()
-
-    if not docs:
+    if not aggregate.documents:
         raise HTTPException(400, detail={
             "code": "NO_READY_DOCUMENTS",
             "message": "No documents are ready for fact confirmation.",
         })
 
     now = datetime.utcnow()
-    for doc in docs:
-        doc.facts_confirmed_at = now
-
-    all_facts = []
-    all_prior = []
-    for doc in docs:
-        facts = doc.extracted_facts or {}
-        all_facts.extend(facts.get("disputedFacts", []))
-        all_prior.extend(
-            s.get("content", "") for s in facts.get("priorStatements", [])
+    await db.execute(
+        update(Document)
+        .where(
+            Document.case_id == case_id,
+            Document.firm_id == user.firm_id,
+            Document.ingestion_status == "READY",
         )
+        .values(facts_confirmed_at=now)
+    )
+
+    all_facts = aggregate.facts.get("disputedFacts", [])
+    all_prior = [s.get("content", "") for s in aggregate.facts.get("priorStatements", [])]
 
     case.extracted_facts = "\n".join(
         f.get("fact", "") for f in all_facts
@@ -354,7 +335,7 @@ async def confirm_facts(
     return {
         "success": True,
         "data": {
-            "confirmedDocuments": len(docs),
+            "confirmedDocuments": len(aggregate.documents),
             "confirmedAt": now.isoformat(),
         },
     }
@@ -367,17 +348,19 @@ async def delete_document(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_auth),
 ):
-    """Delete a document and its S3 file."""
+    """Delete a document, its S3 file and its indexed records."""
     await _get_case(case_id, user, db)
     doc = await _get_document(document_id, case_id, user.firm_id, db)
 
-    from app.services.s3 import delete_object
+    from app.services.s3 import delete_object_async
     if doc.s3_key:
         try:
-            delete_object(doc.s3_key)
+            await delete_object_async(doc.s3_key)
         except Exception:
             pass
 
+    await deindex_document(db, doc)
+    await remove_document(db, doc)
     await db.delete(doc)
     await db.commit()
 
@@ -1,14 +1,23 @@
+import re
 import json
 import time
 import base64
+import asyncio
+import hashlib
+import logging
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from typing import Awaitable, Callable
+from fastapi import (
+    APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, Query, Request, Response,
+    WebSocket, WebSocketDisconnect, WebSocketException, status,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
-from app.database import get_db
-from app.middleware.auth import require_auth
+from app.database import get_db, AsyncSessionLocal
+from app.middleware.auth import require_auth, authenticate_websocket
 from app.models.user import User
 from app.models.session import Session
 from app.models.witness import Witness
@@ -16,17 +25,53 @@ from app.models.case import Case
 from app.models.session_event import SessionEvent
 from app.models.alert import Alert
 from app.models.brief import Brief
-from app.agents.interrogator import generate_question
+from app.agents.interrogator import generate_question, prefetch_prior_context
 from app.agents.objection import analyze_for_objections
 from app.agents.detector import detect_inconsistency
 from app.agents.models import VerdictCase
-from app.services.elevenlabs import text_to_speech, speech_to_text
-from app.services.s3 import upload_bytes
-from app.schemas.sessions import CreateSessionRequest, QuestionRequest, ObjectionRequest, InconsistencyRequest
+from app.services.elevenlabs import text_to_speech, text_to_speech_stream, speech_to_text
+from app.services.upload_queue import enqueue_upload
+from app.services.transcript import append_transcript_segment, materialize_transcript
+from app.services.live_channel import publish_live_event, subscribe_live_events
+from app.services import speculation
+from app.services.streaming_stt import AnswerTranscriber, pcm_to_wav
+from app.schemas.sessions import (
+    CreateSessionRequest, QuestionRequest, ObjectionRequest, InconsistencyRequest, TurnAnalysisRequest,
+    PartialAnswerRequest,
+)
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Sentence ends always start a new TTS segment; commas only once the clause
+# is long enough to be worth its own synthesis request.
+_SPEAKABLE_BOUNDARY = re.compile(r"[.?!;:,](?=\s)")
+_MIN_SENTENCE_CHARS = 12
+_MIN_CLAUSE_CHARS = 40
+
+
+def _sse(payload: dict) -> str:
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def _split_speakable(buffer: str) -> tuple[list[str], str]:
+    """Cut completed sentences/clauses off the front of a streaming text buffer.
+
+    Returns the speakable segments and the unfinished remainder.
+    """
+    segments: list[str] = []
+    start = 0
+    for match in _SPEAKABLE_BOUNDARY.finditer(buffer):
+        piece = buffer[start:match.end()].strip()
+        min_chars = _MIN_CLAUSE_CHARS if match.group() == "," else _MIN_SENTENCE_CHARS
+        if len(piece) < min_chars:
+            continue
+        segments.append(piece)
+        start = match.end()
+    return segments, buffer[start:]
+
 
 def _build_verdict_case(session: Session) -> VerdictCase:
     """Assemble a VerdictCase from the ORM objects attached to a Session.
@@ -54,14 +99,6 @@ def _build_verdict_case(session: Session) -> VerdictCase:
     )
 
 
-def _append_transcript_line(session: Session, speaker: str, content: str) -> None:
-    line = f"[{speaker}]: {content}".strip()
-    if session.transcript_raw:
-        session.transcript_raw = f"{session.transcript_raw.rstrip()}\n{line}"
-    else:
-        session.transcript_raw = line
-
-
 def _event_to_live_entry(event: SessionEvent, idx: int, started_at: datetime | None) -> dict:
     ts = 0
     if started_at and event.created_at:
@@ -112,6 +149,55 @@ def _alert_to_live_alert(alert: Alert) -> dict:
     }
 
 
+async def _speculate_next_question(session: Session, answered_question: int, answer_so_far: str) -> bool:
+    """Pre-generate the question that will follow this answer.  Needs case/witness loaded."""
+    verdict_case = _build_verdict_case(session)
+    context = await speculation.next_turn_context(session.id)
+    return speculation.speculate(
+        session.id,
+        answered_question + 1,
+        answer_so_far,
+        context,
+        lambda: generate_question(
+            case=verdict_case,
+            current_topic=context.topic,
+            question_number=answered_question + 1,
+            prior_answer=answer_so_far,
+            hesitation_detected=context.hesitation,
+            recent_inconsistency_flag=context.inconsistency,
+            prior_weak_areas=session.prior_weak_areas or [],
+        ),
+    )
+
+
+def _archive_answer_audio(event_id: str, audio_key: str, data: bytes, content_type: str) -> None:
+    """Upload answer audio in the background; the event's key is cleared if it never lands."""
+    async def clear_key(_key: str) -> None:
+        async with AsyncSessionLocal() as db:
+            event = await db.get(SessionEvent, event_id)
+            if event and event.audio_s3_key == audio_key:
+                event.audio_s3_key = None
+                await db.commit()
+
+    if not enqueue_upload(audio_key, data, content_type, on_failure=clear_key):
+        logger.warning("Answer audio for event %s not archived", event_id)
+
+
+async def _publish_transcript_event(session: Session, event: SessionEvent) -> None:
+    await publish_live_event(session.id, "TRANSCRIPT_ENTRY", {
+        "entry": _event_to_live_entry(event, 0, session.started_at),
+        "questionCount": session.question_count or 0,
+        "cursor": event.created_at.isoformat() if event.created_at else None,
+    })
+
+
+async def _publish_status(session: Session) -> None:
+    await publish_live_event(session.id, "STATUS", {
+        "status": (session.status or "LOBBY").lower(),
+        "startedAt": session.started_at.isoformat() if session.started_at else None,
+    })
+
+
 @router.get("/{session_id}")
 async def get_session(
     session_id: str,
@@ -160,6 +246,7 @@ async def start_session(
     session.status = "ACTIVE"
     session.started_at = datetime.utcnow()
     await db.commit()
+    await _publish_status(session)
     return {
         "success": True,
         "data": {
@@ -269,7 +356,10 @@ async def end_session(
 
     session.status = "COMPLETE"
     session.ended_at = datetime.utcnow()
+    speculation.discard_session(session.id)
+    await materialize_transcript(db, session)
     await db.commit()
+    await _publish_status(session)
 
     # Auto-trigger brief generation if not already started
     existing_brief = await db.execute(select(Brief).where(Brief.session_id == session_id))
@@ -322,6 +412,7 @@ async def pause_session(
     session.status = "PAUSED"
     session.paused_at = datetime.utcnow()
     await db.commit()
+    await _publish_status(session)
 
     return {"success": True, "data": {"sessionId": session_id, "status": "PAUSED"}}
 
@@ -350,6 +441,7 @@ async def resume_session(
     session.status = "ACTIVE"
     session.paused_at = None
     await db.commit()
+    await _publish_status(session)
 
     return {"success": True, "data": {"sessionId": session_id, "status": "ACTIVE"}}
 
@@ -375,28 +467,35 @@ async def stream_question(
 
     verdict_case = _build_verdict_case(session)
 
-    async def event_stream():
-        full_text = ""
-        yield f"data: {json.dumps({'type': 'QUESTION_START', 'questionNumber': body.questionNumber})}\n\n"
-
-        try:
-            async for chunk in generate_question(
-                case=verdict_case,
-                current_topic=body.currentTopic,
-                question_number=body.questionNumber,
-                prior_answer=body.priorAnswer,
-                hesitation_detected=body.hesitationDetected,
-                recent_inconsistency_flag=body.recentInconsistencyFlag,
-                prior_weak_areas=session.prior_weak_areas or [],
-            ):
-                full_text += chunk
-                yield f"data: {json.dumps({'type': 'QUESTION_CHUNK', 'text': chunk})}\n\n"
-        except Exception as exc:
-            import logging, traceback
-            logging.getLogger(__name__).error("Interrogator agent failed: %s\n%s", exc, traceback.format_exc())
-            full_text = full_text or f"[Agent error — {type(exc).__name__}: {str(exc)[:100]}]"
-            yield f"data: {json.dumps({'type': 'QUESTION_CHUNK', 'text': full_text})}\n\n"
+    context = speculation.TurnContext(
+        topic=body.currentTopic,
+        hesitation=body.hesitationDetected,
+        inconsistency=body.recentInconsistencyFlag,
+    )
+    speculated = None
+    if body.priorAnswer and settings.SPECULATION_ENABLED:
+        speculated = await speculation.claim(session.id, body.questionNumber, body.priorAnswer, context)
+    await speculation.remember_context(session.id, context)
+
+    async def replay(text: str):
+        # Keep the streaming shape clients expect from a live generation.
+        for word in re.findall(r"\S+\s*", text):
+            yield word
+
+    def question_chunks():
+        if speculated:
+            return replay(speculated)
+        return generate_question(
+            case=verdict_case,
+            current_topic=body.currentTopic,
+            question_number=body.questionNumber,
+            prior_answer=body.priorAnswer,
+            hesitation_detected=body.hesitationDetected,
+            recent_inconsistency_flag=body.recentInconsistencyFlag,
+            prior_weak_areas=session.prior_weak_areas or [],
+        )
 
+    async def persist_question(full_text: str) -> None:
         event = SessionEvent(
             session_id=session.id,
             firm_id=session.firm_id,
@@ -408,18 +507,107 @@ async def stream_question(
         )
         db.add(event)
         session.question_count = max(session.question_count or 0, body.questionNumber)
-        _append_transcript_line(session, "INTERROGATOR", full_text)
+        await append_transcript_segment(db, session, "INTERROGATOR", full_text)
         await db.commit()
+        await _publish_transcript_event(session, event)
+
+    async def event_stream():
+        full_text = ""
+        yield _sse({"type": "QUESTION_START", "questionNumber": body.questionNumber, "speculative": bool(speculated)})
+
+        try:
+            async for chunk in question_chunks():
+                full_text += chunk
+                yield _sse({"type": "QUESTION_CHUNK", "text": chunk})
+        except Exception as exc:
+            logger.error("Interrogator agent failed: %s", exc, exc_info=True)
+            full_text = full_text or f"[Agent error — {type(exc).__name__}: {str(exc)[:100]}]"
+            yield _sse({"type": "QUESTION_CHUNK", "text": full_text})
+
+        await persist_question(full_text)
 
         try:
             audio = await text_to_speech(full_text, settings.ELEVENLABS_INTERROGATOR_VOICE_ID)
-            yield f"data: {json.dumps({'type': 'QUESTION_AUDIO', 'audioBase64': base64.b64encode(audio).decode()})}\n\n"
+            yield _sse({"type": "QUESTION_AUDIO", "audioBase64": base64.b64encode(audio).decode()})
         except Exception:
             pass  # TTS failure is non-fatal; frontend falls back to text
 
-        yield f"data: {json.dumps({'type': 'QUESTION_END', 'fullText': full_text})}\n\n"
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+        yield _sse({"type": "QUESTION_END", "fullText": full_text})
+
+    async def pipelined_event_stream():
+        """Synthesize audio per sentence/clause while the question is still streaming.
+
+        The LLM producer feeds completed segments to a single TTS worker (so
+        audio stays in speaking order) and both write SSE lines into one
+        outbound queue.  The DB write runs concurrently with the tail of TTS
+        instead of in front of it.
+        """
+        outbound: asyncio.Queue[str | None] = asyncio.Queue()
+        segments: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def synthesize() -> None:
+            spoken = ""
+            segment_index = 0
+            while (segment := await segments.get()) is not None:
+                try:
+                    async for audio in text_to_speech_stream(
+                        segment,
+                        settings.ELEVENLABS_INTERROGATOR_VOICE_ID,
+                        previous_text=spoken or None,
+                    ):
+                        await outbound.put(_sse({
+                            "type": "QUESTION_AUDIO_CHUNK",
+                            "segment": segment_index,
+                            "audioBase64": base64.b64encode(audio).decode(),
+                        }))
+                except Exception as exc:
+                    logger.warning("Pipelined TTS failed for segment %d: %s", segment_index, exc)
+                spoken = f"{spoken} {segment}".strip()
+                segment_index += 1
+
+        async def produce(tts: asyncio.Task) -> None:
+            full_text = ""
+            pending = ""
+            try:
+                async for chunk in question_chunks():
+                    full_text += chunk
+                    pending += chunk
+                    await outbound.put(_sse({"type": "QUESTION_CHUNK", "text": chunk}))
+                    ready, pending = _split_speakable(pending)
+                    for segment in ready:
+                        segments.put_nowait(segment)
+                if pending.strip():
+                    segments.put_nowait(pending.strip())
+            except Exception as exc:
+                logger.error("Interrogator agent failed: %s", exc, exc_info=True)
+                full_text = full_text or f"[Agent error — {type(exc).__name__}: {str(exc)[:100]}]"
+                await outbound.put(_sse({"type": "QUESTION_CHUNK", "text": full_text}))
+            segments.put_nowait(None)
+
+            persist = asyncio.create_task(persist_question(full_text))
+            await tts
+            await persist
+            await outbound.put(_sse({"type": "QUESTION_END", "fullText": full_text}))
+            await outbound.put(None)
+
+        tts = asyncio.create_task(synthesize())
+        producer = asyncio.create_task(produce(tts))
+        try:
+            yield _sse({
+                "type": "QUESTION_START",
+                "questionNumber": body.questionNumber,
+                "pipelined": True,
+                "speculative": bool(speculated),
+            })
+            while (line := await outbound.get()) is not None:
+                yield line
+        finally:
+            for task in (producer, tts):
+                if not task.done():
+                    task.cancel()
+
+    stream = pipelined_event_stream() if body.pipelineAudio else event_stream()
+    return StreamingResponse(stream, media_type="text/event-stream")
 
 
 @router.post("/{session_id}/answers/audio")
@@ -432,7 +620,9 @@ async def upload_answer_audio(
     user: User = Depends(require_auth),
 ):
     result = await db.execute(
-        select(Session).where(Session.id == session_id, Session.firm_id == user.firm_id)
+        select(Session)
+        .where(Session.id == session_id, Session.firm_id == user.firm_id)
+        .options(selectinload(Session.case), selectinload(Session.witness))
     )
     session = result.scalar_one_or_none()
     if not session:
@@ -445,16 +635,11 @@ async def upload_answer_audio(
     if not audio_bytes:
         raise HTTPException(400, detail={"code": "EMPTY_AUDIO"})
 
-    audio_key = None
-    try:
-        ext = (file.filename or "chunk.webm").split(".")[-1]
-        audio_key = (
-            f"sessions/{session.firm_id}/{session_id}/answers/"
-            f"{int(time.time() * 1000)}_q{questionNumber or 0}.{ext}"
-        )
-        upload_bytes(audio_key, audio_bytes, file.content_type or "application/octet-stream")
-    except Exception:
-        audio_key = None
+    ext = (file.filename or "chunk.webm").split(".")[-1]
+    audio_key = (
+        f"sessions/{session.firm_id}/{session_id}/answers/"
+        f"{int(time.time() * 1000)}_q{questionNumber or 0}.{ext}"
+    )
 
     try:
         transcript_text = (await speech_to_text(audio_bytes)).strip()
@@ -462,6 +647,10 @@ async def upload_answer_audio(
         transcript_text = ""
     if not transcript_text:
         transcript_text = "(inaudible)"
+    else:
+        # The final answer is known now — start on the next question while
+        # the event is persisted and the client posts /agents/question.
+        await _speculate_next_question(session, questionNumber, transcript_text)
 
     event = SessionEvent(
         session_id=session.id,
@@ -475,9 +664,11 @@ async def upload_answer_audio(
         metadata_={"filename": file.filename, "contentType": file.content_type},
     )
     db.add(event)
-    _append_transcript_line(session, "WITNESS", transcript_text)
+    await append_transcript_segment(db, session, "WITNESS", transcript_text)
     await db.commit()
     await db.refresh(event)
+    await _publish_transcript_event(session, event)
+    _archive_answer_audio(event.id, audio_key, audio_bytes, file.content_type or "application/octet-stream")
 
     return {
         "success": True,
@@ -492,41 +683,227 @@ async def upload_answer_audio(
     }
 
 
-@router.get("/{session_id}/live-state")
-async def get_live_state(
+@router.websocket("/{session_id}/answers/stream")
+async def stream_answer_audio(websocket: WebSocket, session_id: str, questionNumber: int = 0):
+    """Stream a witness answer as raw PCM and transcribe it while it is spoken.
+
+    Client → server: binary frames of 16-bit LE mono PCM at
+    STT_STREAM_SAMPLE_RATE, optionally {"type": "end"} to stop early.
+    Server → client: PARTIAL_TRANSCRIPT as each utterance segment is
+    transcribed, then ANSWER_FINAL once end of speech is detected and the
+    SessionEvent is written.  Partials are also published to the live feed
+    and used for speculative next-question generation.
+    """
+    async with AsyncSessionLocal() as db:
+        user = await authenticate_websocket(websocket, db)
+        result = await db.execute(
+            select(Session)
+            .where(Session.id == session_id, Session.firm_id == user.firm_id)
+            .options(selectinload(Session.case), selectinload(Session.witness))
+        )
+        session = result.scalar_one_or_none()
+    if not session:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="NOT_FOUND")
+    if session.status not in ("ACTIVE", "PAUSED"):
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="INVALID_STATUS")
+
+    await websocket.accept()
+
+    async def on_partial(text: str) -> None:
+        payload = {"questionNumber": questionNumber, "text": text}
+        await websocket.send_json({"type": "PARTIAL_TRANSCRIPT", **payload})
+        await publish_live_event(session_id, "PARTIAL_TRANSCRIPT", payload)
+        await _speculate_next_question(session, questionNumber, text)
+
+    transcriber = AnswerTranscriber(on_partial=on_partial)
+    idle_timeout = settings.STT_END_OF_SPEECH_MS / 1000
+    try:
+        while not transcriber.ended:
+            try:
+                message = await asyncio.wait_for(websocket.receive(), timeout=idle_timeout)
+            except asyncio.TimeoutError:
+                break  # client stopped sending frames — treat as end of speech
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes"):
+                transcriber.feed(message["bytes"])
+            elif message.get("text") and json.loads(message["text"]).get("type") == "end":
+                break
+
+        transcript_text = await transcriber.finish() or "(inaudible)"
+        finalize_ms = int((time.monotonic() - transcriber.end_of_speech_at) * 1000)
+    except WebSocketDisconnect:
+        transcriber.cancel()
+        return
+
+    audio_key = (
+        f"sessions/{session.firm_id}/{session_id}/answers/"
+        f"{int(time.time() * 1000)}_q{questionNumber or 0}.wav"
+    )
+    duration_ms = len(transcriber.audio) * 1000 // (settings.STT_STREAM_SAMPLE_RATE * 2)
+    async with AsyncSessionLocal() as db:
+        db.add(session)
+        event = SessionEvent(
+            session_id=session.id,
+            firm_id=session.firm_id,
+            event_type="ANSWER",
+            speaker_role="WITNESS",
+            content=transcript_text,
+            question_number=questionNumber or None,
+            audio_s3_key=audio_key,
+            duration_ms=duration_ms,
+            metadata_={"contentType": "audio/wav", "streamed": True, "finalizeMs": finalize_ms},
+        )
+        db.add(event)
+        await append_transcript_segment(db, session, "WITNESS", transcript_text)
+        await db.commit()
+        await db.refresh(event)
+        await _publish_transcript_event(session, event)
+
+        await websocket.send_json({
+            "type": "ANSWER_FINAL",
+            "eventId": event.id,
+            "questionNumber": questionNumber,
+            "transcriptText": transcript_text,
+            "audioS3Key": audio_key,
+            "durationMs": duration_ms,
+            "finalizeMs": finalize_ms,
+        })
+        await websocket.close()
+
+    wav = pcm_to_wav(bytes(transcriber.audio), settings.STT_STREAM_SAMPLE_RATE)
+    _archive_answer_audio(event.id, audio_key, wav, "audio/wav")
+
+
+@router.post("/{session_id}/answers/partial")
+async def post_partial_answer(
     session_id: str,
+    body: PartialAnswerRequest,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_auth),
 ):
+    """Feed the witness's answer-so-far to speculative next-question generation."""
     result = await db.execute(
         select(Session)
         .where(Session.id == session_id, Session.firm_id == user.firm_id)
-        .options(
-            selectinload(Session.events),
-            selectinload(Session.alerts),
-        )
+        .options(selectinload(Session.case), selectinload(Session.witness))
     )
     session = result.scalar_one_or_none()
     if not session:
         raise HTTPException(404, detail={"code": "NOT_FOUND"})
+    if session.status != "ACTIVE":
+        raise HTTPException(400, detail={"code": "INVALID_STATUS"})
+
+    started = await _speculate_next_question(session, body.questionNumber, body.partialText.strip())
+    return {"success": True, "data": {"speculating": started}}
+
+
+@router.get("/{session_id}/speculation")
+async def get_speculation_stats(
+    session_id: str,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_auth),
+):
+    result = await db.execute(
+        select(Session.id).where(Session.id == session_id, Session.firm_id == user.firm_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(404, detail={"code": "NOT_FOUND"})
+    return {"success": True, "data": await speculation.speculation_stats(session_id)}
+
+
+def _parse_live_cursor(since: str | None) -> datetime | None:
+    if not since:
+        return None
+    try:
+        return datetime.fromisoformat(since)
+    except ValueError:
+        raise HTTPException(400, detail={"code": "INVALID_CURSOR"})
+
+
+def _live_state_etag(session: Session, cursor: str | None) -> str:
+    """Weak ETag over everything the live feed depends on except the clock.
+
+    elapsedSeconds is derived from startedAt, which the response also returns,
+    so clients keep their own timer running across 304s.
+    """
+    fingerprint = "|".join(str(v) for v in (
+        session.status,
+        session.question_count,
+        session.witness_joined,
+        session.paused_at,
+        session.ended_at,
+        cursor,
+    ))
+    return f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()[:16]}"'
+
+
+@router.get("/{session_id}/live-state")
+async def get_live_state(
+    session_id: str,
+    request: Request,
+    since: str | None = Query(None, description="Cursor from a previous live-state response"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_auth),
+):
+    """Live session feed.
+
+    Without `since` the full transcript and alert list is returned.  With
+    `since=<cursor>` only events and alerts created after the cursor are
+    returned.  Both modes answer 304 when the client's If-None-Match still
+    matches, so an idle poll costs two index lookups.
+    """
+    since_at = _parse_live_cursor(since)
+
+    result = await db.execute(
+        select(Session).where(Session.id == session_id, Session.firm_id == user.firm_id)
+    )
+    session = result.scalar_one_or_none()
+    if not session:
+        raise HTTPException(404, detail={"code": "NOT_FOUND"})
+
+    # Both maxima are served by the (sessionId, createdAt) indexes.
+    latest_event_at = await db.scalar(
+        select(func.max(SessionEvent.created_at)).where(SessionEvent.session_id == session_id)
+    )
+    latest_alert_at = await db.scalar(
+        select(func.max(Alert.created_at)).where(Alert.session_id == session_id)
+    )
+    latest = max((t for t in (latest_event_at, latest_alert_at) if t is not None), default=None)
+    cursor = latest.isoformat() if latest else since
+
+    etag = _live_state_etag(session, cursor)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    event_query = select(SessionEvent).where(SessionEvent.session_id == session_id)
+    alert_query = select(Alert).where(Alert.session_id == session_id)
+    if since_at:
+        event_query = event_query.where(SessionEvent.created_at > since_at)
+        alert_query = alert_query.where(Alert.created_at > since_at)
+    events = (await db.execute(event_query.order_by(SessionEvent.created_at))).scalars().all()
+    alerts = (await db.execute(alert_query.order_by(Alert.created_at))).scalars().all()
 
-    events = sorted(session.events or [], key=lambda e: e.created_at or datetime.utcnow())
-    alerts = sorted(session.alerts or [], key=lambda a: a.created_at or datetime.utcnow())
     last_topic = "PRIOR_STATEMENTS"
-    for e in reversed(events):
-        if e.event_type == "QUESTION" and e.metadata_ and e.metadata_.get("topic"):
-            last_topic = e.metadata_.get("topic")
-            break
+    last_question = await db.scalar(
+        select(SessionEvent.metadata_)
+        .where(SessionEvent.session_id == session_id, SessionEvent.event_type == "QUESTION")
+        .order_by(SessionEvent.created_at.desc())
+        .limit(1)
+    )
+    if last_question and last_question.get("topic"):
+        last_topic = last_question.get("topic")
 
     elapsed = 0
     if session.started_at:
         end = session.ended_at or datetime.utcnow()
         elapsed = max(0, int((end - session.started_at).total_seconds()))
 
-    return {
+    payload = {
         "success": True,
         "data": {
             "status": (session.status or "LOBBY").lower(),
+            "startedAt": session.started_at.isoformat() if session.started_at else None,
             "elapsedSeconds": elapsed,
             "totalSeconds": int((session.duration_minutes or 0) * 60),
             "currentTopic": last_topic,
@@ -537,6 +914,8 @@ async def get_live_state(
                 if event.content
             ],
             "alerts": [_alert_to_live_alert(alert) for alert in alerts],
+            "cursor": cursor,
+            "isDelta": since_at is not None,
             "witnessConnected": bool(session.witness_joined),
             "serviceStatus": {
                 "elevenlabs": bool(settings.ELEVENLABS_API_KEY),
@@ -545,6 +924,85 @@ async def get_live_state(
             },
         },
     }
+    return JSONResponse(jsonable_encoder(payload), headers={"ETag": etag})
+
+
+@router.get("/{session_id}/live-stream")
+async def stream_live_state(
+    session_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_auth),
+):
+    """Server-sent live feed for a session.
+
+    Pushes TRANSCRIPT_ENTRY, ALERT and STATUS events as they are published by
+    any worker.  Clients load the initial snapshot from GET /live-state and
+    then apply these events on top of it instead of polling.
+    """
+    result = await db.execute(
+        select(Session.id).where(Session.id == session_id, Session.firm_id == user.firm_id)
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(404, detail={"code": "NOT_FOUND"})
+    # Release the pooled connection — this response can stay open for hours.
+    await db.close()
+
+    async def event_stream():
+        yield f"data: {json.dumps({'type': 'LIVE_READY', 'sessionId': session_id})}\n\n"
+        async for message in subscribe_live_events(session_id):
+            if await request.is_disconnected():
+                break
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"data: {json.dumps(message)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+_OBJECTION_FALLBACK = {"isObjectionable": False, "category": None, "freRule": None, "explanation": None, "confidence": 0.0}
+_INCONSISTENCY_FALLBACK = {"flagFound": False, "contradictionConfidence": 0.0, "priorQuote": None, "impeachmentRisk": "LOW"}
+
+
+def _objection_alert(session_id: str, firm_id: str, question_number: int, question_text: str, analysis: dict) -> Alert:
+    return Alert(
+        session_id=session_id,
+        firm_id=firm_id,
+        alert_type="OBJECTION",
+        status="PENDING",
+        confidence=analysis.get("confidence"),
+        current_quote=question_text,
+        fre_rule=analysis.get("freRule"),
+        fre_classification=analysis.get("category"),
+        question_number=question_number,
+    )
+
+
+def _inconsistency_alert(session_id: str, firm_id: str, question_number: int, answer_text: str, detection: dict) -> Alert:
+    return Alert(
+        session_id=session_id,
+        firm_id=firm_id,
+        alert_type="INCONSISTENCY",
+        status="PENDING",
+        confidence=detection.get("contradictionConfidence"),
+        prior_quote=detection.get("priorQuote"),
+        prior_source_page=detection.get("priorDocumentPage"),
+        prior_source_line=detection.get("priorDocumentLine"),
+        current_quote=answer_text,
+        impeachment_risk=detection.get("impeachmentRisk", "LOW"),
+        question_number=question_number,
+    )
+
+
+async def _save_alert(db: AsyncSession, alert: Alert) -> None:
+    db.add(alert)
+    await db.commit()
+    await publish_live_event(alert.session_id, "ALERT", {"alert": _alert_to_live_alert(alert)})
 
 
 @router.post("/{session_id}/agents/objection")
@@ -567,24 +1025,13 @@ async def check_objection(
             session_id=session_id,
         )
     except Exception as exc:
-        import logging
-        logging.getLogger(__name__).error("Objection agent failed: %s", exc)
+        logger.error("Objection agent failed: %s", exc)
         # Graceful fallback — return non-objectionable result
-        analysis = {"isObjectionable": False, "category": None, "freRule": None, "explanation": None, "confidence": 0.0}
+        analysis = dict(_OBJECTION_FALLBACK)
     if analysis.get("isObjectionable"):
-        alert = Alert(
-            session_id=session_id,
-            firm_id=user.firm_id,
-            alert_type="OBJECTION",
-            status="PENDING",
-            confidence=analysis.get("confidence"),
-            current_quote=body.questionText,
-            fre_rule=analysis.get("freRule"),
-            fre_classification=analysis.get("category"),
-            question_number=body.questionNumber,
-        )
-        db.add(alert)
-        await db.commit()
+        await _save_alert(db, _objection_alert(
+            session_id, user.firm_id, body.questionNumber, body.questionText, analysis,
+        ))
     return {
         "success": True,
         "data": {**analysis, "processingMs": int((time.time() - start) * 1000)},
@@ -616,23 +1063,111 @@ async def check_inconsistency(
             case_type=session.case.case_type if session.case else "OTHER",
         )
     except Exception as exc:
-        import logging
-        logging.getLogger(__name__).error("Inconsistency agent failed: %s", exc)
-        detection = {"flagFound": False, "contradictionConfidence": 0.0, "priorQuote": None, "impeachmentRisk": "LOW"}
+        logger.error("Inconsistency agent failed: %s", exc)
+        detection = dict(_INCONSISTENCY_FALLBACK)
     if detection.get("flagFound"):
-        alert = Alert(
-            session_id=session_id,
-            firm_id=user.firm_id,
-            alert_type="INCONSISTENCY",
-            status="PENDING",
-            confidence=detection.get("contradictionConfidence"),
-            prior_quote=detection.get("priorQuote"),
-            prior_source_page=detection.get("priorDocumentPage"),
-            prior_source_line=detection.get("priorDocumentLine"),
-            current_quote=body.answerText,
-            impeachment_risk=detection.get("impeachmentRisk", "LOW"),
-            question_number=body.questionNumber,
-        )
-        db.add(alert)
-        await db.commit()
+        await _save_alert(db, _inconsistency_alert(
+            session_id, user.firm_id, body.questionNumber, body.answerText, detection,
+        ))
     return {"success": True, "data": detection}
+
+
+@router.post("/{session_id}/turns/analyze")
+async def analyze_turn(
+    session_id: str,
+    body: TurnAnalysisRequest,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_auth),
+):
+    """Run every per-answer agent for one turn concurrently and stream results.
+
+    Replaces separate /agents/objection and /agents/inconsistency round trips:
+    the objection copilot, inconsistency detector and the interrogator's
+    prior-statement prefetch run under asyncio with their own deadlines, and
+    each AGENT_RESULT event is sent as soon as that agent finishes, so the
+    slowest agent no longer delays the others.
+    """
+    result = await db.execute(
+        select(Session)
+        .where(Session.id == session_id, Session.firm_id == user.firm_id)
+        .options(selectinload(Session.case))
+    )
+    session = result.scalar_one_or_none()
+    if not session:
+        raise HTTPException(404, detail={"code": "NOT_FOUND"})
+
+    case_type = session.case.case_type if session.case else "OTHER"
+
+    agents: dict[str, tuple[Callable[[], Awaitable[dict | list]], float, dict | list]] = {
+        "objection": (
+            lambda: analyze_for_objections(question_text=body.questionText, session_id=session_id),
+            settings.TURN_OBJECTION_DEADLINE_MS,
+            _OBJECTION_FALLBACK,
+        ),
+    }
+    if body.answerText:
+        agents["inconsistency"] = (
+            lambda: detect_inconsistency(
+                question_text=body.questionText,
+                answer_text=body.answerText,
+                session_id=session_id,
+                case_id=session.case_id,
+                case_type=case_type,
+            ),
+            settings.TURN_INCONSISTENCY_DEADLINE_MS,
+            _INCONSISTENCY_FALLBACK,
+        )
+        agents["priorStatements"] = (
+            lambda: prefetch_prior_context(session.case_id, body.answerText),
+            settings.TURN_PREFETCH_DEADLINE_MS,
+            [],
+        )
+
+    async def run_agent(
+        name: str,
+        work: Callable[[], Awaitable[dict | list]],
+        deadline_ms: float,
+        fallback: dict | list,
+    ) -> dict:
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            data = await asyncio.wait_for(work(), timeout=deadline_ms / 1000)
+        except asyncio.TimeoutError:
+            logger.warning("Turn agent %s exceeded %dms deadline", name, deadline_ms)
+            status, data = "timeout", fallback
+        except Exception as exc:
+            logger.error("Turn agent %s failed: %s", name, exc)
+            status, data = "error", fallback
+        return {
+            "type": "AGENT_RESULT",
+            "agent": name,
+            "status": status,
+            "data": data,
+            "processingMs": int((time.perf_counter() - start) * 1000),
+        }
+
+    async def event_stream():
+        start = time.perf_counter()
+        yield _sse({"type": "TURN_ANALYSIS_START", "questionNumber": body.questionNumber, "agents": list(agents)})
+        tasks = [asyncio.create_task(run_agent(name, *spec)) for name, spec in agents.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                outcome = await next_done
+                data = outcome["data"]
+                if outcome["agent"] == "objection" and data.get("isObjectionable"):
+                    await _save_alert(db, _objection_alert(
+                        session_id, session.firm_id, body.questionNumber, body.questionText, data,
+                    ))
+                elif outcome["agent"] == "inconsistency" and data.get("flagFound"):
+                    await _save_alert(db, _inconsistency_alert(
+                        session_id, session.firm_id, body.questionNumber, body.answerText, data,
+                    ))
+                yield _sse(outcome)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        yield _sse({"type": "TURN_ANALYSIS_END", "totalMs": int((time.perf_counter() - start) * 1000)})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -0,0 +1,106 @@
+"""
+Serves the presigned-style URLs issued by the local storage backend.
+
+GET/HEAD honour single Range headers (206 + Content-Range); PUT streams the
+request body to disk.  Authorization is the URL's expiry + signature only, as
+with S3 presigned URLs.  Every route 404s when STORAGE_BACKEND is not local.
+"""
+
+import asyncio
+import re
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.services.local_storage import LocalStorageBackend, verify_url
+from app.services.storage_backends import get_storage_backend
+
+router = APIRouter(tags=["storage"])
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _local_backend() -> LocalStorageBackend:
+    backend = get_storage_backend()
+    if not isinstance(backend, LocalStorageBackend):
+        raise HTTPException(404, detail={"code": "NOT_FOUND"})
+    return backend
+
+
+def _check_signature(method: str, key: str, expires: int, sig: str, content_type: str = "") -> None:
+    if not verify_url(method, key, expires, sig, content_type):
+        raise HTTPException(403, detail={"code": "INVALID_SIGNATURE"})
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Return (start, end) inclusive for a single-range header, None for the whole object."""
+    match = _RANGE_RE.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+    if start > end or start >= size:
+        raise HTTPException(416, detail={"code": "RANGE_NOT_SATISFIABLE"}, headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+@router.api_route("/{key:path}", methods=["GET", "HEAD"])
+async def download_object(
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    sig: str = Query(...),
+):
+    backend = _local_backend()
+    _check_signature("GET", key, expires, sig)
+    info = await asyncio.to_thread(backend.stat, key)
+    if info is None:
+        raise HTTPException(404, detail={"code": "NOT_FOUND"})
+
+    byte_range = _parse_range(request.headers.get("range", ""), info.size) if info.size else None
+    start, end = byte_range or (0, info.size - 1)
+    headers = {"Accept-Ranges": "bytes", "Content-Length": str(end - start + 1 if info.size else 0)}
+    status_code = 200
+    if byte_range:
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{info.size}"
+
+    if request.method == "HEAD" or not info.size:
+        return Response(status_code=status_code, headers=headers, media_type=info.content_type)
+    return StreamingResponse(
+        backend.iter_range(key, start, end),
+        status_code=status_code,
+        headers=headers,
+        media_type=info.content_type,
+    )
+
+
+@router.put("/{key:path}")
+async def upload_object(
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    sig: str = Query(...),
+):
+    backend = _local_backend()
+    content_type = request.headers.get("content-type", "")
+    _check_signature("PUT", key, expires, sig, content_type)
+    try:
+        writer = await asyncio.to_thread(backend.open_writer, key, content_type)
+    except ValueError:
+        raise HTTPException(400, detail={"code": "INVALID_KEY"})
+
+    # Stream the body to a temp file; it only replaces the object once complete.
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await asyncio.to_thread(writer.write, chunk)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
+    await asyncio.to_thread(writer.commit)
+    return Response(status_code=200)
@@ -18,6 +18,9 @@ class QuestionRequest(BaseModel):
     hesitationDetected: bool = False
     recentInconsistencyFlag: bool = False
     currentTopic: str = "PRIOR_STATEMENTS"
+    # Stream QUESTION_AUDIO_CHUNK events per sentence/clause while the question
+    # is still generating, instead of one QUESTION_AUDIO blob at the end.
+    pipelineAudio: bool = False
 
 
 class ObjectionRequest(BaseModel):
@@ -29,3 +32,14 @@ class InconsistencyRequest(BaseModel):
     questionNumber: int
     questionText: str
     answerText: str
+
+
+class PartialAnswerRequest(BaseModel):
+    questionNumber: int          # the question being answered
+    partialText: str
+
+
+class TurnAnalysisRequest(BaseModel):
+    questionNumber: int
+    questionText: str
+    answerText: Optional[str] = None
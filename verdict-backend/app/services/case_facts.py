@@ -0,0 +1,148 @@
+"""
+Per-case facts aggregate.
+
+The fact review page reads one CaseFacts row per case instead of loading and
+merging every READY document's extracted facts on each request.  The row is
+kept up to date as documents change:
+
+  sync_document    — called as a document's ingestion starts and finishes.
+                     Its previous contribution is taken out and, if it is
+                     READY, its facts are merged in on the same normalized
+                     keys fact_extraction dedupes on (party name, date +
+                     event, fact text, statement text).  A duplicate only adds
+                     the document to the kept item's sourceDocumentIds.
+  remove_document  — called before a document is deleted.  The document is
+                     dropped from every item's sources; items left with no
+                     source go.
+
+Updates lock the row (SELECT ... FOR UPDATE) so documents of one case
+finishing together cannot lose each other's facts, and never commit — the
+caller commits alongside its own status change.  A case without a row (one
+from before the table existed) gets one built from its READY documents the
+first time it is needed.
+"""
+
+import copy
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.case_facts import CaseFacts
+from app.models.document import Document
+from app.services.fact_extraction import FACT_KEYS, empty_facts, fact_key, merge_duplicate
+
+
+def _add(facts: dict, documents: dict, document: Document) -> None:
+    documents[document.id] = {
+        "filename": document.filename,
+        "confirmed": document.facts_confirmed_at is not None,
+    }
+    extracted = document.extracted_facts or {}
+    for section in FACT_KEYS:
+        kept_by_key = {item["key"]: item for item in facts[section]}
+        for item in extracted.get(section) or []:
+            if not isinstance(item, dict):
+                continue
+            key = fact_key(section, item)
+            if not key:
+                continue
+            kept = kept_by_key.get(key)
+            if kept is None:
+                kept = {**item, "key": key, "sourceDocument": document.filename, "sourceDocumentIds": []}
+                kept_by_key[key] = kept
+                facts[section].append(kept)
+            else:
+                merge_duplicate(section, kept, item)
+            if document.id not in kept["sourceDocumentIds"]:
+                kept["sourceDocumentIds"].append(document.id)
+
+
+def _remove(facts: dict, documents: dict, document_id: str) -> None:
+    if documents.pop(document_id, None) is None:
+        return
+    for section in FACT_KEYS:
+        remaining = []
+        for item in facts[section]:
+            sources = [d for d in item["sourceDocumentIds"] if d != document_id]
+            if not sources:
+                continue
+            item["sourceDocumentIds"] = sources
+            item["sourceDocument"] = documents.get(sources[0], {}).get("filename", item["sourceDocument"])
+            remaining.append(item)
+        facts[section] = remaining
+
+
+def _store(row: CaseFacts, facts: dict, documents: dict) -> None:
+    # JSON columns do not track in-place changes; assign new values.
+    row.facts = facts
+    row.documents = documents
+    row.version = (row.version or 0) + 1
+
+
+async def _lock(db: AsyncSession, case_id: str, firm_id: str, create: bool) -> CaseFacts | None:
+    query = select(CaseFacts).where(CaseFacts.case_id == case_id).with_for_update()
+    row = (await db.execute(query)).scalar_one_or_none()
+    if row is not None or not create:
+        return row
+
+    inserted = await db.execute(
+        insert(CaseFacts)
+        .values(case_id=case_id, firm_id=firm_id, facts=empty_facts(), documents={}, version=0)
+        .on_conflict_do_nothing(index_elements=["caseId"])
+        .returning(CaseFacts.case_id)
+    )
+    built_here = inserted.first() is not None
+    row = (await db.execute(query)).scalar_one()
+    if built_here:
+        result = await db.execute(
+            select(Document).where(
+                Document.case_id == case_id,
+                Document.ingestion_status == "READY",
+            )
+        )
+        facts, documents = empty_facts(), {}
+        for document in result.scalars():
+            _add(facts, documents, document)
+        _store(row, facts, documents)
+    return row
+
+
+async def sync_document(db: AsyncSession, document: Document) -> None:
+    """Bring the case aggregate in line with the document's current status and facts."""
+    ready = document.ingestion_status == "READY"
+    row = await _lock(db, document.case_id, document.firm_id, create=ready)
+    if row is None:
+        return
+    facts, documents = copy.deepcopy(row.facts), copy.deepcopy(row.documents)
+    _remove(facts, documents, document.id)
+    if ready:
+        _add(facts, documents, document)
+    _store(row, facts, documents)
+
+
+async def remove_document(db: AsyncSession, document: Document) -> None:
+    """Take a document that is about to be deleted out of its case aggregate."""
+    row = await _lock(db, document.case_id, document.firm_id, create=False)
+    if row is None or document.id not in row.documents:
+        return
+    facts, documents = copy.deepcopy(row.facts), copy.deepcopy(row.documents)
+    _remove(facts, documents, document.id)
+    _store(row, facts, documents)
+
+
+async def mark_confirmed(db: AsyncSession, case_id: str, firm_id: str) -> CaseFacts:
+    """Flag every document in the aggregate as confirmed.  Caller commits."""
+    row = await _lock(db, case_id, firm_id, create=True)
+    documents = {doc_id: {**info, "confirmed": True} for doc_id, info in row.documents.items()}
+    _store(row, row.facts, documents)
+    return row
+
+
+async def load_case_facts(db: AsyncSession, case_id: str, firm_id: str) -> CaseFacts:
+    """The case aggregate, building (and committing) it on first use."""
+    row = (await db.execute(select(CaseFacts).where(CaseFacts.case_id == case_id))).scalar_one_or_none()
+    if row is None:
+        row = await _lock(db, case_id, firm_id, create=True)
+        await db.commit()
+    return row
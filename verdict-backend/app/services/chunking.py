@@ -0,0 +1,193 @@
+"""
+Retrieval chunking for extracted document text.
+
+Extraction yields one chunk per page.  Embedding whole pages dilutes
+retrieval and makes an alert's page:line citation point at line 1, so pages
+are re-split here into overlapping, size-bounded chunks that carry the exact
+page:line span they cover.
+
+Deposition transcripts are recognised by their layout: consecutive numbered
+lines (1–25, up to _MAX_LINE_NUMBER for some reporters) with the printed
+page number as a "Page N" header, a bare "N" first line or a bare "N" footer.  Their line numbers and printed page numbers are used as
+is, and a new chunk is preferred where a question ("Q.") begins so a
+question and its answer stay together.  Other text is numbered by its
+position on the page.
+
+Chunks never exceed CHUNK_MAX_CHARS (single over-long lines are split),
+and every chunk after the first repeats the last CHUNK_OVERLAP_LINES lines
+of the previous one.  Chunks span page breaks but not a switch between
+transcript and other pages.  Chunks without a page (DOCX paragraph groups)
+pass through unchanged.
+
+RetrievalChunker does the same incrementally, holding only the chunk being
+built, so ingestion can chunk pages as extraction yields them.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from app.config import settings
+from app.services.text_extraction import ExtractedChunk
+
+_MAX_LINE_NUMBER = 28
+_NUMBERED_LINE_RE = re.compile(r"^\s*(\d{1,2})(?:\s+(.*))?$")
+_PAGE_HEADER_RE = re.compile(r"^\s*page\s+(\d+)\s*$", re.IGNORECASE)
+_BARE_NUMBER_RE = re.compile(r"^\s*(\d+)\s*$")
+_QUESTION_RE = re.compile(r"^\s*(?:Q[.:]|Q\s|BY\s+M[RS]S?\.)")
+
+
+@dataclass
+class _Line:
+    page: int
+    line: int
+    text: str
+
+
+def _line_number(row: str) -> int | None:
+    match = _NUMBERED_LINE_RE.match(row)
+    return int(match.group(1)) if match else None
+
+
+def _printed_page(rows: list[str]) -> int | None:
+    """Take a bare printed page number off the top or bottom of the page's rows.
+
+    A bare first row is the page number when line 1 follows it; a bare last
+    row is when it does not continue the line sequence above it.
+    """
+    if len(rows) > 1:
+        first = _BARE_NUMBER_RE.match(rows[0])
+        if first and _line_number(rows[1]) == 1:
+            del rows[0]
+            return int(first.group(1))
+        last = _BARE_NUMBER_RE.match(rows[-1])
+        previous = _line_number(rows[-2])
+        if last and previous is not None and int(last.group(1)) != previous + 1:
+            del rows[-1]
+            return int(last.group(1))
+    return None
+
+
+def _deposition_lines(text: str, pdf_page: int) -> list[_Line] | None:
+    """Numbered transcript lines of one page, or None if the page isn't in that layout."""
+    rows = [row for row in text.splitlines() if row.strip()]
+    page = _printed_page(rows)
+    if page is None:
+        page = pdf_page
+    lines: list[_Line] = []
+    sequenced = 0
+    expected = None
+    for row in rows:
+        header = _PAGE_HEADER_RE.match(row)
+        if header and not sequenced:
+            page = int(header.group(1))
+            continue
+        match = _NUMBERED_LINE_RE.match(row)
+        number = int(match.group(1)) if match else None
+        if number is None or not 1 <= number <= _MAX_LINE_NUMBER or (expected is not None and number != expected):
+            # An unnumbered (or out-of-sequence) row is a wrapped continuation
+            # of the numbered line above it.
+            if lines:
+                lines[-1].text = f"{lines[-1].text} {row.strip()}".strip()
+            continue
+        expected = number + 1
+        sequenced += 1
+        lines.append(_Line(page=page, line=number, text=(match.group(2) or "").strip()))
+    # Most rows must be numbered, in sequence, for the page to count as a transcript.
+    if sequenced < 5 or sequenced < 0.6 * len(rows):
+        return None
+    return [line for line in lines if line.text]
+
+
+def _page_lines(text: str, page: int) -> tuple[list[_Line], bool]:
+    """Lines of one page, and whether the page is in deposition layout."""
+    lines = _deposition_lines(text, page)
+    if lines is not None:
+        return lines, True
+    return [_Line(page=page, line=i, text=row.strip()) for i, row in enumerate(text.splitlines(), start=1) if row.strip()], False
+
+
+def _split_long(line: _Line, max_chars: int) -> list[_Line]:
+    if len(line.text) <= max_chars:
+        return [line]
+    pieces, current = [], ""
+    for word in line.text.split():
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = ""
+        current = f"{current} {word}" if current else word[:max_chars]
+    if current:
+        pieces.append(current)
+    return [_Line(page=line.page, line=line.line, text=p) for p in pieces]
+
+
+def _to_chunk(lines: list[_Line]) -> ExtractedChunk:
+    return ExtractedChunk(
+        content="\n".join(l.text for l in lines),
+        page=lines[0].page,
+        line=lines[0].line,
+        end_page=lines[-1].page,
+        end_line=lines[-1].line,
+    )
+
+
+class _LineChunker:
+    """Packs lines into chunks as they arrive, holding only the chunk being built."""
+
+    def __init__(self):
+        self._current: list[_Line] = []
+        self._size = 0
+
+    def add(self, line: _Line) -> list[ExtractedChunk]:
+        done = []
+        for piece in _split_long(line, settings.CHUNK_MAX_CHARS):
+            too_big = self._size + len(piece.text) + 1 > settings.CHUNK_MAX_CHARS
+            at_question = self._size >= settings.CHUNK_MIN_CHARS and _QUESTION_RE.match(piece.text)
+            if self._current and (too_big or at_question):
+                done.append(_to_chunk(self._current))
+                # Overlap, but always advance the start so chunk ids stay unique.
+                keep = min(settings.CHUNK_OVERLAP_LINES, len(self._current) - 1)
+                self._current = self._current[len(self._current) - keep:] if keep > 0 else []
+                self._size = sum(len(l.text) + 1 for l in self._current)
+                while self._current and self._size + len(piece.text) + 1 > settings.CHUNK_MAX_CHARS:
+                    self._size -= len(self._current.pop(0).text) + 1
+            self._current.append(piece)
+            self._size += len(piece.text) + 1
+        return done
+
+    def flush(self) -> list[ExtractedChunk]:
+        done = [_to_chunk(self._current)] if self._current else []
+        self._current, self._size = [], 0
+        return done
+
+
+class RetrievalChunker:
+    """Incremental chunk_for_retrieval: feed pages in order, collect chunks as they complete."""
+
+    def __init__(self):
+        self._lines = _LineChunker()
+        self._is_deposition: bool | None = None
+
+    def feed(self, page: ExtractedChunk) -> list[ExtractedChunk]:
+        if page.page is None:
+            return [page]
+        done = []
+        # Plain-text uploads may arrive as a single "page"; form feeds mark real page breaks.
+        for offset, text in enumerate(page.content.split("\f")):
+            lines, is_deposition = _page_lines(text, page.page + offset)
+            if is_deposition != self._is_deposition:
+                done += self._lines.flush()
+            self._is_deposition = is_deposition
+            for line in lines:
+                done += self._lines.add(line)
+        return done
+
+    def finish(self) -> list[ExtractedChunk]:
+        return self._lines.flush()
+
+
+def chunk_for_retrieval(pages: Iterable[ExtractedChunk]) -> list[ExtractedChunk]:
+    """Re-split per-page extraction output into retrieval chunks with page:line spans."""
+    chunker = RetrievalChunker()
+    chunks = [chunk for page in pages for chunk in chunker.feed(page)]
+    return chunks + chunker.finish()
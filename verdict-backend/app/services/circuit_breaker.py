@@ -0,0 +1,170 @@
+"""
+Per-upstream circuit breakers (per process).
+
+Each breaker keeps the outcome and latency of the last CIRCUIT_WINDOW_SIZE
+calls.  Once at least CIRCUIT_MIN_CALLS are recorded it trips (opens) when
+either
+
+  - the error rate reaches CIRCUIT_ERROR_RATE, or
+  - the p95 latency reaches the upstream's <UPSTREAM>_CIRCUIT_P95_TRIP_MS
+    (0 = trip on errors only, for upstreams whose latency depends on the
+    call, like Claude).
+
+While open, guard() raises CircuitOpenError immediately so callers fall back
+without waiting on a failing provider.  guard() wraps only the upstream call,
+inside the rate limiter's governed() slot, so time spent queueing for a slot
+is not counted as upstream latency; callers check() first so an open breaker
+also skips the queue.  After CIRCUIT_OPEN_S one probe call
+is let through (half-open): a fast success closes the breaker with a fresh
+window, anything else re-opens it.
+
+A call cancelled or abandoned by its caller (e.g. it lost a hedged race) is
+not an error; its elapsed time is recorded as a lower bound on its latency.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """The upstream's breaker is open; the call was not attempted."""
+
+    def __init__(self, upstream: str):
+        super().__init__(f"{upstream} circuit is open")
+        self.upstream = upstream
+
+
+def _p95_trip_ms(upstream: str) -> int:
+    return {
+        "nemotron": settings.NEMOTRON_CIRCUIT_P95_TRIP_MS,
+        "claude": settings.CLAUDE_CIRCUIT_P95_TRIP_MS,
+    }.get(upstream, 0)
+
+
+class CircuitBreaker:
+    def __init__(self, upstream: str):
+        self.upstream = upstream
+        self._outcomes: deque[tuple[bool, float]] = deque(maxlen=settings.CIRCUIT_WINDOW_SIZE)
+        self._opened_at: float | None = None
+        self._probing = False
+        self.stats = {"calls": 0, "failures": 0, "rejected": 0, "trips": 0}
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < settings.CIRCUIT_OPEN_S:
+            return "open"
+        return "half_open"
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls would be rejected (open, or half-open with its probe in flight)."""
+        state = self.state
+        return state == "open" or (state == "half_open" and self._probing)
+
+    def latency_p95(self) -> float | None:
+        """p95 latency in seconds over the window, once CIRCUIT_MIN_CALLS are recorded."""
+        latencies = sorted(latency for _, latency in self._outcomes)
+        if len(latencies) < settings.CIRCUIT_MIN_CALLS:
+            return None
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+    def _allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def _open(self, reason: str) -> None:
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.stats["trips"] += 1
+        logger.warning("%s circuit opened: %s", self.upstream, reason)
+
+    def _record(self, ok: bool, latency: float, probe: bool) -> None:
+        trip_ms = _p95_trip_ms(self.upstream)
+        if probe:
+            self._probing = False
+            if ok and not (trip_ms and latency * 1000 >= trip_ms):
+                self._opened_at = None
+                self._outcomes.clear()
+                logger.info("%s circuit closed after a successful probe", self.upstream)
+            else:
+                self._open("probe call failed" if not ok else f"probe call took {latency * 1000:.0f}ms")
+            return
+        if self._opened_at is not None:
+            return  # admitted before the breaker tripped
+
+        self._outcomes.append((ok, latency))
+        if len(self._outcomes) < settings.CIRCUIT_MIN_CALLS:
+            return
+        error_rate = sum(not o for o, _ in self._outcomes) / len(self._outcomes)
+        p95 = self.latency_p95()
+        if error_rate >= settings.CIRCUIT_ERROR_RATE:
+            self._open(f"error rate {error_rate:.0%} over the last {len(self._outcomes)} calls")
+        elif trip_ms and p95 * 1000 >= trip_ms:
+            self._open(f"p95 latency {p95 * 1000:.0f}ms over the last {len(self._outcomes)} calls")
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if a call would be rejected right now."""
+        if self.is_open:
+            self.stats["rejected"] += 1
+            raise CircuitOpenError(self.upstream)
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """Run a call under the breaker: rejected while open, outcome and latency recorded."""
+        if not self._allow():
+            self.stats["rejected"] += 1
+            raise CircuitOpenError(self.upstream)
+        probe = self._probing
+        start = time.perf_counter()
+        try:
+            yield
+        except (asyncio.CancelledError, GeneratorExit):
+            if probe:
+                self._probing = False  # let the next call probe instead
+            else:
+                self._record(True, time.perf_counter() - start, probe=False)
+            raise
+        except Exception:
+            self.stats["calls"] += 1
+            self.stats["failures"] += 1
+            self._record(False, time.perf_counter() - start, probe)
+            raise
+        self.stats["calls"] += 1
+        self._record(True, time.perf_counter() - start, probe)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(upstream: str) -> CircuitBreaker:
+    if upstream not in _breakers:
+        _breakers[upstream] = CircuitBreaker(upstream)
+    return _breakers[upstream]
+
+
+def circuit_breaker_stats() -> dict:
+    stats = {}
+    for upstream, breaker in _breakers.items():
+        p95 = breaker.latency_p95()
+        stats[upstream] = {
+            **breaker.stats,
+            "state": breaker.state,
+            "p95LatencyMs": round(p95 * 1000, 1) if p95 is not None else None,
+        }
+    return stats
@@ -1,8 +1,17 @@
+import logging
+from contextlib import nullcontext
 from anthropic import AsyncAnthropic
 from typing import AsyncGenerator
 from app.config import settings
+from app.services.circuit_breaker import get_breaker
+from app.services.rate_limiter import Priority, estimate_tokens, governed, refund
+
+logger = logging.getLogger(__name__)
 
 _client: AsyncAnthropic | None = None
+_cache_stats = {
+    "calls": 0, "hits": 0, "cacheReadTokens": 0, "cacheWriteTokens": 0, "uncachedInputTokens": 0,
+}
 
 
 def _get_client() -> AsyncAnthropic:
@@ -14,29 +23,108 @@ def _get_client() -> AsyncAnthropic:
     return _client
 
 
-async def claude_chat(system_prompt: str, user_message: str, max_tokens: int = 1024) -> str:
-    response = await _get_client().messages.create(
-        model=settings.ANTHROPIC_MODEL,
-        max_tokens=max_tokens,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    )
+async def claude_chat(
+    system_prompt: str,
+    user_message: str,
+    max_tokens: int = 1024,
+    priority: Priority = Priority.LIVE,
+    circuit_breaker: bool = False,
+) -> str:
+    """One completion.
+
+    `circuit_breaker` routes the call through the "claude" breaker, so it
+    fails fast with CircuitOpenError while Claude is failing.  Only callers
+    with a fallback for that (contradiction scoring) set it; everyone else
+    keeps trying Claude, which is their only provider.
+    """
+    cost = estimate_tokens(system_prompt, user_message, max_tokens=max_tokens)
+    breaker = get_breaker("claude") if circuit_breaker else None
+    if breaker is not None:
+        breaker.check()
+    async with governed("claude", priority, cost), (breaker.guard() if breaker else nullcontext()):
+        response = await _get_client().messages.create(
+            model=settings.ANTHROPIC_MODEL,
+            max_tokens=max_tokens,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_message}],
+        )
+    await refund("claude", max_tokens - response.usage.output_tokens)
     block = response.content[0]
     if block.type != "text":
         raise ValueError("Unexpected Claude response type")
     return block.text
 
 
+def prompt_cache_stats() -> dict:
+    return dict(_cache_stats)
+
+
+def _record_cache_usage(usage) -> None:
+    read = usage.cache_read_input_tokens or 0
+    created = usage.cache_creation_input_tokens or 0
+    _cache_stats["calls"] += 1
+    _cache_stats["hits"] += 1 if read else 0
+    _cache_stats["cacheReadTokens"] += read
+    _cache_stats["cacheWriteTokens"] += created
+    _cache_stats["uncachedInputTokens"] += usage.input_tokens
+    logger.info(
+        "Claude prompt cache: %s read=%d written=%d uncached=%d (totals: %d/%d hits, %d tokens read from cache)",
+        "HIT" if read else "MISS", read, created, usage.input_tokens,
+        _cache_stats["hits"], _cache_stats["calls"], _cache_stats["cacheReadTokens"],
+    )
+
+
+def prompt_cacheable(system_prompt: str, cached_context: str | None) -> bool:
+    """Whether claude_stream will send this prefix with a cache breakpoint."""
+    return (
+        cached_context is not None
+        and settings.ANTHROPIC_PROMPT_CACHE_ENABLED
+        and estimate_tokens(system_prompt, cached_context) >= settings.ANTHROPIC_PROMPT_CACHE_MIN_TOKENS
+    )
+
+
 async def claude_stream(
     system_prompt: str,
     user_message: str,
     max_tokens: int = 512,
+    cached_context: str | None = None,
+    priority: Priority = Priority.LIVE,
 ) -> AsyncGenerator[str, None]:
-    async with _get_client().messages.stream(
-        model=settings.ANTHROPIC_MODEL,
-        max_tokens=max_tokens,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
-    ) as stream:
-        async for text in stream.text_stream:
-            yield text
+    """Stream a completion.
+
+    `cached_context` is static text (e.g. a case header) appended to the
+    system prompt as a prompt-cache breakpoint, so repeated calls with the
+    same prefix are billed and processed as cache reads.  Prefixes shorter
+    than ANTHROPIC_PROMPT_CACHE_MIN_TOKENS are sent as plain system text
+    without a breakpoint, since the API would not cache them anyway.
+    """
+    cost = estimate_tokens(system_prompt, cached_context, user_message, max_tokens=max_tokens)
+    cacheable = prompt_cacheable(system_prompt, cached_context)
+    async with governed("claude", priority, cost):
+        if not cacheable:
+            if cached_context:
+                system_prompt = f"{system_prompt}\n\n{cached_context}"
+            async with _get_client().messages.stream(
+                model=settings.ANTHROPIC_MODEL,
+                max_tokens=max_tokens,
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_message}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                usage = (await stream.get_final_message()).usage
+        else:
+            async with _get_client().beta.prompt_caching.messages.stream(
+                model=settings.ANTHROPIC_MODEL,
+                max_tokens=max_tokens,
+                system=[
+                    {"type": "text", "text": system_prompt},
+                    {"type": "text", "text": cached_context, "cache_control": {"type": "ephemeral"}},
+                ],
+                messages=[{"role": "user", "content": user_message}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                usage = (await stream.get_final_message()).usage
+            _record_cache_usage(usage)
+    await refund("claude", max_tokens - usage.output_tokens)
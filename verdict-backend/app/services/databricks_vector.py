@@ -1,8 +1,9 @@
 """
-Databricks Vector Search service.
+Vector Search service.
 
-Calls a FastAPI retrieval proxy (e.g. http://127.0.0.1:8000/api/retrieve)
-that wraps Databricks Vector Search indexes:
+Retrieval and ingestion for the two indexes, on whichever backend
+VECTOR_BACKEND selects (app/services/vector_backends.py): the Databricks
+retrieval proxy, or the local memory-mapped index for single-node deployments.
 
   verdict.sessions.fre_rules_index
     — Full FRE corpus (Rules 101–1103).  Queried by Objection Copilot.
@@ -10,125 +11,157 @@ that wraps Databricks Vector Search indexes:
   verdict.sessions.prior_statements_index
     — Prior sworn statements extracted from uploaded case documents.
     — Filtered by case_id for firm-level isolation.
-
-The proxy accepts POST requests with a JSON body and returns matching documents.
-Authentication is via Bearer token in the Authorization header.
 """
 
+import asyncio
 import logging
-import httpx
+from dataclasses import dataclass, field
 
 from app.config import settings
+from app.services.lexical_index import reciprocal_rank_fusion, search_lexical
+from app.services.retrieval_cache import cached_retrieval
+from app.services.vector_backends import get_vector_backend
 
 logger = logging.getLogger(__name__)
 
 
-def _databricks_configured() -> bool:
-    return bool(settings.DATABRICKS_HOST and settings.DATABRICKS_TOKEN)
-
-
-def _build_url() -> str:
-    host = settings.DATABRICKS_HOST.rstrip("/")
-    path = settings.DATABRICKS_RETRIEVE_PATH
-    return f"{host}{path}"
-
-
-def _headers() -> dict:
-    return {
-        "Authorization": f"Bearer {settings.DATABRICKS_TOKEN}",
-        "Content-Type": "application/json",
-    }
-
-
-def _normalize_results(resp_data: dict | list) -> list[dict]:
-    """Normalize various response formats into a flat list of dicts."""
-    if isinstance(resp_data, list):
-        return resp_data
-
-    if isinstance(resp_data, dict):
-        if "results" in resp_data:
-            return resp_data["results"] if isinstance(resp_data["results"], list) else []
-        if "data" in resp_data:
-            return resp_data["data"] if isinstance(resp_data["data"], list) else []
-        if "manifest" in resp_data and "result" in resp_data:
-            cols = [c["name"] for c in resp_data.get("manifest", {}).get("columns", [])]
-            rows = resp_data.get("result", {}).get("data_array", [])
-            return [dict(zip(cols, row)) for row in rows]
-        return [resp_data]
-
-    return []
-
-
 # ── FRE Rules Index (Objection Copilot) ────────────────────────────────────
 
 async def search_fre_rules(query: str, top_k: int = 3, deposition_only: bool = True) -> list[dict]:
     """Search the FRE corpus index via the retrieval proxy.
 
     Returns a list of dicts with at least a 'content' key.
-    Returns [] gracefully when Databricks is not configured or unavailable.
+    Returns [] gracefully when the backend is not configured or unavailable.
     """
-    if not _databricks_configured():
-        logger.warning("Databricks not configured — FRE search returning empty")
+    backend = get_vector_backend()
+    if not backend.configured():
+        logger.warning("Vector backend not configured — FRE search returning empty")
         return []
 
-    payload = {
-        "query": query,
-        "index_name": settings.DATABRICKS_FRE_INDEX,
-        "endpoint_name": settings.DATABRICKS_VECTOR_ENDPOINT,
-        "num_results": top_k,
-        "columns": ["content", "rule_number", "article", "is_deposition_relevant"],
-    }
-    if deposition_only:
-        payload["filters"] = {"is_deposition_relevant": "true"}
+    index = settings.DATABRICKS_FRE_INDEX
+    columns = ["content", "rule_number", "article", "is_deposition_relevant"]
+    filters = {"is_deposition_relevant": "true"} if deposition_only else None
 
+    cache_index = f"{backend.name}:{index}|{'deposition' if deposition_only else 'all'}"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(_build_url(), json=payload, headers=_headers())
-            resp.raise_for_status()
-            return _normalize_results(resp.json())
+        return await cached_retrieval(
+            cache_index, None, query, top_k,
+            lambda: backend.search(index, query, top_k, columns, filters),
+        )
     except Exception as exc:
-        logger.error("Databricks FRE search failed: %s", exc)
+        logger.error("Vector FRE search failed: %s", exc)
         return []
 
 
 # ── Prior Statements Index (Inconsistency Detector + Interrogator) ──────────
 
+class _VectorSearchFailed(Exception):
+    """Hybrid search lost its vector half; carries the BM25-only results.
+
+    Raised instead of returned so the retrieval cache does not keep the
+    degraded results for its TTL.
+    """
+
+    def __init__(self, results: list[dict], cause: Exception):
+        super().__init__(str(cause))
+        self.results = results
+
+
+async def _hybrid_prior_statements(
+    backend, index: str, case_id: str, query: str, top_k: int, columns: list[str],
+) -> list[dict]:
+    """Vector and BM25 candidates for the case, fused with reciprocal-rank fusion.
+
+    If the vector search fails the BM25 hits are still returned, via
+    _VectorSearchFailed.
+    """
+    candidates = top_k * settings.HYBRID_CANDIDATE_MULTIPLIER
+    vector_error: Exception | None = None
+
+    async def vector() -> list[dict]:
+        nonlocal vector_error
+        if not backend.configured():
+            return []
+        try:
+            return await backend.search(index, query, candidates, columns, {"case_id": case_id})
+        except Exception as exc:
+            vector_error = exc
+            return []
+
+    async def lexical() -> list[dict]:
+        try:
+            hits = await asyncio.to_thread(search_lexical, case_id, query, candidates)
+        except Exception as exc:
+            logger.warning("Lexical prior-statement search failed: %s", exc)
+            return []
+        return [{c: record.get(c) for c in columns} for _, record in hits]
+
+    vector_hits, lexical_hits = await asyncio.gather(vector(), lexical())
+    results = reciprocal_rank_fusion([vector_hits, lexical_hits], k=settings.HYBRID_RRF_K)[:top_k]
+    if vector_error is not None:
+        raise _VectorSearchFailed(results, vector_error)
+    return results
+
+
 async def search_prior_statements(
     case_id: str,
     query: str,
     top_k: int = 5,
 ) -> list[dict]:
-    """Search prior sworn statements for a specific case via the retrieval proxy.
+    """Search prior sworn statements for a specific case.
+
+    With HYBRID_RETRIEVAL_ENABLED the vector results are fused with the
+    case's BM25 index (services/lexical_index.py), so exact dates, exhibit
+    numbers and names rank alongside semantic matches.
 
     Returns a list of dicts with at least 'content', 'page', 'line' keys.
-    Returns [] gracefully when Databricks is not configured or unavailable.
+    Returns [] gracefully when the backend is not configured or unavailable.
     """
-    if not _databricks_configured():
-        logger.warning("Databricks not configured — prior statement search returning empty")
+    backend = get_vector_backend()
+    hybrid = settings.HYBRID_RETRIEVAL_ENABLED
+    if not backend.configured() and not hybrid:
+        logger.warning("Vector backend not configured — prior statement search returning empty")
         return []
 
-    payload = {
-        "query": query,
-        "index_name": settings.DATABRICKS_VECTOR_INDEX,
-        "endpoint_name": settings.DATABRICKS_VECTOR_ENDPOINT,
-        "num_results": top_k,
-        "columns": ["content", "page", "line", "doc_type", "witness_name"],
-        "filters": {"case_id": case_id},
-    }
+    index = settings.DATABRICKS_VECTOR_INDEX
+    columns = ["content", "page", "line", "doc_type", "witness_name"]
+
+    if hybrid:
+        cache_index = f"{backend.name}+bm25:{index}"
+        fetch = lambda: _hybrid_prior_statements(backend, index, case_id, query, top_k, columns)  # noqa: E731
+    else:
+        cache_index = f"{backend.name}:{index}"
+        fetch = lambda: backend.search(index, query, top_k, columns, {"case_id": case_id})  # noqa: E731
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(_build_url(), json=payload, headers=_headers())
-            resp.raise_for_status()
-            return _normalize_results(resp.json())
+        return await cached_retrieval(cache_index, case_id, query, top_k, fetch)
+    except _VectorSearchFailed as exc:
+        logger.error("Vector prior-statement search failed, using BM25 results only: %s", exc)
+        return exc.results
     except Exception as exc:
-        logger.error("Databricks prior-statement search failed: %s", exc)
+        logger.error("Vector prior-statement search failed: %s", exc)
         return []
 
 
 # ── Upsert (Document Ingestion Pipeline) ────────────────────────────────────
 
-async def upsert_prior_statement(
+@dataclass
+class BatchUpsertResult:
+    """Outcome of a batched upsert, reported back onto the Document row."""
+    upserted: int = 0
+    failures: list[dict] = field(default_factory=list)   # [{"id", "page", "error"}]
+    skipped_reason: str | None = None
+
+    def to_report(self, max_failures: int = 200) -> dict:
+        return {
+            "upserted": self.upserted,
+            "failed": len(self.failures),
+            "failures": self.failures[:max_failures],
+            "skippedReason": self.skipped_reason,
+        }
+
+
+def build_prior_statement_record(
     case_id: str,
     document_id: str,
     content: str,
@@ -136,20 +169,10 @@ async def upsert_prior_statement(
     line: int | None = None,
     doc_type: str = "PRIOR_DEPOSITION",
     witness_name: str | None = None,
-) -> bool:
-    """Upsert a single prior statement chunk into the prior statements index.
-
-    Called by the document ingestion pipeline after text extraction.
-    Sends to the retrieval proxy's upsert endpoint (same base, /api/upsert or
-    falls back to including an 'action' field in the retrieve payload).
-    Returns True on success, False on any failure.
-    """
-    if not _databricks_configured():
-        logger.warning("Databricks not configured — upsert skipped")
-        return False
-
-    record = {
-        "id": f"{document_id}_{page}_{line}",
+    record_id: str | None = None,
+) -> dict:
+    return {
+        "id": record_id or f"{document_id}_{page}_{line}",
         "content": content,
         "case_id": case_id,
         "document_id": document_id,
@@ -159,27 +182,102 @@ async def upsert_prior_statement(
         "witness_name": witness_name,
     }
 
-    host = settings.DATABRICKS_HOST.rstrip("/")
-    upsert_url = f"{host}/api/upsert"
 
-    payload = {
-        "index_name": settings.DATABRICKS_VECTOR_INDEX,
-        "endpoint_name": settings.DATABRICKS_VECTOR_ENDPOINT,
-        "data": record,
-    }
+async def upsert_prior_statement(
+    case_id: str,
+    document_id: str,
+    content: str,
+    page: int | None = None,
+    line: int | None = None,
+    doc_type: str = "PRIOR_DEPOSITION",
+    witness_name: str | None = None,
+) -> bool:
+    """Upsert a single prior statement chunk into the prior statements index.
+
+    Returns True on success, False on any failure.  Bulk callers should use
+    upsert_prior_statements_batch instead.
+    """
+    backend = get_vector_backend()
+    if not backend.configured():
+        logger.warning("Vector backend not configured — upsert skipped")
+        return False
 
+    record = build_prior_statement_record(
+        case_id, document_id, content, page, line, doc_type, witness_name,
+    )
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(upsert_url, json=payload, headers=_headers())
-            if resp.status_code == 404:
-                payload_alt = {
-                    "action": "upsert",
-                    "index_name": settings.DATABRICKS_VECTOR_INDEX,
-                    "record": record,
-                }
-                resp = await client.post(_build_url(), json=payload_alt, headers=_headers())
-            resp.raise_for_status()
-            return True
+        return not await backend.upsert(settings.DATABRICKS_VECTOR_INDEX, [record])
     except Exception as exc:
-        logger.error("Databricks upsert failed for doc %s: %s", document_id, exc)
+        logger.error("Vector upsert failed for doc %s: %s", document_id, exc)
         return False
+
+
+async def upsert_prior_statements_batch(
+    records: list[dict],
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+    max_retries: int | None = None,
+) -> BatchUpsertResult:
+    """Upsert many records in batches with bounded concurrency.
+
+    Failed batches are retried with exponential backoff; records still failing
+    afterwards (or rejected individually by the index) are returned as
+    per-record failures instead of raising.
+    """
+    result = BatchUpsertResult()
+    if not records:
+        return result
+    backend = get_vector_backend()
+    if not backend.configured():
+        logger.warning("Vector backend not configured — batch upsert of %d records skipped", len(records))
+        result.skipped_reason = "Vector backend not configured"
+        return result
+
+    batch_size = batch_size or settings.DATABRICKS_UPSERT_BATCH_SIZE
+    max_retries = settings.DATABRICKS_UPSERT_MAX_RETRIES if max_retries is None else max_retries
+    semaphore = asyncio.Semaphore(concurrency or settings.DATABRICKS_UPSERT_CONCURRENCY)
+    batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+
+    async def send(batch: list[dict]) -> None:
+        async with semaphore:
+            rejected, error = set(), "Rejected by index"
+            for attempt in range(max_retries + 1):
+                try:
+                    rejected = set(await backend.upsert(settings.DATABRICKS_VECTOR_INDEX, batch))
+                    break
+                except Exception as exc:
+                    if attempt == max_retries:
+                        logger.error("Vector batch upsert of %d records failed: %s", len(batch), exc)
+                        rejected, error = {r["id"] for r in batch}, str(exc)
+                    else:
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+        for record in batch:
+            if record["id"] in rejected:
+                result.failures.append({"id": record["id"], "page": record.get("page"), "error": error})
+            else:
+                result.upserted += 1
+
+    await asyncio.gather(*(send(batch) for batch in batches))
+    return result
+
+
+async def delete_prior_statements(case_id: str, record_ids: list[str]) -> bool:
+    """Remove records from the prior statements index in batches.
+
+    Returns False if any batch failed; failures are logged, not raised.
+    """
+    if not record_ids:
+        return True
+    backend = get_vector_backend()
+    if not backend.configured():
+        return True
+    batch_size = settings.DATABRICKS_UPSERT_BATCH_SIZE
+    ok = True
+    for i in range(0, len(record_ids), batch_size):
+        batch = record_ids[i:i + batch_size]
+        try:
+            await backend.delete(settings.DATABRICKS_VECTOR_INDEX, batch, case_id)
+        except Exception as exc:
+            logger.error("Vector delete of %d records for case %s failed: %s", len(batch), case_id, exc)
+            ok = False
+    return ok
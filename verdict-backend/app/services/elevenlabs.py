@@ -1,6 +1,8 @@
-import httpx
+from typing import AsyncGenerator
 from elevenlabs.client import AsyncElevenLabs
 from app.config import settings
+from app.services.http_clients import get_http_client
+from app.services.rate_limiter import Priority, governed
 
 eleven = AsyncElevenLabs(api_key=settings.ELEVENLABS_API_KEY)
 
@@ -10,25 +12,51 @@ VOICES = {
 }
 
 
-async def text_to_speech(text: str, voice_id: str = "") -> bytes:
+async def text_to_speech(text: str, voice_id: str = "", priority: Priority = Priority.LIVE) -> bytes:
     vid = voice_id or VOICES["INTERROGATOR"]
-    audio = await eleven.text_to_speech.convert(
-        voice_id=vid,
-        text=text,
-        model_id="eleven_turbo_v2_5",
-    )
-    chunks = []
-    async for chunk in audio:
-        chunks.append(chunk)
+    async with governed("elevenlabs", priority, len(text)):
+        audio = await eleven.text_to_speech.convert(
+            voice_id=vid,
+            text=text,
+            model_id="eleven_turbo_v2_5",
+        )
+        chunks = []
+        async for chunk in audio:
+            chunks.append(chunk)
     return b"".join(chunks)
 
 
+async def text_to_speech_stream(
+    text: str,
+    voice_id: str = "",
+    previous_text: str | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Stream MP3 audio for one segment of a longer utterance as it is synthesized.
+
+    previous_text is the already-spoken part of the utterance so ElevenLabs
+    keeps prosody continuous across segments.
+    """
+    vid = voice_id or VOICES["INTERROGATOR"]
+    kwargs = {"previous_text": previous_text} if previous_text else {}
+    async with governed("elevenlabs", Priority.LIVE, len(text)):
+        async for chunk in eleven.text_to_speech.convert_as_stream(
+            voice_id=vid,
+            text=text,
+            model_id="eleven_turbo_v2_5",
+            optimize_streaming_latency="3",
+            **kwargs,
+        ):
+            if chunk:
+                yield chunk
+
+
 async def speech_to_text(audio_bytes: bytes) -> str:
     from io import BytesIO
-    result = await eleven.speech_to_text.convert(
-        file=BytesIO(audio_bytes),
-        model_id="scribe_v1",
-    )
+    async with governed("elevenlabs", Priority.LIVE):
+        result = await eleven.speech_to_text.convert(
+            file=BytesIO(audio_bytes),
+            model_id="scribe_v1",
+        )
     return result.text or ""
 
 
@@ -36,14 +64,13 @@ async def get_conversation_token(agent_id: str) -> str:
     """Get a signed WebSocket URL for an ElevenLabs Conversational AI session.
     Each URL is single-use and expires after 30 minutes.
     """
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(
-            f"https://api.elevenlabs.io/v1/convai/conversation/get_signed_url",
-            headers={"xi-api-key": settings.ELEVENLABS_API_KEY},
-            params={"agent_id": agent_id},
-        )
-        resp.raise_for_status()
-        return resp.json()["signed_url"]
+    resp = await get_http_client("elevenlabs").get(
+        "/convai/conversation/get_signed_url",
+        params={"agent_id": agent_id},
+        timeout=10,
+    )
+    resp.raise_for_status()
+    return resp.json()["signed_url"]
 
 
 def build_conversation_override(system_prompt: str, first_message: str) -> dict:
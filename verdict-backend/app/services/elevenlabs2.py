@@ -1,36 +1,27 @@
 import httpx
 
 from app.config import settings
+from app.services.http_clients import get_http_client
 
 
 class ElevenLabsService:
     """Async client for the ElevenLabs Conversational AI + TTS APIs."""
 
-    def __init__(self) -> None:
-        self._base = "https://api.elevenlabs.io/v1"
-        self._headers = {
-            "xi-api-key": settings.ELEVENLABS_API_KEY,
-            "Content-Type": "application/json",
-        }
-
-    def _client(self, timeout: float = 30.0) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            base_url=self._base,
-            headers=self._headers,
-            timeout=timeout,
-        )
+    def _client(self) -> httpx.AsyncClient:
+        # Shared keep-alive pool; per-request timeouts are passed explicitly.
+        return get_http_client("elevenlabs")
 
     # ── Signed conversation token ────────────────────────────────
 
     async def get_conversation_token(self, agent_id: str) -> str:
         """Get a short-lived signed URL the frontend uses to connect."""
-        async with self._client() as client:
-            resp = await client.get(
-                "/convai/conversation/get-signed-url",
-                params={"agent_id": agent_id},
-            )
-            resp.raise_for_status()
-            return resp.json()["signed_url"]
+        resp = await self._client().get(
+            "/convai/conversation/get-signed-url",
+            params={"agent_id": agent_id},
+            timeout=30.0,
+        )
+        resp.raise_for_status()
+        return resp.json()["signed_url"]
 
     @staticmethod
     def build_conversation_override(
@@ -69,20 +60,19 @@ class ElevenLabsService:
         voice = voice_id or settings.ELEVENLABS_COACH_VOICE_ID
         model = model_id or "eleven_multilingual_v2"
 
-        async with self._client(timeout=60.0) as client:
-            resp = await client.post(
-                f"/text-to-speech/{voice}",
-                json={
-                    "text": text,
-                    "model_id": model,
-                    "voice_settings": {
-                        "stability": stability,
-                        "similarity_boost": similarity_boost,
-                    },
+        resp = await self._client().post(
+            f"/text-to-speech/{voice}",
+            json={
+                "text": text,
+                "model_id": model,
+                "voice_settings": {
+                    "stability": stability,
+                    "similarity_boost": similarity_boost,
                 },
-            )
-            resp.raise_for_status()
-            return resp.content
+            },
+        )
+        resp.raise_for_status()
+        return resp.content
 
     # ── Conversation history ─────────────────────────────────────
 
@@ -96,24 +86,21 @@ class ElevenLabsService:
         if cursor:
             params["cursor"] = cursor
 
-        async with self._client() as client:
-            resp = await client.get("/convai/conversations", params=params)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get("/convai/conversations", params=params, timeout=30.0)
+        resp.raise_for_status()
+        return resp.json()
 
     async def get_conversation(self, conversation_id: str) -> dict:
-        async with self._client() as client:
-            resp = await client.get(f"/convai/conversations/{conversation_id}")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get(f"/convai/conversations/{conversation_id}", timeout=30.0)
+        resp.raise_for_status()
+        return resp.json()
 
     # ── Agent info ───────────────────────────────────────────────
 
     async def get_agent(self, agent_id: str) -> dict:
-        async with self._client() as client:
-            resp = await client.get(f"/convai/agents/{agent_id}")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get(f"/convai/agents/{agent_id}", timeout=30.0)
+        resp.raise_for_status()
+        return resp.json()
 
 
 elevenlabs_service = ElevenLabsService()
@@ -0,0 +1,207 @@
+"""
+Map-reduce fact extraction over a whole document.
+
+map    — extracted pages are packed, in order, into windows of at most
+         FACT_WINDOW_TOKENS (estimated at 4 characters per token; an
+         over-long page is split).  Each window is one Claude call, labelled
+         with its page range, and at most FACT_EXTRACTION_CONCURRENCY run at
+         once.
+reduce — window results are concatenated in document order and
+         deduplicated on normalized keys: party name (honorifics dropped),
+         date + event, fact text and statement text.  The first occurrence
+         wins, except that a party's specific role replaces "other".
+
+Wall time grows with windows / concurrency rather than with document length,
+and nothing past the first window is lost to truncation.  FactExtractor runs
+the map step as pages stream in, so ingestion never holds the whole text.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass
+
+from app.config import settings
+from app.services.claude import claude_chat
+from app.services.rate_limiter import Priority
+from app.services.text_extraction import ExtractedChunk
+
+logger = logging.getLogger(__name__)
+
+FACT_EXTRACTION_SYSTEM = """You are a legal document analyst. Extract structured facts from the provided document text.
+Respond ONLY with valid JSON matching the exact format specified. No preamble, no markdown."""
+
+FACT_EXTRACTION_PROMPT = """Analyze this excerpt ({location}) of a longer document and extract:
+
+Document Text:
+{text}
+
+Return JSON:
+{{
+  "parties": [
+    {{"name": "<full name>", "role": "<plaintiff/defendant/expert/witness/other>"}}
+  ],
+  "keyDates": [
+    {{"date": "<date string>", "event": "<what happened>", "source": "<where in doc>"}}
+  ],
+  "disputedFacts": [
+    {{"fact": "<the disputed fact>", "context": "<surrounding context>"}}
+  ],
+  "priorStatements": [
+    {{"content": "<exact statement>", "speaker": "<who said it>", "context": "<context>", "page": <page number or null>}}
+  ]
+}}
+
+If a section has no relevant data, return an empty array for it."""
+
+FACT_KEYS = ("parties", "keyDates", "disputedFacts", "priorStatements")
+
+_CHARS_PER_TOKEN = 4
+_HONORIFIC_RE = re.compile(r"^(?:mr|mrs|ms|dr|prof|hon|judge)\.?\s+", re.IGNORECASE)
+
+
+@dataclass
+class _Window:
+    text: str
+    first_page: int | None
+    last_page: int | None
+
+    @property
+    def location(self) -> str:
+        if self.first_page is None:
+            return "no page numbers"
+        if self.first_page == self.last_page:
+            return f"page {self.first_page}"
+        return f"pages {self.first_page}-{self.last_page}"
+
+
+def empty_facts() -> dict:
+    return {key: [] for key in FACT_KEYS}
+
+
+def _parse(raw: str) -> dict:
+    clean = raw.strip()
+    if clean.startswith("```"):
+        clean = clean.split("\n", 1)[1] if "\n" in clean else clean[3:]
+        if clean.endswith("```"):
+            clean = clean[:-3]
+    data = json.loads(clean)
+    return {key: [item for item in data.get(key) or [] if isinstance(item, dict)] for key in FACT_KEYS}
+
+
+def _norm(text: str | None) -> str:
+    return " ".join(re.sub(r"[^\w\s$%]", " ", (text or "").lower()).split())
+
+
+def fact_key(section: str, item: dict) -> str:
+    """Normalized dedupe key for an extracted item; "" if it has nothing to key on."""
+    if section == "parties":
+        return _norm(_HONORIFIC_RE.sub("", item.get("name") or ""))
+    if section == "keyDates":
+        date, event = _norm(item.get("date")), _norm(item.get("event"))
+        return f"{date}|{event}" if date or event else ""
+    return _norm(item.get("fact" if section == "disputedFacts" else "content"))
+
+
+def merge_duplicate(section: str, kept: dict, item: dict) -> None:
+    """Fold a duplicate into the item already kept: a specific party role replaces "other"."""
+    if section == "parties" and (kept.get("role") or "other") == "other" and item.get("role"):
+        kept["role"] = item["role"]
+
+
+def _merge(results: list[dict]) -> dict:
+    merged = empty_facts()
+    kept: dict[str, dict[str, dict]] = {key: {} for key in FACT_KEYS}
+    for result in results:
+        for section in FACT_KEYS:
+            for item in result[section]:
+                dedupe_key = fact_key(section, item)
+                if not dedupe_key:
+                    continue
+                if dedupe_key in kept[section]:
+                    merge_duplicate(section, kept[section][dedupe_key], item)
+                else:
+                    kept[section][dedupe_key] = dict(item)
+                    merged[section].append(kept[section][dedupe_key])
+    return merged
+
+
+async def _extract_window(window: _Window) -> dict | None:
+    prompt = FACT_EXTRACTION_PROMPT.format(location=window.location, text=window.text)
+    try:
+        raw = await claude_chat(FACT_EXTRACTION_SYSTEM, prompt, max_tokens=2000, priority=Priority.INGESTION)
+        return _parse(raw)
+    except Exception as exc:
+        logger.error("Claude fact extraction failed for %s: %s", window.location, exc)
+        return None
+
+
+class FactExtractor:
+    """Streaming map step: add() pages in order, finish() to reduce.
+
+    A window is sent as soon as it fills, so extraction overlaps text
+    extraction and indexing.  add() waits while FACT_EXTRACTION_CONCURRENCY
+    windows are in flight, so at most that many windows of text are held.
+    """
+
+    def __init__(self):
+        self._limit = settings.FACT_WINDOW_TOKENS * _CHARS_PER_TOKEN
+        self._semaphore = asyncio.Semaphore(settings.FACT_EXTRACTION_CONCURRENCY)
+        self._tasks: list[asyncio.Task] = []
+        self._parts: list[str] = []
+        self._first: int | None = None
+        self._last: int | None = None
+        self._size = 0
+
+    async def _run(self, window: _Window) -> dict | None:
+        try:
+            return await _extract_window(window)
+        finally:
+            self._semaphore.release()
+
+    async def _send(self) -> None:
+        if not self._parts:
+            return
+        window = _Window("\n\n".join(self._parts), self._first, self._last)
+        self._parts, self._first, self._last, self._size = [], None, None, 0
+        await self._semaphore.acquire()
+        self._tasks.append(asyncio.create_task(self._run(window)))
+
+    async def add(self, page: ExtractedChunk) -> None:
+        for start in range(0, len(page.content), self._limit):
+            piece = page.content[start:start + self._limit]
+            if self._size and self._size + len(piece) + 2 > self._limit:
+                await self._send()
+            self._parts.append(f"[Page {page.page}]\n{piece}" if page.page is not None else piece)
+            self._first = page.page if self._first is None else self._first
+            self._last = page.page if page.page is not None else self._last
+            self._size += len(piece) + 2
+
+    async def finish(self) -> tuple[dict, int]:
+        """Wait for every window.  Returns (facts, number of windows that failed)."""
+        await self._send()
+        results = await asyncio.gather(*self._tasks)
+        failed = sum(r is None for r in results)
+        facts = _merge([r for r in results if r is not None])
+        logger.info(
+            "Fact extraction: %d windows (%d failed), %d statements, %d disputed facts",
+            len(results), failed, len(facts["priorStatements"]), len(facts["disputedFacts"]),
+        )
+        return facts, failed
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+
+async def extract_facts(pages: list[ExtractedChunk]) -> tuple[dict, int]:
+    """Extract facts from every page.  Returns (facts, number of windows that failed)."""
+    extractor = FactExtractor()
+    try:
+        for page in pages:
+            await extractor.add(page)
+        return await extractor.finish()
+    except BaseException:
+        extractor.cancel()
+        raise
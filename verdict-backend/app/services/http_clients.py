@@ -0,0 +1,102 @@
+"""
+Application-scoped pooled HTTP clients for the live-path upstreams.
+
+One httpx.AsyncClient per upstream (Databricks retrieval proxy, Nemotron via
+OpenRouter, ElevenLabs REST) so repeated calls reuse warm keep-alive
+connections instead of paying a TCP + TLS handshake every time.
+
+Clients are created lazily on first use (so scripts work without the app
+lifespan), warmed in the FastAPI lifespan, and closed on shutdown.
+"""
+
+import logging
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1"
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _nemotron_headers() -> dict:
+    headers = {
+        "Authorization": f"Bearer {settings.NEMOTRON_API_KEY}",
+        "Content-Type": "application/json",
+    }
+    if settings.NEMOTRON_HTTP_REFERER:
+        headers["HTTP-Referer"] = settings.NEMOTRON_HTTP_REFERER
+    if settings.NEMOTRON_X_TITLE:
+        headers["X-Title"] = settings.NEMOTRON_X_TITLE
+    return headers
+
+
+def _upstream_config(upstream: str) -> dict:
+    if upstream == "databricks":
+        return {
+            "base_url": settings.DATABRICKS_HOST.rstrip("/"),
+            "timeout": settings.DATABRICKS_TIMEOUT_S,
+            "max_connections": settings.DATABRICKS_MAX_CONNECTIONS,
+        }
+    if upstream == "nemotron":
+        return {
+            "base_url": settings.NEMOTRON_BASE_URL,
+            "headers": _nemotron_headers(),
+            "timeout": settings.NEMOTRON_TIMEOUT_MS / 1000,
+            "max_connections": settings.NEMOTRON_MAX_CONNECTIONS,
+        }
+    if upstream == "elevenlabs":
+        return {
+            "base_url": ELEVENLABS_BASE_URL,
+            "headers": {"xi-api-key": settings.ELEVENLABS_API_KEY, "Content-Type": "application/json"},
+            "timeout": settings.ELEVENLABS_TIMEOUT_S,
+            "max_connections": settings.ELEVENLABS_MAX_CONNECTIONS,
+        }
+    raise ValueError(f"Unknown HTTP upstream: {upstream}")
+
+
+def _build_client(upstream: str) -> httpx.AsyncClient:
+    config = _upstream_config(upstream)
+    max_connections = config["max_connections"]
+    return httpx.AsyncClient(
+        base_url=config["base_url"],
+        headers=config.get("headers"),
+        http2=settings.HTTP2_ENABLED and _http2_available(),
+        timeout=httpx.Timeout(config["timeout"], connect=settings.HTTP_CONNECT_TIMEOUT_S),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_S,
+        ),
+    )
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """Return the shared client for an upstream ("databricks" | "nemotron" | "elevenlabs")."""
+    client = _clients.get(upstream)
+    if client is None or client.is_closed:
+        client = _clients[upstream] = _build_client(upstream)
+    return client
+
+
+def init_http_clients() -> None:
+    for upstream in ("databricks", "nemotron", "elevenlabs"):
+        get_http_client(upstream)
+    logger.info("HTTP client pools ready (http2=%s)", settings.HTTP2_ENABLED and _http2_available())
+
+
+async def close_http_clients() -> None:
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
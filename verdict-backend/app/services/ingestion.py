@@ -2,145 +2,348 @@
 Document ingestion pipeline.
 
 Orchestrates the full flow:
-  1. Download file from S3
-  2. Extract text (PDF/DOCX/TXT)
-  3. Claude fact extraction (parties, dates, disputed facts, prior statements)
-  4. Upsert prior statement chunks into Databricks Vector Search
-  5. Update document record with status progression
+  1. Download file from S3 to a temp file (never held in memory)
+  2. Extract text (PDF/DOCX/TXT) page by page
+  3. Claude fact extraction (parties, dates, disputed facts, prior statements),
+     map-reduced over the whole document (app/services/fact_extraction.py)
+  4. Upsert prior statement chunks into the vector index (Databricks or local)
+     and the case's BM25 index
+  5. Update document record with status progression, and the case's facts
+     aggregate (app/services/case_facts.py) as the document leaves and
+     re-enters READY
+
+Steps 2-4 run as a stream: each extracted page is fed to fact extraction and
+to the retrieval chunker, and finished chunks are indexed every
+INGEST_FLUSH_RECORDS records, so memory is bounded by the flush size rather
+than by document length.
+
+Work is deduplicated by content hash.  Per (firm, file hash) an
+IngestionArtifact points at the extracted pages, cached as JSONL in storage,
+and holds the Claude facts, so any document in the firm with the same bytes
+skips both text extraction and fact extraction.  Record ids are the case plus
+the record's content hash, and each document remembers the records it
+references (Document.chunkHashes): a chunk already indexed for any document of
+the case is not sent again, records a re-ingest no longer produces are
+removed, and deleting a document (deindex_document) removes the records no
+other document of the case references.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
+import tempfile
+import uuid
 from datetime import datetime
+from typing import AsyncIterator
 
+from sqlalchemy import func, null, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.document import Document
-from app.services.s3 import download_bytes
-from app.services.text_extraction import extract_text, ExtractedChunk
-from app.services.claude import claude_chat
-from app.services.databricks_vector import upsert_prior_statement
+from app.models.ingestion_artifact import IngestionArtifact
+from app.services.s3 import build_extraction_key, download_to_file_async, upload_file_async
+from app.services.text_extraction import ExtractedChunk, extract_file_stream
+from app.services.chunking import RetrievalChunker
+from app.services.fact_extraction import FactExtractor
+from app.services.databricks_vector import (
+    BatchUpsertResult,
+    build_prior_statement_record,
+    delete_prior_statements,
+    upsert_prior_statements_batch,
+)
+from app.services.lexical_index import delete_records, index_records
+from app.services.retrieval_cache import invalidate_case
+from app.services.case_facts import sync_document
 
 logger = logging.getLogger(__name__)
 
-FACT_EXTRACTION_SYSTEM = """You are a legal document analyst. Extract structured facts from the provided document text.
-Respond ONLY with valid JSON matching the exact format specified. No preamble, no markdown."""
 
-FACT_EXTRACTION_PROMPT = """Analyze this document text and extract:
+def compute_record_hash(record: dict) -> str:
+    """Content hash of a record, ignoring its id and source document, so the
+    same chunk from any document in a case hashes alike."""
+    content = {k: v for k, v in record.items() if k not in ("id", "document_id")}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
 
-Document Text:
-{text}
 
-Return JSON:
-{{
-  "parties": [
-    {{"name": "<full name>", "role": "<plaintiff/defendant/expert/witness/other>"}}
-  ],
-  "keyDates": [
-    {{"date": "<date string>", "event": "<what happened>", "source": "<where in doc>"}}
-  ],
-  "disputedFacts": [
-    {{"fact": "<the disputed fact>", "context": "<surrounding context>"}}
-  ],
-  "priorStatements": [
-    {{"content": "<exact statement>", "speaker": "<who said it>", "context": "<context>"}}
-  ]
-}}
+async def _load_artifact(db: AsyncSession, document: Document) -> IngestionArtifact | None:
+    result = await db.execute(
+        select(IngestionArtifact).where(
+            IngestionArtifact.firm_id == document.firm_id,
+            IngestionArtifact.file_hash == document.file_hash,
+            IngestionArtifact.mime_type == document.mime_type,
+        )
+    )
+    return result.scalar_one_or_none()
+
 
-If a section has no relevant data, return an empty array for it."""
+async def _save_artifact(db: AsyncSession, document: Document, text_key: str | None, facts: dict | None) -> None:
+    """Record the cached text and/or facts for the document's file, keeping
+    whichever of the two an existing artifact already has."""
+    stmt = insert(IngestionArtifact).values(
+        id=str(uuid.uuid4()),
+        firm_id=document.firm_id,
+        file_hash=document.file_hash,
+        mime_type=document.mime_type,
+        page_count=document.page_count,
+        text_key=text_key,
+        extracted_facts=facts if facts is not None else null(),  # SQL NULL, not JSON null
+    )
+    await db.execute(stmt.on_conflict_do_update(
+        constraint="IngestionArtifact_firmId_fileHash_mimeType_key",
+        set_={
+            "textKey": func.coalesce(IngestionArtifact.text_key, stmt.excluded.textKey),
+            "extractedFacts": func.coalesce(IngestionArtifact.extracted_facts, stmt.excluded.extractedFacts),
+        },
+    ))
 
 
-def compute_file_hash(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+async def _case_references(db: AsyncSession, document: Document) -> dict[str, str]:
+    """{recordId: contentHash or ""} over the other documents of the case."""
+    result = await db.execute(
+        select(Document.chunk_hashes).where(
+            Document.case_id == document.case_id,
+            Document.id != document.id,
+            Document.chunk_hashes.is_not(None),
+        )
+    )
+    references: dict[str, str] = {}
+    for hashes in result.scalars():
+        for record_id, content_hash in hashes.items():
+            references[record_id] = references.get(record_id) or content_hash
+    return references
 
 
-async def extract_facts_with_claude(text: str) -> dict:
-    """Use Claude to extract structured facts from document text."""
-    truncated = text[:15000]
-    prompt = FACT_EXTRACTION_PROMPT.format(text=truncated)
+async def _cached_pages(path: str) -> AsyncIterator[ExtractedChunk]:
+    """Pages of a cached extraction (one JSON object per line), read off the loop."""
+    with open(path) as fh:
+        lines = iter(fh)
+        while (line := await asyncio.to_thread(next, lines, None)) is not None:
+            if line.strip():
+                yield ExtractedChunk(**json.loads(line))
 
-    try:
-        raw = await claude_chat(FACT_EXTRACTION_SYSTEM, prompt, max_tokens=2000)
-        clean = raw.strip()
-        if clean.startswith("```"):
-            clean = clean.split("\n", 1)[1] if "\n" in clean else clean[3:]
-            if clean.endswith("```"):
-                clean = clean[:-3]
-        return json.loads(clean)
-    except Exception as exc:
-        logger.error("Claude fact extraction failed: %s", exc)
-        return {
-            "parties": [],
-            "keyDates": [],
-            "disputedFacts": [],
-            "priorStatements": [],
-        }
+
+class _RecordIndexer:
+    """Indexes a document's records in batches as they are produced.
+
+    A record's id is its case and content hash, so a chunk already indexed for
+    this document or any other document of the case (a re-upload, a retry, a
+    second copy of an exhibit) is not sent again; the stored record keeps the
+    document_id of whichever document indexed it first.  `indexed` maps every
+    record id the document references to its content hash, or to "" if the
+    vector index does not have it, so the next run sends it again.
+    """
+
+    def __init__(self, document: Document, case_references: dict[str, str]):
+        self.document = document
+        self.previous = document.chunk_hashes or {}
+        self.case_references = case_references
+        self.pending: dict[str, dict] = {}
+        self.indexed: dict[str, str] = {}
+        self.result = BatchUpsertResult()
+        self.records = 0
+        self.unchanged = 0
+
+    def _known(self, record_id: str) -> str | None:
+        """The record's hash if it is in the vector index, "" if only in BM25."""
+        for source in (self.indexed, self.previous, self.case_references):
+            if source.get(record_id):
+                return source[record_id]
+        if any(record_id in source for source in (self.indexed, self.previous, self.case_references)):
+            return ""
+        return None
+
+    async def add_chunk(self, content: str, page: int | None, line: int | None) -> None:
+        await self.add(build_prior_statement_record(
+            case_id=self.document.case_id,
+            document_id=self.document.id,
+            content=content,
+            page=page,
+            line=line,
+            doc_type=self.document.doc_type,
+        ))
+
+    async def add(self, record: dict) -> None:
+        content_hash = compute_record_hash(record)
+        record["id"] = f"{self.document.case_id}_{content_hash[:32]}"
+        if record["id"] in self.indexed:
+            return
+        self.pending[record["id"]] = record
+        if len(self.pending) >= settings.INGEST_FLUSH_RECORDS:
+            await self.flush()
+
+    async def flush(self) -> None:
+        records, self.pending = list(self.pending.values()), {}
+        if not records:
+            return
+        hashes = {r["id"]: compute_record_hash(r) for r in records}
+        known = {r["id"]: self._known(r["id"]) for r in records}
+        changed = [r for r in records if not known[r["id"]]]
+        result = await upsert_prior_statements_batch(changed)
+        if result.skipped_reason:
+            self.result.skipped_reason = result.skipped_reason
+            failed_ids = {r["id"] for r in changed}
+        else:
+            failed_ids = {f["id"] for f in result.failures}
+        self.indexed.update({rid: "" if rid in failed_ids else h for rid, h in hashes.items()})
+        self.result.upserted += result.upserted
+        self.result.failures += result.failures
+        self.records += len(records)
+        self.unchanged += len(records) - len(changed)
+        await asyncio.to_thread(
+            index_records, self.document.case_id, [r for r in records if known[r["id"]] is None],
+        )
+
+
+async def _remove_records(case_id: str, record_ids: list[str]) -> None:
+    if record_ids:
+        await delete_prior_statements(case_id, record_ids)
+        await asyncio.to_thread(delete_records, case_id, record_ids)
 
 
-async def run_ingestion(document: Document, db: AsyncSession) -> None:
+async def deindex_document(db: AsyncSession, document: Document) -> None:
+    """Remove the records only this document references from the vector and
+    BM25 indexes and drop the case's cached retrievals.  Called before the
+    document is deleted."""
+    references = await _case_references(db, document)
+    await _remove_records(document.case_id, [rid for rid in document.chunk_hashes or {} if rid not in references])
+    await invalidate_case(document.case_id)
+
+
+async def run_ingestion(document: Document, db: AsyncSession, raise_unexpected: bool = False) -> None:
     """Run the full ingestion pipeline for a document.
 
     Updates the document record in-place with status transitions.
     Caller is responsible for committing the session.
+
+    Bad input (ValueError) always marks the document FAILED.  Other errors do
+    too unless raise_unexpected is set, in which case they propagate so the
+    ingestion worker can retry the job.
     """
+    extractor: FactExtractor | None = None
     try:
         document.ingestion_status = "UPLOADING"
         document.ingestion_started_at = datetime.utcnow()
+        await sync_document(db, document)
         await db.commit()
 
-        file_data = download_bytes(document.s3_key)
+        with tempfile.TemporaryDirectory(prefix="verdict-ingest-") as tmp_dir:
+            path = os.path.join(tmp_dir, "source")
+            document.file_hash = await download_to_file_async(document.s3_key, path)
 
-        file_hash = compute_file_hash(file_data)
-        document.file_hash = file_hash
+            document.ingestion_status = "INDEXING"
+            await db.commit()
 
-        document.ingestion_status = "INDEXING"
-        await db.commit()
+            artifact = await _load_artifact(db, document) if settings.INGESTION_DEDUPE_ENABLED else None
+            text_path = os.path.join(tmp_dir, "pages.jsonl")
+            pages_source = None
+            if artifact is not None and artifact.text_key:
+                try:
+                    await download_to_file_async(artifact.text_key, text_path)
+                    pages_source = _cached_pages(text_path)
+                except Exception as exc:
+                    logger.warning("Cached text %s unavailable, re-extracting: %s", artifact.text_key, exc)
+            reuse_text = pages_source is not None
+            reuse_facts = artifact is not None and artifact.extracted_facts is not None
+            if reuse_text or reuse_facts:
+                logger.info(
+                    "Reusing %s of %s for document %s",
+                    "text and facts" if reuse_text and reuse_facts else "text" if reuse_text else "facts",
+                    document.file_hash[:12], document.id,
+                )
+            if not reuse_facts:
+                extractor = FactExtractor()
 
-        chunks = extract_text(file_data, document.mime_type)
-        document.page_count = max(
-            (c.page for c in chunks if c.page is not None), default=len(chunks)
-        )
+            text_out = None
+            if not reuse_text:
+                pages_source = extract_file_stream(path, document.mime_type)
+                if settings.INGESTION_DEDUPE_ENABLED:
+                    text_out = open(text_path, "w")
 
-        full_text = "\n\n".join(c.content for c in chunks)
+            chunker = RetrievalChunker()
+            indexer = _RecordIndexer(document, await _case_references(db, document))
+            pages = chunks = 0
+            last_page = None
+            try:
+                async for page in pages_source:
+                    pages += 1
+                    last_page = page.page if page.page is not None else last_page
+                    if text_out is not None:
+                        text_out.write(json.dumps({"content": page.content, "page": page.page, "line": page.line}) + "\n")
+                    if extractor is not None:
+                        await extractor.add(page)
+                    for chunk in chunker.feed(page):
+                        chunks += 1
+                        await indexer.add_chunk(chunk.content, chunk.page, chunk.line)
+            finally:
+                if text_out is not None:
+                    text_out.close()
+            for chunk in chunker.finish():
+                chunks += 1
+                await indexer.add_chunk(chunk.content, chunk.page, chunk.line)
 
-        extracted_facts = await extract_facts_with_claude(full_text)
+            text_key = None
+            if text_out is not None:
+                text_key = build_extraction_key(document.firm_id, document.file_hash, document.mime_type)
+                try:
+                    await upload_file_async(text_key, text_path, "application/x-ndjson")
+                except Exception as exc:
+                    logger.warning("Caching extracted text for %s failed: %s", document.id, exc)
+                    text_key = None
+
+        document.page_count = last_page if last_page is not None else pages
+        if reuse_facts:
+            extracted_facts, cache_facts = artifact.extracted_facts, None
+        else:
+            extracted_facts, failed_windows = await extractor.finish()
+            extractor = None
+            # Partial results are used but not cached, so the next run retries them.
+            cache_facts = None if failed_windows else extracted_facts
+        if settings.INGESTION_DEDUPE_ENABLED and (text_key or cache_facts is not None):
+            await _save_artifact(db, document, text_key, cache_facts)
         document.extracted_facts = extracted_facts
 
-        upsert_count = 0
-        for chunk in chunks:
-            success = await upsert_prior_statement(
-                case_id=document.case_id,
-                document_id=document.id,
-                content=chunk.content,
-                page=chunk.page,
-                line=chunk.line,
-                doc_type=document.doc_type,
-                witness_name=None,
-            )
-            if success:
-                upsert_count += 1
-
-        if extracted_facts.get("priorStatements"):
-            for stmt in extracted_facts["priorStatements"]:
-                await upsert_prior_statement(
+        for stmt in extracted_facts.get("priorStatements") or []:
+            if stmt.get("content"):
+                await indexer.add(build_prior_statement_record(
                     case_id=document.case_id,
                     document_id=document.id,
                     content=stmt.get("content", ""),
-                    page=None,
-                    line=None,
+                    page=stmt.get("page") if isinstance(stmt.get("page"), int) else None,
                     doc_type=document.doc_type,
                     witness_name=stmt.get("speaker"),
-                )
+                ))
+        await indexer.flush()
+
+        stale = [
+            rid for rid in indexer.previous
+            if rid not in indexer.indexed and rid not in indexer.case_references
+        ]
+        await _remove_records(document.case_id, stale)
+        document.chunk_hashes = indexer.indexed
+        document.indexing_report = {
+            **indexer.result.to_report(),
+            "unchanged": indexer.unchanged,
+            "removed": len(stale),
+            "reusedText": reuse_text,
+            "reusedFacts": reuse_facts,
+        }
+        await invalidate_case(document.case_id)
 
         document.ingestion_status = "READY"
         document.ingestion_completed_at = datetime.utcnow()
         document.ingestion_error = None
+        await sync_document(db, document)
         await db.commit()
 
         logger.info(
-            "Ingestion complete for %s: %d chunks, %d upserted to Databricks",
-            document.id, len(chunks), upsert_count,
+            "Ingestion complete for %s: %d chunks, %d/%d records upserted (%d already indexed), "
+            "text %s, facts %s",
+            document.id, chunks, indexer.result.upserted, indexer.records, indexer.unchanged,
+            "reused" if reuse_text else "extracted", "reused" if reuse_facts else "computed",
         )
 
     except ValueError as exc:
@@ -151,8 +354,14 @@ async def run_ingestion(document: Document, db: AsyncSession) -> None:
         logger.error("Ingestion failed for %s: %s", document.id, exc)
 
     except Exception as exc:
+        if raise_unexpected:
+            raise
         document.ingestion_status = "FAILED"
         document.ingestion_error = f"Unexpected error: {exc}"
         document.ingestion_completed_at = datetime.utcnow()
         await db.commit()
         logger.error("Ingestion failed for %s: %s", document.id, exc)
+
+    finally:
+        if extractor is not None:
+            extractor.cancel()
@@ -0,0 +1,191 @@
+"""
+Durable Redis job queue for document ingestion.
+
+The API process only enqueues; app/worker.py claims and runs jobs.  A job is
+keyed by its document id, so confirming or retrying a document that is
+already queued does not queue it twice.
+
+Keys (all under verdict:jobs:ingest:):
+  job:{id}      hash   documentId, firmId, attempts, enqueuedAt, lastError
+  firm:{firm}   list   job ids waiting for that firm
+  firms         list   round-robin ring of firms with waiting jobs
+  processing    zset   claimed job ids, scored by visibility deadline
+  delayed       zset   job ids waiting out a retry backoff, scored by due time
+  dead          list   {"documentId", "firmId", "error", "at"} of jobs that
+                       exhausted INGEST_MAX_ATTEMPTS (the job itself is
+                       deleted so the document can be retried)
+
+Per-firm fairness: a claim takes one job from the firm at the head of the
+ring and puts that firm at the back.  So one firm's bulk upload interleaves
+with other firms' single documents instead of queueing ahead of them.
+
+Visibility timeout: a claimed job must be heartbeated (extend()) before its
+deadline, or requeue_expired() hands it to another worker.  A worker that
+dies mid-ingestion therefore loses nothing.
+
+Every transition is a Lua script, so a job is never in two states at once.
+"""
+
+import json
+import time
+
+from app.config import settings
+from app.redis_client import redis_client
+
+_PREFIX = "verdict:jobs:ingest:"
+_FIRMS = _PREFIX + "firms"
+_PROCESSING = _PREFIX + "processing"
+_DELAYED = _PREFIX + "delayed"
+_DEAD = _PREFIX + "dead"
+
+# Push a job id onto its firm's list, adding the firm to the ring if it was idle.
+_PUSH_LUA = """
+local function push(prefix, job_id, firm_id)
+  local firm_key = prefix .. 'firm:' .. firm_id
+  if redis.call('RPUSH', firm_key, job_id) == 1 then
+    redis.call('RPUSH', prefix .. 'firms', firm_id)
+  end
+end
+"""
+
+_ENQUEUE = _PUSH_LUA + """
+local prefix, job_id, firm_id, now = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+local job_key = prefix .. 'job:' .. job_id
+if redis.call('EXISTS', job_key) == 1 then return 0 end
+redis.call('HSET', job_key, 'documentId', job_id, 'firmId', firm_id, 'attempts', 0, 'enqueuedAt', now)
+push(prefix, job_id, firm_id)
+return 1
+"""
+
+_CLAIM = """
+local prefix, deadline = ARGV[1], ARGV[2]
+local firm_id = redis.call('LPOP', prefix .. 'firms')
+if not firm_id then return nil end
+local firm_key = prefix .. 'firm:' .. firm_id
+local job_id = redis.call('LPOP', firm_key)
+if redis.call('LLEN', firm_key) > 0 then
+  redis.call('RPUSH', prefix .. 'firms', firm_id)
+end
+if not job_id then return nil end
+local attempts = redis.call('HINCRBY', prefix .. 'job:' .. job_id, 'attempts', 1)
+redis.call('ZADD', prefix .. 'processing', deadline, job_id)
+return {job_id, firm_id, attempts}
+"""
+
+_REQUEUE_EXPIRED = _PUSH_LUA + """
+local prefix, now = ARGV[1], ARGV[2]
+local expired = redis.call('ZRANGEBYSCORE', prefix .. 'processing', '-inf', now)
+for _, job_id in ipairs(expired) do
+  redis.call('ZREM', prefix .. 'processing', job_id)
+  local firm_id = redis.call('HGET', prefix .. 'job:' .. job_id, 'firmId')
+  if firm_id then push(prefix, job_id, firm_id) end
+end
+return #expired
+"""
+
+_PROMOTE_DELAYED = _PUSH_LUA + """
+local prefix, now = ARGV[1], ARGV[2]
+local due = redis.call('ZRANGEBYSCORE', prefix .. 'delayed', '-inf', now)
+for _, job_id in ipairs(due) do
+  redis.call('ZREM', prefix .. 'delayed', job_id)
+  local firm_id = redis.call('HGET', prefix .. 'job:' .. job_id, 'firmId')
+  if firm_id then push(prefix, job_id, firm_id) end
+end
+return #due
+"""
+
+# Only the current holder (still in processing) may move a job on.
+_RETRY = """
+local prefix, job_id, due, err = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+if redis.call('ZREM', prefix .. 'processing', job_id) == 0 then return 0 end
+redis.call('HSET', prefix .. 'job:' .. job_id, 'lastError', err)
+redis.call('ZADD', prefix .. 'delayed', due, job_id)
+return 1
+"""
+
+_BURY = """
+local prefix, job_id, entry = ARGV[1], ARGV[2], ARGV[3]
+if redis.call('ZREM', prefix .. 'processing', job_id) == 0 then return 0 end
+redis.call('DEL', prefix .. 'job:' .. job_id)
+redis.call('RPUSH', prefix .. 'dead', entry)
+redis.call('LTRIM', prefix .. 'dead', -1000, -1)
+return 1
+"""
+
+_ACK = """
+local prefix, job_id = ARGV[1], ARGV[2]
+if redis.call('ZREM', prefix .. 'processing', job_id) == 0 then return 0 end
+redis.call('DEL', prefix .. 'job:' .. job_id)
+return 1
+"""
+
+_scripts: dict = {}
+
+
+async def _call(name: str, source: str, *args) -> object:
+    if name not in _scripts:
+        _scripts[name] = redis_client.register_script(source)
+    return await _scripts[name](args=[_PREFIX, *args])
+
+
+async def enqueue_ingestion(document_id: str, firm_id: str) -> bool:
+    """Queue a document for ingestion.  Returns False if it is already queued or running."""
+    return bool(await _call("enqueue", _ENQUEUE, document_id, firm_id, time.time()))
+
+
+async def claim() -> tuple[str, str, int] | None:
+    """Take the next job fairly across firms: (document_id, firm_id, attempt) or None."""
+    row = await _call("claim", _CLAIM, time.time() + settings.INGEST_VISIBILITY_TIMEOUT_S)
+    if not row:
+        return None
+    job_id, firm_id, attempts = row
+    return job_id, firm_id, int(attempts)
+
+
+async def extend(job_id: str) -> None:
+    """Heartbeat: push the job's visibility deadline out while it is still running."""
+    await redis_client.zadd(
+        _PROCESSING, {job_id: time.time() + settings.INGEST_VISIBILITY_TIMEOUT_S}, xx=True,
+    )
+
+
+async def ack(job_id: str) -> None:
+    await _call("ack", _ACK, job_id)
+
+
+async def retry_later(job_id: str, attempt: int, error: str) -> None:
+    delay = settings.INGEST_RETRY_BASE_S * 2 ** (attempt - 1)
+    await _call("retry", _RETRY, job_id, time.time() + delay, error[:500])
+
+
+async def bury(job_id: str, firm_id: str, error: str) -> None:
+    entry = json.dumps({"documentId": job_id, "firmId": firm_id, "error": error[:500], "at": time.time()})
+    await _call("bury", _BURY, job_id, entry)
+
+
+async def requeue_expired() -> int:
+    return int(await _call("requeue_expired", _REQUEUE_EXPIRED, time.time()))
+
+
+async def promote_delayed() -> int:
+    return int(await _call("promote_delayed", _PROMOTE_DELAYED, time.time()))
+
+
+async def is_queued(document_id: str) -> bool:
+    return bool(await redis_client.exists(_PREFIX + "job:" + document_id))
+
+
+async def queue_stats() -> dict:
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.lrange(_FIRMS, 0, -1)
+        pipe.zcard(_PROCESSING)
+        pipe.zcard(_DELAYED)
+        pipe.llen(_DEAD)
+        firms, processing, delayed, dead = await pipe.execute()
+    waiting = 0
+    if firms:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for firm_id in firms:
+                pipe.llen(_PREFIX + "firm:" + firm_id)
+            waiting = sum(await pipe.execute())
+    return {"waiting": waiting, "firmsWaiting": len(firms), "processing": processing, "delayed": delayed, "dead": dead}
@@ -0,0 +1,199 @@
+"""
+Per-case BM25 inverted index over ingested prior-statement chunks.
+
+Contradictions usually hinge on exact tokens — dates, exhibit numbers, shift
+hours, names — that embeddings blur together.  search_prior_statements fuses
+this index with the vector backend via reciprocal-rank fusion
+(databricks_vector.py).
+
+run_ingestion adds each document's records incrementally.  A case's index is
+an append-only JSONL log under LEXICAL_INDEX_DIR: one line per added record
+(just its term frequencies; postings are rebuilt on load) or removed id, the
+last line for an id winning.  A flush appends only its own batch, and each
+process keeps the index in memory, reading just the lines appended since its
+last look.  The log is compacted once dead lines outnumber live records.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from pathlib import Path
+
+from app.config import settings
+
+# Dates / decimals / section numbers first so "03/14/2021", "14.5" and "4.2"
+# stay single tokens.
+_TOKEN_RE = re.compile(r"\d+(?:[./:-]\d+)+|[a-z0-9]+(?:'[a-z]+)?")
+STOPWORDS = frozenset(
+    "a an and are as at be but by did do does for from had has have he her his i if in into "
+    "is it its me my no not of on or our she so that the their them then there they this to "
+    "was we were what when where which who why will with you your".split()
+)
+
+K1 = 1.5
+B = 0.75
+
+_COMPACT_MIN_LINES = 1024
+
+
+def tokenize(text: str, stopwords: frozenset[str] = STOPWORDS) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in stopwords]
+
+
+class CaseLexicalIndex:
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self._inode: int | None = None
+        self._offset = 0
+        self._lines = 0
+        self.docs: dict[str, dict] = {}           # id -> {"record", "tf", "len"}
+        self.postings: dict[str, dict[str, int]] = {}
+        self.total_len = 0
+
+    def _index_doc(self, doc_id: str, doc: dict) -> None:
+        self.docs[doc_id] = doc
+        self.total_len += doc["len"]
+        for term, count in doc["tf"].items():
+            self.postings.setdefault(term, {})[doc_id] = count
+
+    def _unindex_doc(self, doc_id: str) -> None:
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self.total_len -= doc["len"]
+        for term in doc["tf"]:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.postings[term]
+
+    def _apply(self, entry: dict) -> None:
+        self._unindex_doc(entry["id"])
+        if not entry.get("deleted"):
+            self._index_doc(entry["id"], {k: entry[k] for k in ("record", "tf", "len")})
+        self._lines += 1
+
+    def _load(self) -> None:
+        """Catch up on lines appended since the last load (all of them if the
+        log was compacted and replaced)."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self.docs, self.postings, self.total_len = {}, {}, 0
+            self._inode, self._offset, self._lines = stat.st_ino, 0, 0
+        if stat.st_size == self._offset:
+            return
+        with self.path.open("rb") as fh:
+            fh.seek(self._offset)
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # another writer's append still in progress
+                self._offset += len(line)
+                if line.strip():
+                    self._apply(json.loads(line))
+
+    def _append(self, entries: list[dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as fh:
+            fh.write("".join(json.dumps(e, default=str) + "\n" for e in entries))
+        self._load()
+        if self._lines > max(2 * len(self.docs), _COMPACT_MIN_LINES):
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w") as fh:
+            for doc_id, doc in self.docs.items():
+                fh.write(json.dumps({"id": doc_id, **doc}, default=str) + "\n")
+        os.replace(tmp, self.path)
+        self._inode = None
+        self._load()
+
+    def add(self, records: list[dict]) -> None:
+        entries = []
+        for record in records:
+            tokens = tokenize(record.get("content") or "")
+            tf: dict[str, int] = {}
+            for token in tokens:
+                tf[token] = tf.get(token, 0) + 1
+            entries.append({"id": record["id"], "record": record, "tf": tf, "len": len(tokens)})
+        with self.lock:
+            self._load()
+            self._append(entries)
+
+    def delete(self, ids: list[str]) -> None:
+        with self.lock:
+            self._load()
+            entries = [{"id": doc_id, "deleted": True} for doc_id in ids if doc_id in self.docs]
+            if entries:
+                self._append(entries)
+
+    def search(self, query: str, top_k: int) -> list[tuple[float, dict]]:
+        with self.lock:
+            self._load()
+            n = len(self.docs)
+            if not n:
+                return []
+            avg_len = self.total_len / n or 1.0
+            scores: dict[str, float] = {}
+            for term in set(tokenize(query)):
+                posting = self.postings.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+                for doc_id, tf in posting.items():
+                    norm = tf + K1 * (1 - B + B * self.docs[doc_id]["len"] / avg_len)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / norm
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+            return [(score, self.docs[doc_id]["record"]) for doc_id, score in ranked]
+
+
+_indexes: dict[str, CaseLexicalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _case_index(case_id: str) -> CaseLexicalIndex:
+    safe_case = re.sub(r"[^A-Za-z0-9_.-]", "_", case_id)
+    with _indexes_lock:
+        if case_id not in _indexes:
+            _indexes[case_id] = CaseLexicalIndex(Path(settings.LEXICAL_INDEX_DIR) / f"{safe_case}.jsonl")
+        return _indexes[case_id]
+
+
+def index_records(case_id: str, records: list[dict]) -> None:
+    """Add or replace records (by "id") in a case's index.  Blocking; run in a thread."""
+    records = [r for r in records if r.get("id") and r.get("content")]
+    if records:
+        _case_index(case_id).add(records)
+
+
+def delete_records(case_id: str, ids: list[str]) -> None:
+    """Remove records (by "id") from a case's index.  Blocking; run in a thread."""
+    if ids:
+        _case_index(case_id).delete(ids)
+
+
+def search_lexical(case_id: str, query: str, top_k: int) -> list[tuple[float, dict]]:
+    """BM25 top-k for a case as (score, record) pairs.  Blocking; run in a thread."""
+    return _case_index(case_id).search(query, top_k)
+
+
+def reciprocal_rank_fusion(rankings: list[list[dict]], k: int = 60) -> list[dict]:
+    """Fuse ranked result lists: score = sum(1 / (k + rank)) across lists.
+
+    Records are matched on (content, page, line) since the vector proxy does
+    not return record ids.
+    """
+    fused: dict[tuple, list] = {}
+    for ranking in rankings:
+        for rank, record in enumerate(ranking, start=1):
+            key = ((record.get("content") or "").strip(), record.get("page"), record.get("line"))
+            entry = fused.setdefault(key, [0.0, record])
+            entry[0] += 1.0 / (k + rank)
+    return [record for _, record in sorted(fused.values(), key=lambda e: e[0], reverse=True)]
@@ -0,0 +1,58 @@
+"""
+Per-session live feed over Redis pub/sub.
+
+Every transcript event, alert and status change in a live session is published
+to `verdict:session:{id}:live`.  The SSE endpoint in routers/sessions.py
+subscribes to that channel, so any uvicorn worker can fan a session's feed out
+to its connected viewers regardless of which worker handled the write.
+
+Publishing is best-effort: a Redis outage must never fail a live turn, the
+viewer just falls back to GET /live-state.
+"""
+
+import asyncio
+import json
+import logging
+from typing import AsyncGenerator
+
+from app.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 15.0
+
+
+def _channel(session_id: str) -> str:
+    return f"verdict:session:{session_id}:live"
+
+
+async def publish_live_event(session_id: str, event_type: str, payload: dict) -> None:
+    message = json.dumps({"type": event_type, **payload}, default=str)
+    try:
+        await redis_client.publish(_channel(session_id), message)
+    except Exception as exc:
+        logger.warning("Live publish failed for session %s: %s", session_id, exc)
+
+
+async def subscribe_live_events(session_id: str) -> AsyncGenerator[dict | None, None]:
+    """Yield messages published for a session.
+
+    Yields None every HEARTBEAT_SECONDS of silence so the SSE writer can emit
+    a keep-alive and notice disconnected clients.
+    """
+    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(_channel(session_id))
+    try:
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        while True:
+            message = await pubsub.get_message(timeout=1.0)
+            if message and message.get("type") == "message":
+                last_sent = loop.time()
+                yield json.loads(message["data"])
+            elif loop.time() - last_sent >= HEARTBEAT_SECONDS:
+                last_sent = loop.time()
+                yield None
+    finally:
+        await pubsub.unsubscribe(_channel(session_id))
+        await pubsub.aclose()
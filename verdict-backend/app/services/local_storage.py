@@ -0,0 +1,152 @@
+"""
+Local-disk object storage (STORAGE_BACKEND=local).
+
+Objects live at <root>/objects/<key>, with their content type in
+<root>/meta/<key>.json.  Writes stream into a temp file beside the target and
+os.replace() it into place, so readers never see a partial object.
+
+Presigned URLs point at app/routers/storage.py and carry an expiry and an
+HMAC-SHA256 signature over (method, key, expiry, content type), keyed with
+STORAGE_URL_SECRET (JWT_SECRET when unset).  Like S3, an upload URL is only
+valid for the content type it was issued for.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import quote, urlencode
+
+from app.config import settings
+from app.services.storage_backends import ObjectInfo, StorageBackend
+
+_READ_CHUNK = 256 * 1024
+
+
+def _secret() -> bytes:
+    return (settings.STORAGE_URL_SECRET or settings.JWT_SECRET).encode()
+
+
+def sign_url(method: str, key: str, expires: int, content_type: str = "") -> str:
+    message = f"{method.upper()}\n{key}\n{expires}\n{content_type}".encode()
+    digest = hmac.new(_secret(), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def verify_url(method: str, key: str, expires: int, signature: str, content_type: str = "") -> bool:
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(sign_url(method, key, expires, content_type), signature)
+
+
+class _ObjectWriter:
+    """Incremental write to a temp file, moved into place by commit()."""
+
+    def __init__(self, path: Path, meta_path: Path, content_type: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+        self._fh = os.fdopen(fd, "wb")
+        self._path, self._meta_path, self._content_type = path, meta_path, content_type
+
+    def write(self, chunk: bytes) -> None:
+        self._fh.write(chunk)
+
+    def commit(self) -> None:
+        self._fh.close()
+        os.replace(self._tmp, self._path)
+        self._meta_path.parent.mkdir(parents=True, exist_ok=True)
+        self._meta_path.write_text(json.dumps({"contentType": self._content_type}))
+
+    def abort(self) -> None:
+        self._fh.close()
+        try:
+            os.unlink(self._tmp)
+        except FileNotFoundError:
+            pass
+
+
+class LocalStorageBackend(StorageBackend):
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = Path(root).resolve()
+        self.objects = self.root / "objects"
+        self.meta = self.root / "meta"
+
+    def _path(self, base: Path, key: str, suffix: str = "") -> Path:
+        path = (base / (key + suffix)).resolve()
+        if not path.is_relative_to(base.resolve()) or path == base.resolve():
+            raise ValueError(f"Invalid storage key: {key!r}")
+        return path
+
+    def object_path(self, key: str) -> Path:
+        return self._path(self.objects, key)
+
+    def open_writer(self, key: str, content_type: str) -> _ObjectWriter:
+        """Raises ValueError for keys that escape the storage root."""
+        return _ObjectWriter(self.object_path(key), self._path(self.meta, key, ".json"), content_type)
+
+    def put_stream(self, key: str, chunks: Iterable[bytes], content_type: str) -> None:
+        writer = self.open_writer(key, content_type)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.commit()
+
+    def get(self, key: str) -> bytes:
+        return self.object_path(key).read_bytes()
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        with open(self.object_path(key), "rb") as fh:
+            fh.seek(start)
+            return fh.read(end - start + 1)
+
+    def get_to_file(self, key: str, path: str) -> None:
+        shutil.copyfile(self.object_path(key), path)
+
+    def iter_range(self, key: str, start: int, end: int) -> Iterator[bytes]:
+        """Yield bytes start..end inclusive in bounded chunks (for streaming responses)."""
+        with open(self.object_path(key), "rb") as fh:
+            fh.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = fh.read(min(_READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def stat(self, key: str) -> ObjectInfo | None:
+        try:
+            size = self.object_path(key).stat().st_size
+        except (FileNotFoundError, ValueError):
+            return None
+        try:
+            content_type = json.loads(self._path(self.meta, key, ".json").read_text())["contentType"]
+        except (FileNotFoundError, ValueError, KeyError):
+            content_type = "application/octet-stream"
+        return ObjectInfo(size=size, content_type=content_type)
+
+    def delete(self, key: str) -> None:
+        for path in (self.object_path(key), self._path(self.meta, key, ".json")):
+            path.unlink(missing_ok=True)
+
+    def _url(self, method: str, key: str, expires_in: int, content_type: str = "") -> str:
+        expires = int(time.time()) + expires_in
+        query = urlencode({"expires": expires, "sig": sign_url(method, key, expires, content_type)})
+        return f"{settings.PUBLIC_API_URL.rstrip('/')}/api/v1/storage/{quote(key)}?{query}"
+
+    def presigned_upload_url(self, key: str, content_type: str, expires_in: int) -> str:
+        return self._url("PUT", key, expires_in, content_type)
+
+    def presigned_download_url(self, key: str, expires_in: int) -> str:
+        return self._url("GET", key, expires_in)
@@ -0,0 +1,241 @@
+"""
+Local embedded vector index (VECTOR_BACKEND=local).
+
+Each (index, case) pair is a directory under LOCAL_VECTOR_DIR holding:
+
+  vectors.f32   — float32 matrix, one L2-normalized row per record, opened with
+                  np.memmap so only the pages touched by a search are read
+  records.jsonl — the record metadata, row-aligned with vectors.f32; a
+                  deletion is a {"id", "deleted": true} line over a zero row
+
+Case-independent indexes (FRE rules) live under the "_global" partition.  A
+search is a single matrix-vector product followed by argpartition for the
+top-k, so a case with tens of thousands of chunks answers in well under a
+millisecond.  Both files are append-only: an upsert or delete appends its own
+rows, the last row for an id wins, and superseded rows are masked out of
+searches.  Once dead rows outnumber live ones the partition is compacted and
+swapped in atomically.
+
+Embeddings are signed feature-hashed unigrams + bigrams with sublinear term
+frequency — no model download and deterministic across processes.  The score
+is lexical-semantic rather than neural, but keeps the same filters, columns
+and ranking contract as the Databricks proxy.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from app.config import settings
+from app.services.vector_backends import VectorBackend
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_GLOBAL_PARTITION = "_global"
+_COMPACT_MIN_ROWS = 1024
+
+
+def _hash_feature(feature: str, dim: int) -> tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+    return digest % dim, 1.0 if (digest >> 63) & 1 else -1.0
+
+
+def embed_texts(texts: list[str], dim: int | None = None) -> np.ndarray:
+    """Embed a batch of texts into an (n, dim) float32 matrix of unit rows."""
+    dim = dim or settings.LOCAL_VECTOR_DIM
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        tokens = _TOKEN_RE.findall(text.lower())
+        counts: dict[str, int] = {}
+        for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            counts[feature] = counts.get(feature, 0) + 1
+        for feature, count in counts.items():
+            col, sign = _hash_feature(feature, dim)
+            matrix[row, col] += sign * (1.0 + np.log(count))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def _matches(record: dict, filters: dict) -> bool:
+    return all(str(record.get(k)).lower() == str(v).lower() for k, v in filters.items())
+
+
+class _Partition:
+    """One memory-mapped (index, case) matrix plus its row-aligned records."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self._inode: int | None = None
+        self._offset = 0
+        self.records: list[dict] = []
+        self.rows: dict[str, int] = {}              # live id -> row
+        self.live = np.zeros(0, dtype=bool)
+        self.vectors: np.ndarray | None = None
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.path / "vectors.f32"
+
+    @property
+    def _records_file(self) -> Path:
+        return self.path / "records.jsonl"
+
+    def _load(self) -> None:
+        """Catch up on rows appended since the last load (all of them if the
+        partition was compacted and replaced)."""
+        try:
+            stat = self._records_file.stat()
+        except FileNotFoundError:
+            self._inode, self._offset = None, 0
+            self.records, self.rows, self.live, self.vectors = [], {}, np.zeros(0, dtype=bool), None
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._inode, self._offset = stat.st_ino, 0
+            self.records, self.rows, self.live = [], {}, np.zeros(0, dtype=bool)
+        if stat.st_size == self._offset and self.vectors is not None:
+            return
+        start = len(self.records)
+        with self._records_file.open("rb") as fh:
+            fh.seek(self._offset)
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # another writer's append still in progress
+                self._offset += len(line)
+                if line.strip():
+                    self.records.append(json.loads(line))
+        live = np.ones(len(self.records), dtype=bool)
+        live[:start] = self.live
+        for row in range(start, len(self.records)):
+            record = self.records[row]
+            previous = self.rows.pop(record["id"], None)
+            if previous is not None:
+                live[previous] = False
+            if record.get("deleted"):
+                live[row] = False
+            else:
+                self.rows[record["id"]] = row
+        self.live = live
+        # Vectors are appended before records, so the matrix always covers them.
+        self.vectors = np.memmap(
+            self._vectors_file, dtype=np.float32, mode="r",
+            shape=(len(self.records), settings.LOCAL_VECTOR_DIM),
+        ) if self.records else None
+
+    def search_many(self, query_vectors: np.ndarray, top_k: int, filters: dict) -> list[list[tuple[float, dict]]]:
+        with self.lock:
+            self._load()
+            records, vectors, live = self.records, self.vectors, self.live
+        if vectors is None:
+            return [[] for _ in range(len(query_vectors))]
+
+        scores = query_vectors @ vectors.T                     # (queries, rows) cosine
+        mask = live.copy()
+        if filters:
+            mask &= np.array([_matches(r, filters) for r in records], dtype=bool)
+        scores[:, ~mask] = -np.inf
+
+        k = min(top_k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in range(len(query_vectors))]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for q, candidates in enumerate(top):
+            ordered = candidates[np.argsort(-scores[q, candidates])]
+            results.append([
+                (float(scores[q, i]), records[i]) for i in ordered if np.isfinite(scores[q, i])
+            ])
+        return results
+
+    def _append(self, records: list[dict], vectors: np.ndarray) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Vectors first: a reader never sees a record without its row.
+        with self._vectors_file.open("ab") as fh:
+            fh.write(vectors.astype(np.float32).tobytes())
+        with self._records_file.open("a") as fh:
+            fh.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+        self._load()
+        if len(self.records) > max(2 * len(self.rows), _COMPACT_MIN_ROWS):
+            self._compact()
+
+    def _compact(self) -> None:
+        rows = sorted(self.rows.values())
+        tmp_vectors = self._vectors_file.with_suffix(".tmp")
+        tmp_records = self._records_file.with_suffix(".tmp")
+        np.ascontiguousarray(self.vectors[rows]).tofile(tmp_vectors)
+        with tmp_records.open("w") as fh:
+            for row in rows:
+                fh.write(json.dumps(self.records[row], default=str) + "\n")
+        os.replace(tmp_vectors, self._vectors_file)
+        os.replace(tmp_records, self._records_file)
+        self._inode = None
+        self._load()
+
+    def upsert(self, records: list[dict]) -> None:
+        vectors = embed_texts([r.get("content") or "" for r in records])
+        with self.lock:
+            self._load()
+            self._append(records, vectors)
+
+    def delete(self, ids: list[str]) -> None:
+        with self.lock:
+            self._load()
+            markers = [{"id": i, "deleted": True} for i in ids if i in self.rows]
+            if markers:
+                self._append(markers, np.zeros((len(markers), settings.LOCAL_VECTOR_DIM), dtype=np.float32))
+
+
+class LocalVectorBackend(VectorBackend):
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self._partitions: dict[Path, _Partition] = {}
+        self._partitions_lock = threading.Lock()
+
+    def _partition(self, index: str, case_id: str | None) -> _Partition:
+        safe_index = re.sub(r"[^A-Za-z0-9_.-]", "_", index)
+        safe_case = re.sub(r"[^A-Za-z0-9_.-]", "_", case_id) if case_id else _GLOBAL_PARTITION
+        path = self.root / safe_index / safe_case
+        with self._partitions_lock:
+            if path not in self._partitions:
+                self._partitions[path] = _Partition(path)
+            return self._partitions[path]
+
+    def search_many(
+        self,
+        index: str,
+        queries: list[str],
+        top_k: int,
+        filters: dict | None = None,
+    ) -> list[list[tuple[float, dict]]]:
+        """Batched cosine top-k: one matrix product for all queries.
+
+        A case_id filter selects the partition; other filters mask rows.
+        """
+        filters = dict(filters or {})
+        partition = self._partition(index, filters.pop("case_id", None))
+        return partition.search_many(embed_texts(queries), top_k, filters)
+
+    async def search(self, index, query, top_k, columns, filters=None) -> list[dict]:
+        [hits] = await asyncio.to_thread(self.search_many, index, [query], top_k, filters)
+        return [{**{c: record.get(c) for c in columns}, "score": score} for score, record in hits]
+
+    async def upsert(self, index, records) -> list[str]:
+        rejected = [str(r.get("id")) for r in records if not r.get("id")]
+        by_partition: dict[str | None, list[dict]] = {}
+        for record in records:
+            if record.get("id"):
+                by_partition.setdefault(record.get("case_id"), []).append(record)
+        for case_id, batch in by_partition.items():
+            await asyncio.to_thread(self._partition(index, case_id).upsert, batch)
+        return rejected
+
+    async def delete(self, index, ids, case_id=None) -> None:
+        await asyncio.to_thread(self._partition(index, case_id).delete, ids)
@@ -1,12 +1,59 @@
-import httpx
+"""
+Nemotron (via OpenRouter) contradiction scoring.
+
+score_contradiction is called once per answer by the Inconsistency Detector.
+With many concurrent practice sessions those are lots of tiny completions, so
+calls are micro-batched: requests arriving within NEMOTRON_BATCH_WINDOW_MS of
+each other (up to NEMOTRON_BATCH_MAX_SIZE) are scored in one structured
+prompt and the results fanned back to each caller.  A lone request in its
+window is sent with the original single-answer prompt, as is any item the
+batch response omitted or returned malformed (or every item, if the response
+could not be parsed at all).
+"""
+
+import asyncio
 import json
 import logging
+import time
+from dataclasses import dataclass, field
+
 from app.config import settings
+from app.services.circuit_breaker import get_breaker
+from app.services.http_clients import get_http_client
+from app.services.rate_limiter import Priority, estimate_tokens, governed
 
 logger = logging.getLogger(__name__)
 
 
-async def score_contradiction(
+def _format_statements(prior_statements: list[dict]) -> str:
+    return chr(10).join(f'[{i}] "{s.get("content", "")}"' for i, s in enumerate(prior_statements))
+
+
+def _parse_json(content: str):
+    clean = content.strip()
+    if clean.startswith("```"):
+        clean = clean.split("\n", 1)[1] if "\n" in clean else clean[3:]
+        if clean.endswith("```"):
+            clean = clean[:-3]
+    return json.loads(clean.strip())
+
+
+async def _complete(prompt: str, max_tokens: int) -> str:
+    breaker = get_breaker("nemotron")
+    breaker.check()
+    async with governed("nemotron", Priority.DETECTION, estimate_tokens(prompt, max_tokens=max_tokens)):
+        async with breaker.guard():
+            resp = await get_http_client("nemotron").post("/chat/completions", json={
+                "model": settings.NEMOTRON_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": max_tokens,
+                "temperature": 0.1,
+            })
+            resp.raise_for_status()
+            return resp.json()["choices"][0]["message"]["content"]
+
+
+async def _score_single(
     witness_answer: str,
     prior_statements: list[dict],
     case_context: str,
@@ -19,7 +66,7 @@ Witness answer just given:
 \"{witness_answer}\"
 
 Prior sworn statements on record:
-{chr(10).join(f'[{i}] "{s.get("content", "")}"' for i, s in enumerate(prior_statements))}
+{_format_statements(prior_statements)}
 
 Respond ONLY with JSON:
 {{
@@ -27,32 +74,167 @@ Respond ONLY with JSON:
   "best_match_index": <integer index of most contradicted statement, or -1>,
   "reasoning": "<one sentence>"
 }}"""
+    return _parse_json(await _complete(prompt, max_tokens=200))
 
-    headers = {
-        "Authorization": f"Bearer {settings.NEMOTRON_API_KEY}",
-        "Content-Type": "application/json",
+
+async def _score_many(requests: list["_ScoreRequest"]) -> list[dict | None]:
+    """Score several independent answers in one completion.
+
+    Returns one result per request, None where the model omitted an item or
+    returned it without a numeric contradiction_confidence.
+    """
+    items = "\n\n".join(
+        f"""### Item {n}
+Case context: {r.case_context}
+Witness answer just given:
+\"{r.witness_answer}\"
+Prior sworn statements on record:
+{_format_statements(r.prior_statements)}"""
+        for n, r in enumerate(requests)
+    )
+    prompt = f"""You are analyzing witness depositions for contradictions.
+Each item below is an independent deposition — score each one on its own.
+
+{items}
+
+Respond ONLY with a JSON array, one object per item:
+[
+  {{
+    "item": <item number>,
+    "contradiction_confidence": <float 0.0-1.0>,
+    "best_match_index": <integer index of most contradicted statement in that item, or -1>,
+    "reasoning": "<one sentence>"
+  }}
+]"""
+    parsed = _parse_json(await _complete(prompt, max_tokens=160 * len(requests) + 40))
+    if not isinstance(parsed, list):
+        raise ValueError("Nemotron batch response is not a JSON array")
+    by_item = {
+        row.get("item"): row for row in parsed
+        if isinstance(row, dict) and isinstance(row.get("contradiction_confidence"), (int, float))
     }
-    if settings.NEMOTRON_HTTP_REFERER:
-        headers["HTTP-Referer"] = settings.NEMOTRON_HTTP_REFERER
-    if settings.NEMOTRON_X_TITLE:
-        headers["X-Title"] = settings.NEMOTRON_X_TITLE
-
-    async with httpx.AsyncClient(
-        base_url=settings.NEMOTRON_BASE_URL,
-        headers=headers,
-        timeout=settings.NEMOTRON_TIMEOUT_MS / 1000,
-    ) as client:
-        resp = await client.post("/chat/completions", json={
-            "model": settings.NEMOTRON_MODEL,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 200,
-            "temperature": 0.1,
-        })
-        resp.raise_for_status()
-        content = resp.json()["choices"][0]["message"]["content"]
-        clean = content.strip()
-        if clean.startswith("```"):
-            clean = clean.split("\n", 1)[1] if "\n" in clean else clean[3:]
-            if clean.endswith("```"):
-                clean = clean[:-3]
-        return json.loads(clean.strip())
+    return [by_item.get(n) for n in range(len(requests))]
+
+
+@dataclass
+class _ScoreRequest:
+    witness_answer: str
+    prior_statements: list[dict]
+    case_context: str
+    future: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class _ContradictionBatcher:
+    def __init__(self):
+        self._pending: list[_ScoreRequest] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.stats = {
+            "batches": 0, "items": 0, "maxSize": 0, "failures": 0, "fallbacks": 0, "cancelled": 0,
+            "totalLatencyMs": 0.0,
+        }
+
+    async def submit(self, request: _ScoreRequest) -> dict:
+        self._pending.append(request)
+        if len(self._pending) >= settings.NEMOTRON_BATCH_MAX_SIZE:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                settings.NEMOTRON_BATCH_WINDOW_MS / 1000, self._flush,
+            )
+        try:
+            return await request.future
+        except asyncio.CancelledError:
+            # A caller that gave up (e.g. a lost hedge) is not sent or billed.
+            if request in self._pending:
+                self._pending.remove(request)
+                self.stats["cancelled"] += 1
+                if not self._pending and self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            raise
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = [r for r in self._pending if not r.future.done()]
+        self.stats["cancelled"] += len(self._pending) - len(batch)
+        self._pending = []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[_ScoreRequest]) -> None:
+        start = time.perf_counter()
+        try:
+            if len(batch) == 1:
+                r = batch[0]
+                results = [await _score_single(r.witness_answer, r.prior_statements, r.case_context)]
+            else:
+                try:
+                    results = await _score_many(batch)
+                except ValueError as exc:
+                    logger.warning("Unparseable Nemotron batch response, scoring %d items singly: %s", len(batch), exc)
+                    results = [None] * len(batch)
+        except Exception as exc:
+            self.stats["failures"] += 1
+            for r in batch:
+                if not r.future.done():
+                    r.future.set_exception(exc)
+            return
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.stats["batches"] += 1
+            self.stats["items"] += len(batch)
+            self.stats["maxSize"] = max(self.stats["maxSize"], len(batch))
+            self.stats["totalLatencyMs"] += latency_ms
+            logger.debug("Contradiction batch: %d items in %.0fms", len(batch), latency_ms)
+
+        retry = []
+        for r, result in zip(batch, results):
+            if r.future.done():
+                continue
+            if result is None:
+                retry.append(r)
+            else:
+                r.future.set_result(result)
+        if not retry:
+            return
+
+        self.stats["fallbacks"] += len(retry)
+        singles = await asyncio.gather(
+            *(_score_single(r.witness_answer, r.prior_statements, r.case_context) for r in retry),
+            return_exceptions=True,
+        )
+        for r, result in zip(retry, singles):
+            if r.future.done():
+                continue
+            if isinstance(result, BaseException):
+                r.future.set_exception(result)
+            else:
+                r.future.set_result(result)
+
+
+_batcher = _ContradictionBatcher()
+
+
+def batcher_stats() -> dict:
+    stats = dict(_batcher.stats)
+    total_latency, count = stats.pop("totalLatencyMs"), stats["batches"]
+    return {
+        **stats,
+        "meanBatchSize": round(stats["items"] / count, 2) if count else None,
+        "meanLatencyMs": round(total_latency / count, 1) if count else None,
+    }
+
+
+async def score_contradiction(
+    witness_answer: str,
+    prior_statements: list[dict],
+    case_context: str,
+) -> dict:
+    if not settings.NEMOTRON_BATCH_ENABLED:
+        return await _score_single(witness_answer, prior_statements, case_context)
+    return await _batcher.submit(_ScoreRequest(witness_answer, prior_statements, case_context))
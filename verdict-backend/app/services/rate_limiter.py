@@ -0,0 +1,250 @@
+"""
+Client-side rate limiting for the LLM/TTS upstreams (Claude, Nemotron, ElevenLabs).
+
+Every call to an upstream goes through governed(upstream, priority, tokens):
+
+  1. Buckets — each upstream has a request bucket and a token bucket
+     (<UPSTREAM>_REQUESTS_PER_MIN / _TOKENS_PER_MIN; ElevenLabs counts
+     characters).  They live in one Redis hash per upstream and are refilled
+     and debited by a Lua script, so every API and worker process shares the
+     same per-minute budget.  Each priority class must leave a reserve share
+     of both buckets untouched:
+
+         LIVE       0%    interrogator questions, live TTS/STT
+         DETECTION  10%   objection and inconsistency analysis
+         BRIEF      30%   post-session brief generation
+         INGESTION  50%   document fact extraction
+
+     so when the budget runs low, ingestion and briefs wait for it to refill
+     while live turns still go through.  A call that has to wait sleeps for
+     the refill time the script reports and tries again.
+
+  2. Concurrency — a per-process gate admits at most
+     <UPSTREAM>_MAX_CONCURRENCY calls at once and, when full, hands freed
+     slots to waiters in priority order (FIFO within a class).
+
+Claude calls are charged their estimated input plus max_tokens up front;
+claude_chat refunds the output tokens it did not use.  If Redis is
+unreachable, or a bucket check takes longer than RATE_LIMIT_REDIS_TIMEOUT_S,
+the buckets are skipped and only the local gate applies; Redis is then left
+alone for RATE_LIMIT_REDIS_RETRY_S so later calls don't each pay the wait.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator
+
+from app.config import settings
+from app.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    LIVE = 0
+    DETECTION = 1
+    BRIEF = 2
+    INGESTION = 3
+
+
+_RESERVE = {
+    Priority.LIVE: 0.0,
+    Priority.DETECTION: 0.1,
+    Priority.BRIEF: 0.3,
+    Priority.INGESTION: 0.5,
+}
+_CHARS_PER_TOKEN = 4
+_MAX_SLEEP_S = 1.0
+_PREFIX = "verdict:ratelimit:"
+
+# KEYS[1] bucket hash.  ARGV: requests/min, tokens/min, token cost, reserve share.
+# A limit of 0 disables that bucket.  Returns "0" when the call may proceed
+# (both buckets debited), otherwise the seconds to wait before trying again.
+_TAKE = """
+local rpm, tpm = tonumber(ARGV[1]), tonumber(ARGV[2])
+local cost, reserve = tonumber(ARGV[3]), tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local b = redis.call('HMGET', KEYS[1], 'req', 'tok', 'ts')
+local req, tok = tonumber(b[1]) or rpm, tonumber(b[2]) or tpm
+local elapsed = math.max(0, now - (tonumber(b[3]) or now))
+local wait = 0
+if rpm > 0 then
+  req = math.min(rpm, req + elapsed * rpm / 60)
+  local floor = math.min(rpm, 1 + reserve * rpm)
+  if req < floor then wait = math.max(wait, (floor - req) * 60 / rpm) end
+end
+if tpm > 0 then
+  cost = math.min(cost, tpm)
+  tok = math.min(tpm, tok + elapsed * tpm / 60)
+  local floor = math.min(tpm, cost + reserve * tpm)
+  if tok < floor then wait = math.max(wait, (floor - tok) * 60 / tpm) end
+end
+if wait == 0 then
+  req, tok = req - 1, tok - cost
+end
+redis.call('HSET', KEYS[1], 'req', req, 'tok', tok, 'ts', now)
+redis.call('EXPIRE', KEYS[1], 120)
+return tostring(wait)
+"""
+
+_REFUND = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+  redis.call('HINCRBYFLOAT', KEYS[1], 'tok', ARGV[1])
+end
+return 1
+"""
+
+
+def _limits(upstream: str) -> tuple[int, int, int]:
+    """(requests/min, tokens/min, max concurrency) for an upstream."""
+    return {
+        "claude": (settings.CLAUDE_REQUESTS_PER_MIN, settings.CLAUDE_TOKENS_PER_MIN, settings.CLAUDE_MAX_CONCURRENCY),
+        "nemotron": (settings.NEMOTRON_REQUESTS_PER_MIN, settings.NEMOTRON_TOKENS_PER_MIN, settings.NEMOTRON_MAX_CONCURRENCY),
+        "elevenlabs": (settings.ELEVENLABS_REQUESTS_PER_MIN, settings.ELEVENLABS_CHARS_PER_MIN, settings.ELEVENLABS_MAX_CONCURRENCY),
+    }[upstream]
+
+
+def estimate_tokens(*texts: str | None, max_tokens: int = 0) -> int:
+    """Rough token cost of a completion: prompt at 4 characters per token plus the output cap."""
+    return sum(len(t or "") for t in texts) // _CHARS_PER_TOKEN + max_tokens
+
+
+class _Gate:
+    """Concurrency limit whose queue is served in priority order."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(not f.done() for _, _, f in self._waiters)
+
+    async def acquire(self, priority: Priority) -> None:
+        if self.active < self.limit and not self.queued:
+            self.active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # granted a slot just as we were cancelled
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        while self._waiters and self.active < self.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+
+
+_gates: dict[str, _Gate] = {}
+_scripts: dict = {}
+_stats: dict[str, dict] = {}
+_redis_retry_at = 0.0   # monotonic time before which Redis is not tried
+
+
+def _gate(upstream: str) -> _Gate:
+    if upstream not in _gates:
+        _gates[upstream] = _Gate(max(1, _limits(upstream)[2]))
+    return _gates[upstream]
+
+
+def _record(upstream: str, priority: Priority, waited_s: float) -> None:
+    stats = _stats.setdefault(upstream, {})
+    entry = stats.setdefault(priority.name.lower(), {"calls": 0, "delayed": 0, "totalWaitMs": 0.0})
+    entry["calls"] += 1
+    if waited_s > 0.001:
+        entry["delayed"] += 1
+        entry["totalWaitMs"] += waited_s * 1000
+
+
+async def _script(name: str, source: str, key: str, *args) -> object:
+    if name not in _scripts:
+        _scripts[name] = redis_client.register_script(source)
+    return await _scripts[name](keys=[key], args=list(args))
+
+
+async def _take(upstream: str, priority: Priority, tokens: int) -> None:
+    global _redis_retry_at
+    rpm, tpm, _ = _limits(upstream)
+    if not settings.RATE_LIMIT_ENABLED or (rpm <= 0 and tpm <= 0):
+        return
+    while True:
+        if time.monotonic() < _redis_retry_at:
+            return
+        try:
+            wait = float(await asyncio.wait_for(
+                _script("take", _TAKE, _PREFIX + upstream, rpm, tpm, tokens, _RESERVE[priority]),
+                timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_S,
+            ))
+        except Exception as exc:
+            _redis_retry_at = time.monotonic() + settings.RATE_LIMIT_REDIS_RETRY_S
+            logger.warning(
+                "Rate limiter unavailable for %s, not throttling for %.0fs: %s",
+                upstream, settings.RATE_LIMIT_REDIS_RETRY_S, str(exc) or type(exc).__name__,
+            )
+            return
+        if wait <= 0:
+            return
+        await asyncio.sleep(min(wait, _MAX_SLEEP_S))
+
+
+async def refund(upstream: str, tokens: int) -> None:
+    """Return over-estimated tokens to an upstream's bucket."""
+    if tokens <= 0 or not settings.RATE_LIMIT_ENABLED or _limits(upstream)[1] <= 0:
+        return
+    if time.monotonic() < _redis_retry_at:
+        return
+    try:
+        await asyncio.wait_for(
+            _script("refund", _REFUND, _PREFIX + upstream, tokens),
+            timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_S,
+        )
+    except Exception as exc:
+        logger.warning("Rate limiter refund failed for %s: %s", upstream, exc)
+
+
+@asynccontextmanager
+async def governed(upstream: str, priority: Priority = Priority.LIVE, tokens: int = 0) -> AsyncIterator[None]:
+    """Hold a rate-limited, concurrency-limited slot on an upstream for the block's duration."""
+    start = time.perf_counter()
+    await _take(upstream, priority, tokens)
+    gate = _gate(upstream)
+    await gate.acquire(priority)
+    _record(upstream, priority, time.perf_counter() - start)
+    try:
+        yield
+    finally:
+        gate.release()
+
+
+def rate_limiter_stats() -> dict:
+    return {
+        upstream: {
+            "active": gate.active,
+            "queued": gate.queued,
+            "limit": gate.limit,
+            "byPriority": {
+                name: {
+                    "calls": entry["calls"],
+                    "delayed": entry["delayed"],
+                    "meanWaitMs": round(entry["totalWaitMs"] / entry["delayed"], 1) if entry["delayed"] else None,
+                }
+                for name, entry in _stats.get(upstream, {}).items()
+            },
+        }
+        for upstream, gate in _gates.items()
+    }
@@ -0,0 +1,175 @@
+"""
+Two-tier cache for vector-index retrievals.
+
+Keyed by (index, case_id, normalized query, top_k):
+
+  1. An in-process LRU, so the interrogator and detector asking about the same
+     answer in one turn share a single lookup without any I/O.
+  2. A Redis hash per case (`verdict:retrieval:{case_id}`), shared by every
+     uvicorn worker.  Invalidating a case after ingestion is a single DEL.
+
+Concurrent misses for the same key are coalesced onto one upstream call, run
+as a detached task so a caller that is cancelled (e.g. a client disconnect)
+does not cancel the lookup for everyone else waiting on it.
+Only successful fetches are cached — a Databricks error must not pin an empty
+result for the TTL.  Redis is best-effort: if it is down the cache degrades to
+the local tier.
+
+The local tier's TTL is kept short because other workers only learn about an
+invalidation through the Redis tier.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from app.config import settings
+from app.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = "_global"   # case-independent indexes (FRE rules)
+
+_local: "OrderedDict[tuple, tuple[float, list[dict]]]" = OrderedDict()
+_inflight: dict[tuple, asyncio.Task] = {}
+_stats = {"localHits": 0, "redisHits": 0, "coalesced": 0, "misses": 0, "invalidations": 0}
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _redis_key(scope: str) -> str:
+    return f"verdict:retrieval:{scope}"
+
+
+def _redis_field(index: str, query: str, top_k: int) -> str:
+    digest = hashlib.sha1(query.encode()).hexdigest()
+    return f"{index}:{top_k}:{digest}"
+
+
+def _local_get(key: tuple) -> list[dict] | None:
+    entry = _local.get(key)
+    if entry is None:
+        return None
+    stored_at, results = entry
+    if time.monotonic() - stored_at > settings.RETRIEVAL_CACHE_LOCAL_TTL_S:
+        _local.pop(key, None)
+        return None
+    _local.move_to_end(key)
+    return results
+
+
+def _local_put(key: tuple, results: list[dict]) -> None:
+    _local[key] = (time.monotonic(), results)
+    _local.move_to_end(key)
+    while len(_local) > settings.RETRIEVAL_CACHE_LOCAL_MAX_ENTRIES:
+        _local.popitem(last=False)
+
+
+async def _redis_get(scope: str, field: str) -> list[dict] | None:
+    try:
+        raw = await redis_client.hget(_redis_key(scope), field)
+    except Exception as exc:
+        logger.warning("Retrieval cache read failed: %s", exc)
+        return None
+    return json.loads(raw) if raw else None
+
+
+async def _redis_put(scope: str, field: str, results: list[dict]) -> None:
+    ttl = (
+        settings.RETRIEVAL_CACHE_GLOBAL_TTL_S if scope == GLOBAL_SCOPE
+        else settings.RETRIEVAL_CACHE_REDIS_TTL_S
+    )
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(_redis_key(scope), field, json.dumps(results, default=str))
+            pipe.expire(_redis_key(scope), ttl)
+            await pipe.execute()
+    except Exception as exc:
+        logger.warning("Retrieval cache write failed: %s", exc)
+
+
+async def cached_retrieval(
+    index: str,
+    case_id: str | None,
+    query: str,
+    top_k: int,
+    fetch: Callable[[], Awaitable[list[dict]]],
+) -> list[dict]:
+    """Return cached results for this retrieval, calling `fetch` on a miss.
+
+    `fetch` must raise on failure so errors are never cached.
+    """
+    if not settings.RETRIEVAL_CACHE_ENABLED:
+        return await fetch()
+
+    scope = case_id or GLOBAL_SCOPE
+    normalized = normalize_query(query)
+    key = (index, scope, normalized, top_k)
+
+    results = _local_get(key)
+    if results is not None:
+        _stats["localHits"] += 1
+        return results
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        _stats["coalesced"] += 1
+    else:
+        pending = asyncio.create_task(_load(key, scope, normalized, index, top_k, fetch))
+        _inflight[key] = pending
+        pending.add_done_callback(lambda task: _finish_load(key, task))
+    return await asyncio.shield(pending)
+
+
+async def _load(
+    key: tuple,
+    scope: str,
+    normalized: str,
+    index: str,
+    top_k: int,
+    fetch: Callable[[], Awaitable[list[dict]]],
+) -> list[dict]:
+    field = _redis_field(index, normalized, top_k)
+    results = await _redis_get(scope, field)
+    if results is not None:
+        _stats["redisHits"] += 1
+    else:
+        _stats["misses"] += 1
+        results = await fetch()
+        await _redis_put(scope, field, results)
+    _local_put(key, results)
+    return results
+
+
+def _finish_load(key: tuple, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved when every waiter was cancelled
+
+
+async def invalidate_case(case_id: str) -> None:
+    """Drop every cached retrieval for a case (after new chunks are upserted)."""
+    _stats["invalidations"] += 1
+    for key in [k for k in _local if k[1] == case_id]:
+        _local.pop(key, None)
+    try:
+        await redis_client.delete(_redis_key(case_id))
+    except Exception as exc:
+        logger.warning("Retrieval cache invalidation failed for case %s: %s", case_id, exc)
+
+
+def cache_stats() -> dict:
+    lookups = sum(_stats[k] for k in ("localHits", "redisHits", "coalesced", "misses"))
+    hits = lookups - _stats["misses"]
+    return {
+        **_stats,
+        "localEntries": len(_local),
+        "hitRate": round(hits / lookups, 3) if lookups else None,
+    }
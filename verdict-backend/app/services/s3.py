@@ -1,25 +1,49 @@
+"""
+Object storage helpers.
+
+Keys and call sites still say "s3", but the bytes go to whichever backend
+STORAGE_BACKEND selects (app/services/storage_backends.py): AWS S3 or local
+disk.
+
+Backends are synchronous, so every call from a request handler or background
+task must go through the *_async wrappers below.  They run the blocking call
+on a dedicated thread pool (S3_MAX_WORKERS) rather than the loop's default
+executor, so a burst of large transfers cannot starve other to_thread users.
+
+Uploads nothing waits on (answer audio) go through app.services.upload_queue
+instead.
+"""
+
+import asyncio
+import functools
+import hashlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import boto3
-from botocore.exceptions import ClientError
+from typing import Iterable
 from app.config import settings
+from app.services.storage_backends import get_storage_backend
+
+_executor: ThreadPoolExecutor | None = None
 
-_s3_client = None
 
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=settings.S3_MAX_WORKERS, thread_name_prefix="s3")
+    return _executor
 
-def get_s3():
-    global _s3_client
-    if _s3_client is None:
-        _s3_client = boto3.client(
-            "s3",
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
-    return _s3_client
 
+async def _run(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args))
 
-BUCKET = settings.S3_BUCKET_NAME
+
+def shutdown_s3() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
 
 
 def build_s3_key(firm_id: str, case_id: str, filename: str) -> str:
@@ -29,60 +53,100 @@ def build_s3_key(firm_id: str, case_id: str, filename: str) -> str:
     return f"firms/{firm_id}/cases/{case_id}/{date_prefix}/{uid}_{safe_name}"
 
 
+def build_extraction_key(firm_id: str, file_hash: str, mime_type: str) -> str:
+    """Key of a file's cached extracted pages (shared by every copy in the firm)."""
+    return f"firms/{firm_id}/extractions/{file_hash}/{mime_type.replace('/', '_')}.jsonl"
+
+
 def generate_presigned_upload(
     s3_key: str,
     mime_type: str,
     expires_in: int = 900,
 ) -> str:
     """Return a presigned PUT URL the client uploads directly to."""
-    return get_s3().generate_presigned_url(
-        "put_object",
-        Params={
-            "Bucket": BUCKET,
-            "Key": s3_key,
-            "ContentType": mime_type,
-        },
-        ExpiresIn=expires_in,
-        HttpMethod="PUT",
-    )
+    return get_storage_backend().presigned_upload_url(s3_key, mime_type, expires_in)
 
 
 def generate_presigned_download(s3_key: str, expires_in: int = 3600) -> str:
     """Return a presigned GET URL for a stored file."""
-    return get_s3().generate_presigned_url(
-        "get_object",
-        Params={"Bucket": BUCKET, "Key": s3_key},
-        ExpiresIn=expires_in,
-    )
+    return get_storage_backend().presigned_download_url(s3_key, expires_in)
 
 
 def upload_bytes(s3_key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
-    """Directly upload bytes (used for generated audio/PDF). Returns the S3 key."""
-    get_s3().put_object(
-        Bucket=BUCKET,
-        Key=s3_key,
-        Body=data,
-        ContentType=content_type,
-    )
+    """Directly upload bytes (used for generated audio/PDF). Returns the S3 key.
+
+    Blocking — use upload_bytes_async from async code.
+    """
+    get_storage_backend().put(s3_key, data, content_type)
     return s3_key
 
 
+def upload_stream(s3_key: str, chunks: Iterable[bytes], content_type: str = "application/octet-stream") -> str:
+    """Upload from an iterable of chunks without holding the whole object. Blocking."""
+    get_storage_backend().put_stream(s3_key, chunks, content_type)
+    return s3_key
+
+
+def upload_file(s3_key: str, path: str, content_type: str = "application/octet-stream") -> str:
+    """Upload a local file in blocks without reading it whole. Blocking."""
+    with open(path, "rb") as fh:
+        return upload_stream(s3_key, iter(lambda: fh.read(1024 * 1024), b""), content_type)
+
+
 def download_bytes(s3_key: str) -> bytes:
-    """Download a file from S3 and return its bytes."""
-    obj = get_s3().get_object(Bucket=BUCKET, Key=s3_key)
-    return obj["Body"].read()
+    """Download a file from S3 and return its bytes.
+
+    Blocking — use download_bytes_async from async code.
+    """
+    return get_storage_backend().get(s3_key)
+
+
+def download_to_file(s3_key: str, path: str) -> str:
+    """Download a file to `path` without holding it in memory.  Returns its SHA-256. Blocking."""
+    get_storage_backend().get_to_file(s3_key, path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def download_range(s3_key: str, start: int, end: int) -> bytes:
+    """Download bytes start..end (inclusive). Blocking."""
+    return get_storage_backend().get_range(s3_key, start, end)
 
 
 def delete_object(s3_key: str) -> None:
-    try:
-        get_s3().delete_object(Bucket=BUCKET, Key=s3_key)
-    except ClientError:
-        pass
+    get_storage_backend().delete(s3_key)
 
 
 def object_exists(s3_key: str) -> bool:
-    try:
-        get_s3().head_object(Bucket=BUCKET, Key=s3_key)
-        return True
-    except ClientError:
-        return False
+    return get_storage_backend().stat(s3_key) is not None
+
+
+async def upload_bytes_async(s3_key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
+    return await _run(upload_bytes, s3_key, data, content_type)
+
+
+async def upload_file_async(s3_key: str, path: str, content_type: str = "application/octet-stream") -> str:
+    return await _run(upload_file, s3_key, path, content_type)
+
+
+async def download_bytes_async(s3_key: str) -> bytes:
+    return await _run(download_bytes, s3_key)
+
+
+async def download_to_file_async(s3_key: str, path: str) -> str:
+    return await _run(download_to_file, s3_key, path)
+
+
+async def download_range_async(s3_key: str, start: int, end: int) -> bytes:
+    return await _run(download_range, s3_key, start, end)
+
+
+async def delete_object_async(s3_key: str) -> None:
+    await _run(delete_object, s3_key)
+
+
+async def object_exists_async(s3_key: str) -> bool:
+    return await _run(object_exists, s3_key)
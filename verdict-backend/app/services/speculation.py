@@ -0,0 +1,242 @@
+"""
+Speculative next-question generation.
+
+While the witness is still answering (partial transcripts, or the answer audio
+upload finishing STT) the interrogator is run ahead of time on the answer so
+far.  When the frontend then asks for the next question, stream_question
+claims the best-matching candidate instead of waiting on a fresh LLM round
+trip; on a miss the candidates are cancelled and the question is generated
+normally.
+
+A candidate matches when it was generated for the same turn context (topic,
+hesitation / inconsistency flags) and its basis covers at least
+SPECULATION_MATCH_THRESHOLD of the final answer's terms.  The context for the
+next turn is assumed to be the last one the session asked with and no flags,
+which is by far the most common branch.
+
+In-flight candidates are local to the worker that started them; finished
+candidates are also written to Redis so any worker can serve them.  Local
+candidates that are never claimed (the session moved on or ended, or the
+claim went to another worker) are dropped when a later question of the
+session is claimed, when the session ends, and otherwise after
+_KEY_TTL_SECONDS, like their Redis copies.  Hit /
+miss counts and latency saved are kept per session in Redis.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncGenerator, Callable
+
+from app.config import settings
+from app.redis_client import redis_client
+from app.services.lexical_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+_KEY_TTL_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class TurnContext:
+    topic: str
+    hesitation: bool = False
+    inconsistency: bool = False
+
+
+@dataclass
+class _Candidate:
+    basis: str
+    context: TurnContext
+    task: asyncio.Task
+    started: float
+    finished: float | None = None
+
+
+_inflight: dict[tuple[str, int], list[_Candidate]] = {}
+
+
+def _drop(key: tuple[str, int]) -> list[_Candidate]:
+    candidates = _inflight.pop(key, [])
+    for c in candidates:
+        if not c.task.done():
+            c.task.cancel()
+    return candidates
+
+
+def _evict_stale(session_id: str | None = None, before_question: int | None = None) -> None:
+    """Drop expired candidates, plus a session's candidates for questions before `before_question`."""
+    expired = time.monotonic() - _KEY_TTL_SECONDS
+    for key, candidates in list(_inflight.items()):
+        superseded = key[0] == session_id and before_question is not None and key[1] < before_question
+        if superseded or all(c.started < expired for c in candidates):
+            _drop(key)
+
+
+def discard_session(session_id: str) -> None:
+    """Cancel and forget this worker's candidates for an ended session."""
+    for key in [k for k in _inflight if k[0] == session_id]:
+        _drop(key)
+
+
+def _candidates_key(session_id: str, question_number: int) -> str:
+    return f"verdict:speculation:{session_id}:q{question_number}"
+
+
+def _context_key(session_id: str) -> str:
+    return f"verdict:speculation:{session_id}:context"
+
+
+def _stats_key(session_id: str) -> str:
+    return f"verdict:speculation:{session_id}:stats"
+
+
+def _coverage(basis: str, final_answer: str) -> float:
+    final_terms = set(tokenize(final_answer))
+    if not final_terms:
+        return 1.0 if not tokenize(basis) else 0.0
+    return len(final_terms & set(tokenize(basis))) / len(final_terms)
+
+
+async def remember_context(session_id: str, context: TurnContext) -> None:
+    """Record the context of the question just asked; the next one is speculated with it."""
+    try:
+        await redis_client.set(_context_key(session_id), json.dumps(asdict(context)), ex=_KEY_TTL_SECONDS)
+    except Exception as exc:
+        logger.warning("Speculation context write failed for %s: %s", session_id, exc)
+
+
+async def next_turn_context(session_id: str) -> TurnContext:
+    try:
+        raw = await redis_client.get(_context_key(session_id))
+    except Exception:
+        raw = None
+    topic = json.loads(raw)["topic"] if raw else "PRIOR_STATEMENTS"
+    return TurnContext(topic=topic)
+
+
+async def _store_finished(session_id: str, question_number: int, candidate: _Candidate, question: str) -> None:
+    payload = json.dumps({
+        "basis": candidate.basis,
+        "context": asdict(candidate.context),
+        "question": question,
+        "generationMs": int((candidate.finished - candidate.started) * 1000),
+    })
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.rpush(_candidates_key(session_id, question_number), payload)
+            pipe.expire(_candidates_key(session_id, question_number), _KEY_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as exc:
+        logger.warning("Speculation store failed for %s: %s", session_id, exc)
+
+
+def speculate(
+    session_id: str,
+    question_number: int,
+    basis: str,
+    context: TurnContext,
+    generate: Callable[[], AsyncGenerator[str, None]],
+) -> bool:
+    """Start generating question `question_number` from the answer so far.
+
+    Skipped when the basis is too short, adds nothing over an existing
+    candidate, or the per-question candidate cap is reached.
+    """
+    if not settings.SPECULATION_ENABLED or len(basis.split()) < settings.SPECULATION_MIN_WORDS:
+        return False
+    _evict_stale()
+    key = (session_id, question_number)
+    candidates = _inflight.setdefault(key, [])
+    if len(candidates) >= settings.SPECULATION_MAX_CANDIDATES:
+        return False
+    if any(c.context == context and _coverage(c.basis, basis) >= settings.SPECULATION_MATCH_THRESHOLD
+           for c in candidates):
+        return False
+
+    async def run() -> str:
+        question = "".join([chunk async for chunk in generate()]).strip()
+        candidate.finished = time.monotonic()
+        await _store_finished(session_id, question_number, candidate, question)
+        return question
+
+    candidate = _Candidate(basis=basis, context=context, task=asyncio.create_task(run()), started=time.monotonic())
+    candidate.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    candidates.append(candidate)
+    return True
+
+
+async def _record(session_id: str, hit: bool, saved_ms: int) -> None:
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hincrby(_stats_key(session_id), "hits" if hit else "misses", 1)
+            pipe.hincrby(_stats_key(session_id), "savedMs", saved_ms)
+            pipe.expire(_stats_key(session_id), 24 * 3600)
+            await pipe.execute()
+    except Exception as exc:
+        logger.warning("Speculation stats write failed for %s: %s", session_id, exc)
+
+
+async def claim(session_id: str, question_number: int, final_answer: str, context: TurnContext) -> str | None:
+    """Return a precomputed question for this answer, or None to generate fresh.
+
+    All other candidates for the question are cancelled / discarded either way.
+    """
+    local = _inflight.pop((session_id, question_number), [])
+    _evict_stale(session_id, before_question=question_number)
+    threshold = settings.SPECULATION_MATCH_THRESHOLD
+    scored = [(_coverage(c.basis, final_answer), c) for c in local if c.context == context]
+    best_local = max(scored, key=lambda s: (s[0], s[1].started), default=(0.0, None))
+
+    question, saved_ms = None, 0
+    if best_local[1] is not None and best_local[0] >= threshold:
+        candidate = best_local[1]
+        waited_from = time.monotonic()
+        try:
+            question = await candidate.task
+            saved_ms = int((min(candidate.finished, waited_from) - candidate.started) * 1000)
+        except Exception as exc:
+            logger.warning("Speculative question failed for %s: %s", session_id, exc)
+    for c in local:
+        if not c.task.done():
+            c.task.cancel()
+
+    try:
+        stored = await redis_client.lrange(_candidates_key(session_id, question_number), 0, -1)
+        await redis_client.delete(_candidates_key(session_id, question_number))
+    except Exception:
+        stored = []
+    if not local and not stored:
+        return None  # nothing was speculated for this turn; not counted as a miss
+    if question is None:
+        best_score = 0.0
+        for raw in stored:
+            row = json.loads(raw)
+            score = _coverage(row["basis"], final_answer)
+            if TurnContext(**row["context"]) == context and score >= threshold and score >= best_score:
+                best_score, question, saved_ms = score, row["question"], row["generationMs"]
+
+    await _record(session_id, question is not None, saved_ms)
+    logger.info(
+        "Speculative question %s for session %s q%d (saved %dms)",
+        "HIT" if question else "MISS", session_id, question_number, saved_ms,
+    )
+    return question or None
+
+
+async def speculation_stats(session_id: str) -> dict:
+    try:
+        raw = await redis_client.hgetall(_stats_key(session_id))
+    except Exception:
+        raw = {}
+    hits, misses = int(raw.get("hits", 0)), int(raw.get("misses", 0))
+    saved_ms = int(raw.get("savedMs", 0))
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hitRate": round(hits / (hits + misses), 3) if hits + misses else None,
+        "latencySavedMs": saved_ms,
+        "meanSavedMsPerHit": int(saved_ms / hits) if hits else None,
+    }
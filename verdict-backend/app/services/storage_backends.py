@@ -0,0 +1,231 @@
+"""
+Pluggable object-storage backends behind app/services/s3.py.
+
+  s3    — AWS S3 through boto3, multipart above S3_MULTIPART_THRESHOLD_MB.
+  local — files under LOCAL_STORAGE_DIR, with presigned-style HMAC-tokenized
+          URLs served by app/routers/storage.py (app/services/local_storage.py).
+
+STORAGE_BACKEND selects one; "auto" uses S3 when AWS credentials are set and
+local disk otherwise, so single-box deployments and CI run the whole
+upload → ingestion → brief pipeline without AWS.
+
+Backends are synchronous; s3.py runs them on its storage thread pool.
+Byte ranges follow HTTP semantics: `end` is inclusive.
+"""
+
+import io
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class ObjectInfo:
+    size: int
+    content_type: str
+
+
+class StorageBackend(ABC):
+    name = "base"
+
+    def configured(self) -> bool:
+        return True
+
+    def put(self, key: str, data: bytes, content_type: str) -> None:
+        self.put_stream(key, [data], content_type)
+
+    @abstractmethod
+    def put_stream(self, key: str, chunks: Iterable[bytes], content_type: str) -> None:
+        """Write an object from an iterable of chunks without buffering it whole."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """The whole object."""
+
+    @abstractmethod
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Bytes start..end inclusive."""
+
+    def get_to_file(self, key: str, path: str) -> None:
+        """Write an object to a local file without holding it in memory."""
+        info = self.stat(key)
+        if info is None:
+            raise FileNotFoundError(key)
+        step = settings.S3_MULTIPART_CHUNK_MB * _MB
+        with open(path, "wb") as fh:
+            for start in range(0, info.size, step):
+                fh.write(self.get_range(key, start, min(start + step, info.size) - 1))
+
+    @abstractmethod
+    def stat(self, key: str) -> ObjectInfo | None:
+        """Size and content type, or None when the object does not exist."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an object; a missing one is not an error."""
+
+    @abstractmethod
+    def presigned_upload_url(self, key: str, content_type: str, expires_in: int) -> str:
+        """URL a client can PUT the object to directly."""
+
+    @abstractmethod
+    def presigned_download_url(self, key: str, expires_in: int) -> str:
+        """URL a client can GET the object from directly."""
+
+
+class _ChunkReader(io.RawIOBase):
+    """Non-seekable file object over an iterable of byte chunks (for upload_fileobj)."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class S3Backend(StorageBackend):
+    name = "s3"
+
+    def __init__(self):
+        self._client = None
+        self._transfer_config = None
+
+    def configured(self) -> bool:
+        return bool(settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY)
+
+    @property
+    def client(self):
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+
+            self._client = boto3.client(
+                "s3",
+                region_name=settings.AWS_REGION,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                # Every pool thread may run a multipart transfer with its own part threads.
+                config=Config(max_pool_connections=settings.S3_MAX_WORKERS * settings.S3_MULTIPART_CONCURRENCY),
+            )
+        return self._client
+
+    @property
+    def transfer_config(self):
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+
+            self._transfer_config = TransferConfig(
+                multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * _MB,
+                multipart_chunksize=settings.S3_MULTIPART_CHUNK_MB * _MB,
+                max_concurrency=settings.S3_MULTIPART_CONCURRENCY,
+            )
+        return self._transfer_config
+
+    def put(self, key: str, data: bytes, content_type: str) -> None:
+        self.client.upload_fileobj(
+            io.BytesIO(data), settings.S3_BUCKET_NAME, key,
+            ExtraArgs={"ContentType": content_type}, Config=self.transfer_config,
+        )
+
+    def put_stream(self, key: str, chunks: Iterable[bytes], content_type: str) -> None:
+        self.client.upload_fileobj(
+            _ChunkReader(chunks), settings.S3_BUCKET_NAME, key,
+            ExtraArgs={"ContentType": content_type}, Config=self.transfer_config,
+        )
+
+    def get(self, key: str) -> bytes:
+        buf = io.BytesIO()
+        self.client.download_fileobj(settings.S3_BUCKET_NAME, key, buf, Config=self.transfer_config)
+        return buf.getvalue()
+
+    def get_to_file(self, key: str, path: str) -> None:
+        # Ranged parts straight to disk, in parallel above the multipart threshold.
+        self.client.download_file(settings.S3_BUCKET_NAME, key, path, Config=self.transfer_config)
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        obj = self.client.get_object(Bucket=settings.S3_BUCKET_NAME, Key=key, Range=f"bytes={start}-{end}")
+        return obj["Body"].read()
+
+    def stat(self, key: str) -> ObjectInfo | None:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=settings.S3_BUCKET_NAME, Key=key)
+        except ClientError:
+            return None
+        return ObjectInfo(size=head["ContentLength"], content_type=head.get("ContentType") or "application/octet-stream")
+
+    def delete(self, key: str) -> None:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=key)
+        except ClientError:
+            pass
+
+    def presigned_upload_url(self, key: str, content_type: str, expires_in: int) -> str:
+        return self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": settings.S3_BUCKET_NAME, "Key": key, "ContentType": content_type},
+            ExpiresIn=expires_in,
+            HttpMethod="PUT",
+        )
+
+    def presigned_download_url(self, key: str, expires_in: int) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": settings.S3_BUCKET_NAME, "Key": key},
+            ExpiresIn=expires_in,
+        )
+
+
+_backend: StorageBackend | None = None
+
+
+def get_storage_backend() -> StorageBackend:
+    global _backend
+    if _backend is None:
+        choice = settings.STORAGE_BACKEND.lower()
+        if choice == "auto":
+            choice = "s3" if S3Backend().configured() else "local"
+            if choice == "local":
+                # Local files vanish with the container and are not shared
+                # between instances, so never fall back to them silently.
+                if settings.NODE_ENV != "development":
+                    raise ValueError(
+                        "STORAGE_BACKEND=auto found no AWS credentials; set them, "
+                        "or set STORAGE_BACKEND=local to store documents on local disk"
+                    )
+                logger.warning(
+                    "STORAGE_BACKEND=auto found no AWS credentials — documents are stored under %s "
+                    "on local disk (development only; set STORAGE_BACKEND explicitly to silence)",
+                    settings.LOCAL_STORAGE_DIR,
+                )
+        if choice == "s3":
+            _backend = S3Backend()
+        elif choice == "local":
+            from app.services.local_storage import LocalStorageBackend
+            _backend = LocalStorageBackend(settings.LOCAL_STORAGE_DIR)
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+        logger.info("Storage backend: %s", _backend.name)
+    return _backend
@@ -0,0 +1,145 @@
+"""
+Incremental transcription of a witness answer streamed as raw audio frames.
+
+The client streams 16-bit little-endian mono PCM (STT_STREAM_SAMPLE_RATE).
+A simple energy VAD cuts the stream into utterance segments at short pauses
+(STT_SEGMENT_PAUSE_MS), force-cutting anything longer than
+STT_MAX_SEGMENT_MS.  Each closed segment is wrapped as WAV and sent to
+ElevenLabs speech-to-text immediately, concurrently with the rest of the
+answer still arriving, and the in-order transcript so far is reported through
+on_partial.
+
+End of speech is STT_END_OF_SPEECH_MS of silence after speech.  At that point
+only the last (short, bounded) segment is still being transcribed, so the
+final transcript lands within a fixed delay regardless of answer length.
+"""
+
+import asyncio
+import io
+import logging
+import time
+import wave
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from app.config import settings
+from app.services.elevenlabs import speech_to_text
+
+logger = logging.getLogger(__name__)
+
+_FRAME_MS = 20
+_BYTES_PER_SAMPLE = 2
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(_BYTES_PER_SAMPLE)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+class AnswerTranscriber:
+    def __init__(self, on_partial: Callable[[str], Awaitable[None]] | None = None):
+        self.sample_rate = settings.STT_STREAM_SAMPLE_RATE
+        self.frame_bytes = self.sample_rate * _FRAME_MS // 1000 * _BYTES_PER_SAMPLE
+        self.on_partial = on_partial
+
+        self.audio = bytearray()              # the whole answer, for archiving
+        self._pending = bytearray()           # bytes not yet a full VAD frame
+        self._segment = bytearray()
+        self._segment_has_speech = False
+        self._heard_speech = False
+        self._silence_ms = 0
+        self._segment_ms = 0
+
+        self._tasks: list[asyncio.Task] = []
+        self._texts: list[str | None] = []
+        self._reported = 0
+        self.end_of_speech_at: float | None = None
+
+    @property
+    def ended(self) -> bool:
+        return self.end_of_speech_at is not None
+
+    def feed(self, data: bytes) -> None:
+        """Consume PCM bytes.  Sets `ended` once end of speech is detected."""
+        self.audio += data
+        self._pending += data
+        while len(self._pending) >= self.frame_bytes and not self.ended:
+            frame = bytes(self._pending[:self.frame_bytes])
+            del self._pending[:self.frame_bytes]
+            self._process_frame(frame)
+
+    def _process_frame(self, frame: bytes) -> None:
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+        voiced = float(np.sqrt(np.mean(samples * samples))) >= settings.STT_VAD_RMS_THRESHOLD
+
+        self._segment += frame
+        self._segment_ms += _FRAME_MS
+        if voiced:
+            self._segment_has_speech = self._heard_speech = True
+            self._silence_ms = 0
+        else:
+            self._silence_ms += _FRAME_MS
+
+        if self._segment_has_speech and (
+            self._silence_ms >= settings.STT_SEGMENT_PAUSE_MS
+            or self._segment_ms >= settings.STT_MAX_SEGMENT_MS
+        ):
+            self._close_segment()
+        elif not self._segment_has_speech and self._segment_ms >= settings.STT_SEGMENT_PAUSE_MS:
+            # Leading / inter-utterance silence: drop it instead of transcribing.
+            self._segment.clear()
+            self._segment_ms = 0
+
+        if self._heard_speech and self._silence_ms >= settings.STT_END_OF_SPEECH_MS:
+            self.end_of_speech_at = time.monotonic()
+
+    def _close_segment(self) -> None:
+        if self._segment_has_speech:
+            index = len(self._texts)
+            self._texts.append(None)
+            wav = pcm_to_wav(bytes(self._segment), self.sample_rate)
+            self._tasks.append(asyncio.create_task(self._transcribe(index, wav)))
+        self._segment = bytearray()
+        self._segment_has_speech = False
+        self._segment_ms = 0
+
+    async def _transcribe(self, index: int, wav: bytes) -> None:
+        try:
+            self._texts[index] = (await speech_to_text(wav)).strip()
+        except Exception as exc:
+            logger.warning("Segment %d transcription failed: %s", index, exc)
+            self._texts[index] = ""
+        await self._report_progress()
+
+    def _transcript_prefix(self) -> tuple[int, str]:
+        done = 0
+        while done < len(self._texts) and self._texts[done] is not None:
+            done += 1
+        return done, " ".join(t for t in self._texts[:done] if t)
+
+    async def _report_progress(self) -> None:
+        done, text = self._transcript_prefix()
+        if done > self._reported and self.on_partial is not None:
+            self._reported = done
+            try:
+                await self.on_partial(text)
+            except Exception as exc:
+                logger.warning("Partial transcript callback failed: %s", exc)
+
+    async def finish(self) -> str:
+        """Flush the open segment and return the full transcript."""
+        if self.end_of_speech_at is None:
+            self.end_of_speech_at = time.monotonic()
+        self._close_segment()
+        await asyncio.gather(*self._tasks)
+        return self._transcript_prefix()[1]
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
@@ -4,20 +4,38 @@ Text extraction service for uploaded documents.
 Supports PDF (via pdfplumber) and DOCX (via python-docx).
 Returns structured text with page/line metadata for downstream
 ingestion into Databricks Vector Search.
+
+Ingestion goes through extract_file_stream on a file already on disk.  For
+PDFs, page ranges of PDF_PAGES_PER_TASK are parsed in a process pool
+(PDF_EXTRACT_WORKERS) and chunks are yielded in page order as ranges
+complete.  At most two ranges per worker are in flight, and workers open the
+file from disk and release each page after reading it, so memory stays
+bounded regardless of page count.
 """
 
+import asyncio
 import io
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from typing import AsyncIterator, Iterator
 
 logger = logging.getLogger(__name__)
 
+_TXT_BLOCK_CHARS = 1024 * 1024
+
 
 @dataclass
 class ExtractedChunk:
     content: str
     page: int | None = None
     line: int | None = None
+    # Last page:line covered, set by app/services/chunking.py
+    end_page: int | None = None
+    end_line: int | None = None
 
 
 def extract_pdf(data: bytes) -> list[ExtractedChunk]:
@@ -40,13 +58,104 @@ def extract_pdf(data: bytes) -> list[ExtractedChunk]:
     return chunks
 
 
-def extract_docx(data: bytes) -> list[ExtractedChunk]:
+def _pdf_page_count(path: str) -> int:
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_pdf_pages(path: str, first: int, last: int) -> list[tuple[int, str]]:
+    """Text of pages first..last (1-based, inclusive).  Runs in a pool worker."""
+    import pdfplumber
+
+    pages: list[tuple[int, str]] = []
+    with pdfplumber.open(path, pages=list(range(first, last + 1))) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text()
+            if text and text.strip():
+                pages.append((page.page_number, text.strip()))
+            page.close()  # drop the parsed layout before the next page
+    return pages
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _pdf_workers() -> int:
+    from app.config import settings
+
+    return settings.PDF_EXTRACT_WORKERS or os.cpu_count() or 1
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn, not fork: the parent is a threaded asyncio process.
+        _pool = ProcessPoolExecutor(max_workers=_pdf_workers(), mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_pdf_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+async def extract_pdf_stream(path: str) -> AsyncIterator[ExtractedChunk]:
+    """Yield one chunk per page of the PDF at `path`, in page order, parsed in parallel."""
+    from app.config import settings
+
+    global _pool
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    try:
+        page_count = await loop.run_in_executor(pool, _pdf_page_count, path)
+    except BrokenProcessPool:
+        _pool = None
+        raise
+    except Exception as exc:
+        logger.error("PDF extraction failed: %s", exc)
+        raise ValueError(f"Failed to extract text from PDF: {exc}") from exc
+
+    step = max(1, settings.PDF_PAGES_PER_TASK)
+    ranges = [(first, min(first + step - 1, page_count)) for first in range(1, page_count + 1, step)]
+    window = 2 * _pdf_workers()
+    pending: list[asyncio.Future] = []
+    next_range = 0
+    found = False
+    try:
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < window:
+                pending.append(loop.run_in_executor(pool, _extract_pdf_pages, path, *ranges[next_range]))
+                next_range += 1
+            try:
+                pages = await pending.pop(0)
+            except BrokenProcessPool:
+                _pool = None
+                raise
+            except Exception as exc:
+                logger.error("PDF extraction failed: %s", exc)
+                raise ValueError(f"Failed to extract text from PDF: {exc}") from exc
+            for page_number, text in pages:
+                found = True
+                yield ExtractedChunk(content=text, page=page_number, line=1)
+    finally:
+        for future in pending:
+            future.cancel()
+
+    if not found:
+        raise ValueError("No text content found. PDF may be image-only.")
+
+
+def extract_docx(data: bytes | str) -> list[ExtractedChunk]:
     """Extract text from a DOCX file, returning chunks of grouped paragraphs."""
     from docx import Document
 
     chunks: list[ExtractedChunk] = []
     try:
-        doc = Document(io.BytesIO(data))
+        doc = Document(io.BytesIO(data) if isinstance(data, bytes) else data)
         current_text: list[str] = []
         line_num = 1
 
@@ -113,3 +222,44 @@ def extract_text(data: bytes, mime_type: str) -> list[ExtractedChunk]:
         return extract_txt(data)
     else:
         raise ValueError(f"Unsupported file type: {mime_type}")
+
+
+def _txt_pages(path: str) -> Iterator[tuple[int, str]]:
+    """(page, text) of a plain-text file, split at form feeds, read in blocks."""
+    page, buffer = 1, ""
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        for block in iter(lambda: fh.read(_TXT_BLOCK_CHARS), ""):
+            *complete, buffer = (buffer + block).split("\f")
+            for text in complete:
+                yield page, text
+                page += 1
+    yield page, buffer
+
+
+async def extract_file_stream(path: str, mime_type: str) -> AsyncIterator[ExtractedChunk]:
+    """Yield extracted chunks of the file at `path`, off the event loop, in page order.
+
+    PDFs are parsed page-parallel and plain text page by page (form feeds), so
+    neither is ever held whole; DOCX is parsed in one go by python-docx.
+    """
+    if mime_type == "application/pdf":
+        async for chunk in extract_pdf_stream(path):
+            yield chunk
+    elif mime_type in (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/msword",
+    ):
+        for chunk in await asyncio.to_thread(extract_docx, path):
+            yield chunk
+    elif mime_type.startswith("text/"):
+        pages = _txt_pages(path)
+        found = False
+        while (item := await asyncio.to_thread(next, pages, None)) is not None:
+            page, text = item
+            if text.strip():
+                found = True
+                yield ExtractedChunk(content=text.strip(), page=page, line=1)
+        if not found:
+            raise ValueError("No text content found in file.")
+    else:
+        raise ValueError(f"Unsupported file type: {mime_type}")
@@ -0,0 +1,72 @@
+"""
+Append-only session transcript storage.
+
+Each interrogator question / witness answer is stored as one TranscriptSegment
+row keyed by (sessionId, sequence), so a turn costs a single fixed-size INSERT
+no matter how long the deposition has run.  Session.transcriptRaw is kept as a
+materialized copy that is only rebuilt on demand (session end, brief
+generation) instead of being rewritten on every turn.
+"""
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.session import Session
+from app.models.transcript_segment import TranscriptSegment
+
+
+def format_transcript_line(speaker: str | None, content: str) -> str:
+    # Segments backfilled from a legacy transcriptRaw carry no speaker and
+    # already contain "[SPEAKER]: ..." lines.
+    if not speaker:
+        return content.strip()
+    return f"[{speaker}]: {content}".strip()
+
+
+async def append_transcript_segment(db: AsyncSession, session: Session, speaker: str, content: str) -> None:
+    """Stage one transcript line for insert.  Caller commits.
+
+    The sequence number is computed inside the INSERT from the
+    (sessionId, sequence) unique index, so no prior read is needed.  Two
+    appends to one session (a question persisting while an answer lands)
+    would compute the same MAX, so the session's transaction-scoped advisory
+    lock is taken first; it is held until the caller commits.
+    """
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(session.id))))
+    next_sequence = (
+        select(func.coalesce(func.max(TranscriptSegment.sequence), 0) + 1)
+        .where(TranscriptSegment.session_id == session.id)
+        .scalar_subquery()
+    )
+    db.add(TranscriptSegment(
+        session_id=session.id,
+        firm_id=session.firm_id,
+        sequence=next_sequence,
+        speaker_role=speaker,
+        content=content,
+    ))
+
+
+async def assemble_transcript(db: AsyncSession, session: Session) -> str:
+    """Build the full transcript text from the segment store.
+
+    Falls back to the legacy Session.transcriptRaw column for sessions that
+    were recorded before segments existed.
+    """
+    result = await db.execute(
+        select(TranscriptSegment.speaker_role, TranscriptSegment.content)
+        .where(TranscriptSegment.session_id == session.id)
+        .order_by(TranscriptSegment.sequence)
+    )
+    rows = result.all()
+    if not rows:
+        return session.transcript_raw or ""
+    return "\n".join(format_transcript_line(speaker, content) for speaker, content in rows)
+
+
+async def materialize_transcript(db: AsyncSession, session: Session) -> str:
+    """Rebuild Session.transcriptRaw from the segments.  Caller commits."""
+    transcript = await assemble_transcript(db, session)
+    if transcript:
+        session.transcript_raw = transcript
+    return transcript
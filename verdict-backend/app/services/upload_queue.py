@@ -0,0 +1,117 @@
+"""
+Background S3 upload queue for objects no response waits on.
+
+enqueue_upload() returns immediately; S3_UPLOAD_WORKERS tasks drain the queue
+through s3.upload_bytes_async, retrying failures with exponential backoff up
+to S3_UPLOAD_MAX_RETRIES.  When an upload is finally given up on (or the
+queue is full) the job's on_failure callback runs, so the caller can clear
+the key it already recorded.
+
+Workers are started in the FastAPI lifespan (or lazily on first enqueue, for
+scripts) and drained on shutdown.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from app.config import settings
+from app.services.s3 import upload_bytes_async
+
+logger = logging.getLogger(__name__)
+
+OnFailure = Callable[[str], Awaitable[None]]
+
+
+@dataclass
+class _UploadJob:
+    key: str
+    data: bytes
+    content_type: str
+    on_failure: OnFailure | None = None
+
+
+_queue: asyncio.Queue | None = None
+_workers: list[asyncio.Task] = []
+_stats = {"enqueued": 0, "uploaded": 0, "retried": 0, "failed": 0, "dropped": 0}
+
+
+def upload_queue_stats() -> dict:
+    return {**_stats, "pending": _queue.qsize() if _queue is not None else 0}
+
+
+async def _give_up(job: _UploadJob) -> None:
+    if job.on_failure is None:
+        return
+    try:
+        await job.on_failure(job.key)
+    except Exception as exc:
+        logger.warning("Upload failure callback for %s failed: %s", job.key, exc)
+
+
+async def _upload_with_retries(job: _UploadJob) -> None:
+    for attempt in range(settings.S3_UPLOAD_MAX_RETRIES + 1):
+        try:
+            await upload_bytes_async(job.key, job.data, job.content_type)
+            _stats["uploaded"] += 1
+            return
+        except Exception as exc:
+            if attempt == settings.S3_UPLOAD_MAX_RETRIES:
+                _stats["failed"] += 1
+                logger.error("Upload of %s failed after %d attempts: %s", job.key, attempt + 1, exc)
+                await _give_up(job)
+                return
+            _stats["retried"] += 1
+            await asyncio.sleep(0.5 * 2 ** attempt)
+
+
+async def _worker() -> None:
+    while True:
+        job = await _queue.get()
+        try:
+            await _upload_with_retries(job)
+        finally:
+            _queue.task_done()
+
+
+def start_upload_workers() -> None:
+    global _queue
+    if _workers:
+        return
+    _queue = asyncio.Queue(maxsize=settings.S3_UPLOAD_QUEUE_MAX)
+    _workers.extend(asyncio.create_task(_worker()) for _ in range(settings.S3_UPLOAD_WORKERS))
+
+
+async def stop_upload_workers(timeout: float = 30.0) -> None:
+    """Give queued uploads up to `timeout` seconds to finish, then stop the workers."""
+    if not _workers:
+        return
+    try:
+        await asyncio.wait_for(_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Shutting down with %d uploads still queued", _queue.qsize())
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+
+def enqueue_upload(
+    key: str,
+    data: bytes,
+    content_type: str = "application/octet-stream",
+    on_failure: OnFailure | None = None,
+) -> bool:
+    """Queue an upload without waiting for it.  Returns False if the queue is full."""
+    start_upload_workers()
+    job = _UploadJob(key=key, data=data, content_type=content_type, on_failure=on_failure)
+    try:
+        _queue.put_nowait(job)
+    except asyncio.QueueFull:
+        _stats["dropped"] += 1
+        logger.error("Upload queue full, dropping %s", key)
+        asyncio.create_task(_give_up(job))
+        return False
+    _stats["enqueued"] += 1
+    return True
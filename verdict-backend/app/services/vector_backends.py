@@ -0,0 +1,161 @@
+"""
+Pluggable storage backends behind app/services/databricks_vector.py.
+
+  databricks — the FastAPI retrieval proxy wrapping Databricks Vector Search.
+  local      — on-disk, memory-mapped per-case embedding matrices searched with
+               NumPy (app/services/local_vector.py).  No outside service.
+
+VECTOR_BACKEND selects one; "auto" uses Databricks when DATABRICKS_HOST and
+DATABRICKS_TOKEN are set and the local index otherwise, so retrieval never
+silently degrades to [] on single-node deployments.
+
+A backend only moves records in and out of an index.  Caching, batching and
+retries stay in databricks_vector.py so they apply to every backend.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+
+from app.config import settings
+from app.services.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class VectorBackend(ABC):
+    name = "base"
+
+    def configured(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def search(
+        self,
+        index: str,
+        query: str,
+        top_k: int,
+        columns: list[str],
+        filters: dict | None = None,
+    ) -> list[dict]:
+        """Return up to top_k records (restricted to `columns`).  Raises on failure."""
+
+    @abstractmethod
+    async def upsert(self, index: str, records: list[dict]) -> list[str]:
+        """Insert or replace records by "id".  Returns the ids that were rejected."""
+
+    @abstractmethod
+    async def delete(self, index: str, ids: list[str], case_id: str | None = None) -> None:
+        """Remove records by "id" (from the case's partition, where the backend has one)."""
+
+
+def _normalize_results(resp_data: dict | list) -> list[dict]:
+    """Normalize various response formats into a flat list of dicts."""
+    if isinstance(resp_data, list):
+        return resp_data
+
+    if isinstance(resp_data, dict):
+        if "results" in resp_data:
+            return resp_data["results"] if isinstance(resp_data["results"], list) else []
+        if "data" in resp_data:
+            return resp_data["data"] if isinstance(resp_data["data"], list) else []
+        if "manifest" in resp_data and "result" in resp_data:
+            cols = [c["name"] for c in resp_data.get("manifest", {}).get("columns", [])]
+            rows = resp_data.get("result", {}).get("data_array", [])
+            return [dict(zip(cols, row)) for row in rows]
+        return [resp_data]
+
+    return []
+
+
+class DatabricksBackend(VectorBackend):
+    """Calls the retrieval proxy (e.g. http://127.0.0.1:8000/api/retrieve).
+
+    The proxy accepts POST requests with a JSON body and returns matching
+    documents.  Authentication is via Bearer token in the Authorization header.
+    """
+
+    name = "databricks"
+
+    def configured(self) -> bool:
+        return bool(settings.DATABRICKS_HOST and settings.DATABRICKS_TOKEN)
+
+    @staticmethod
+    def _headers() -> dict:
+        return {
+            "Authorization": f"Bearer {settings.DATABRICKS_TOKEN}",
+            "Content-Type": "application/json",
+        }
+
+    async def search(self, index, query, top_k, columns, filters=None) -> list[dict]:
+        payload = {
+            "query": query,
+            "index_name": index,
+            "endpoint_name": settings.DATABRICKS_VECTOR_ENDPOINT,
+            "num_results": top_k,
+            "columns": columns,
+        }
+        if filters:
+            payload["filters"] = filters
+        # Relative to the pooled client's base_url (DATABRICKS_HOST).
+        resp = await get_http_client("databricks").post(
+            settings.DATABRICKS_RETRIEVE_PATH, json=payload, headers=self._headers(),
+        )
+        resp.raise_for_status()
+        return _normalize_results(resp.json())
+
+    async def upsert(self, index, records) -> list[str]:
+        client = get_http_client("databricks")
+        payload = {
+            "index_name": index,
+            "endpoint_name": settings.DATABRICKS_VECTOR_ENDPOINT,
+            "data": records,
+        }
+        resp = await client.post("/api/upsert", json=payload, headers=self._headers())
+        if resp.status_code == 404:
+            payload_alt = {"action": "upsert", "index_name": index, "records": records}
+            resp = await client.post(settings.DATABRICKS_RETRIEVE_PATH, json=payload_alt, headers=self._headers())
+        resp.raise_for_status()
+
+        # Databricks Vector Search reports partial failures as
+        # {"result": {"failed_primary_keys": [...]}}.
+        try:
+            body = resp.json()
+        except ValueError:
+            return []
+        if not isinstance(body, dict):
+            return []
+        result = body.get("result") if isinstance(body.get("result"), dict) else body
+        return [str(k) for k in result.get("failed_primary_keys") or []]
+
+    async def delete(self, index, ids, case_id=None) -> None:
+        client = get_http_client("databricks")
+        payload = {
+            "index_name": index,
+            "endpoint_name": settings.DATABRICKS_VECTOR_ENDPOINT,
+            "primary_keys": ids,
+        }
+        resp = await client.post("/api/delete", json=payload, headers=self._headers())
+        if resp.status_code == 404:
+            payload_alt = {"action": "delete", "index_name": index, "primary_keys": ids}
+            resp = await client.post(settings.DATABRICKS_RETRIEVE_PATH, json=payload_alt, headers=self._headers())
+        resp.raise_for_status()
+
+
+_backend: VectorBackend | None = None
+
+
+def get_vector_backend() -> VectorBackend:
+    global _backend
+    if _backend is None:
+        choice = settings.VECTOR_BACKEND.lower()
+        if choice == "auto":
+            choice = "databricks" if DatabricksBackend().configured() else "local"
+        if choice == "databricks":
+            _backend = DatabricksBackend()
+        elif choice == "local":
+            from app.services.local_vector import LocalVectorBackend
+            _backend = LocalVectorBackend(settings.LOCAL_VECTOR_DIR)
+        else:
+            raise ValueError(f"Unknown VECTOR_BACKEND: {settings.VECTOR_BACKEND}")
+        logger.info("Vector backend: %s", _backend.name)
+    return _backend
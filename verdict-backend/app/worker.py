@@ -0,0 +1,217 @@
+"""
+Document ingestion worker.
+
+    python -m app.worker
+
+Runs INGEST_WORKER_CONCURRENCY ingestion slots against the durable queue in
+app/services/job_queue.py.  With INGEST_QUEUE_CONSUMER="api" (the default)
+the API process runs consume() itself, so a bulk upload holds at most that
+many ingestions alongside live sessions; with "worker" it is left to one or
+more of these processes, so bulk uploads never compete with live sessions
+for the API's event loop.  The queue hands each job to one consumer.  The
+Procfile has no worker entry: add `worker: python -m app.worker` once the
+deployment meets the conditions below and sets INGEST_QUEUE_CONSUMER=worker.
+
+Ingestion writes the stored file, the vector index and the per-case BM25
+index.  A separate worker only works when the API can see those writes, so
+it refuses to start unless storage is S3 and the vector index Databricks,
+and either hybrid retrieval is off or INGEST_WORKER_SHARED_DISK says the
+local index directories are on a volume shared with the API.
+
+Per job: the visibility deadline is heartbeated while ingestion runs.
+Unexpected errors are retried with exponential backoff (INGEST_RETRY_BASE_S,
+doubling) up to INGEST_MAX_ATTEMPTS, then the job is dead-lettered and the
+document marked FAILED.  Bad input (unsupported or empty files) fails
+immediately, as before.
+
+On startup, documents left in UPLOADING/INDEXING with no queued job (for
+example from before the queue existed), and PENDING documents whose file is
+in storage (confirmed while Redis was down, or a retry whose job was lost),
+are re-enqueued.  SIGTERM/SIGINT
+stop new claims and let running jobs finish.
+"""
+
+import asyncio
+import logging
+import signal
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.models.document import Document
+from app.redis_client import redis_client
+from app.services import job_queue
+from app.services.http_clients import close_http_clients, init_http_clients
+from app.services.ingestion import run_ingestion
+from app.services.s3 import object_exists_async, shutdown_s3
+from app.services.storage_backends import get_storage_backend
+from app.services.vector_backends import get_vector_backend
+from app.services.text_extraction import shutdown_pdf_pool
+from app.services.upload_queue import start_upload_workers, stop_upload_workers
+
+logger = logging.getLogger("app.worker")
+
+
+async def _set_status(document_id: str, status: str, error: str) -> None:
+    async with AsyncSessionLocal() as db:
+        document = await db.get(Document, document_id)
+        if document is not None:
+            document.ingestion_status = status
+            document.ingestion_error = error
+            if status == "FAILED":
+                document.ingestion_completed_at = datetime.utcnow()
+            await db.commit()
+
+
+async def _heartbeat(document_id: str) -> None:
+    while True:
+        await asyncio.sleep(settings.INGEST_VISIBILITY_TIMEOUT_S / 3)
+        await job_queue.extend(document_id)
+
+
+async def _run_job(document_id: str, firm_id: str, attempt: int) -> None:
+    if attempt > settings.INGEST_MAX_ATTEMPTS:
+        # Claimed this many times without finishing: workers keep dying on it.
+        error = f"Ingestion abandoned after {attempt - 1} attempts"
+        await job_queue.bury(document_id, firm_id, error)
+        await _set_status(document_id, "FAILED", error)
+        return
+
+    heartbeat = asyncio.create_task(_heartbeat(document_id))
+    try:
+        async with AsyncSessionLocal() as db:
+            document = await db.get(Document, document_id)
+            if document is not None:
+                await run_ingestion(document, db, raise_unexpected=attempt < settings.INGEST_MAX_ATTEMPTS)
+        await job_queue.ack(document_id)
+    except Exception as exc:
+        if attempt < settings.INGEST_MAX_ATTEMPTS:
+            logger.warning("Ingestion of %s failed (attempt %d), retrying: %s", document_id, attempt, exc)
+            await job_queue.retry_later(document_id, attempt, str(exc))
+            await _set_status(document_id, "PENDING", f"Attempt {attempt} failed, retrying: {exc}")
+        else:
+            logger.error("Ingestion of %s failed after %d attempts: %s", document_id, attempt, exc)
+            await job_queue.bury(document_id, firm_id, str(exc))
+            await _set_status(document_id, "FAILED", f"Unexpected error: {exc}")
+    finally:
+        heartbeat.cancel()
+
+
+async def _slot(index: int, stopping: asyncio.Event) -> None:
+    while not stopping.is_set():
+        try:
+            job = await job_queue.claim()
+        except Exception as exc:
+            logger.warning("Slot %d could not claim a job: %s", index, exc)
+            job = None
+        if job is None:
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=settings.INGEST_POLL_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        document_id, firm_id, attempt = job
+        logger.info("Slot %d ingesting %s (firm %s, attempt %d)", index, document_id, firm_id, attempt)
+        try:
+            await _run_job(document_id, firm_id, attempt)
+        except Exception as exc:
+            # Queue bookkeeping failed; the visibility timeout will hand the job out again.
+            logger.error("Slot %d lost track of %s: %s", index, document_id, exc)
+
+
+async def _maintenance(stopping: asyncio.Event) -> None:
+    while not stopping.is_set():
+        try:
+            expired = await job_queue.requeue_expired()
+            due = await job_queue.promote_delayed()
+            if expired or due:
+                logger.info("Requeued %d expired and %d delayed ingestion jobs", expired, due)
+        except Exception as exc:
+            logger.warning("Queue maintenance failed: %s", exc)
+        try:
+            await asyncio.wait_for(stopping.wait(), timeout=5 * settings.INGEST_POLL_INTERVAL_S)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _recover_orphans() -> None:
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.INGEST_VISIBILITY_TIMEOUT_S)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Document.id, Document.firm_id, Document.ingestion_status, Document.s3_key).where(
+                Document.ingestion_status.in_(("PENDING", "UPLOADING", "INDEXING")),
+                Document.updated_at < cutoff,
+            )
+        )
+        rows = result.all()
+    recovered = 0
+    for document_id, firm_id, status, s3_key in rows:
+        if await job_queue.is_queued(document_id):
+            continue
+        # A PENDING document whose file never arrived is an abandoned upload.
+        if status == "PENDING" and not (s3_key and await object_exists_async(s3_key)):
+            continue
+        recovered += await job_queue.enqueue_ingestion(document_id, firm_id)
+    if recovered:
+        logger.info("Re-enqueued %d documents stuck before or mid-ingestion", recovered)
+
+
+async def consume(stopping: asyncio.Event) -> None:
+    """Run the ingestion slots and queue maintenance until stopping is set."""
+    try:
+        await _recover_orphans()
+    except Exception as exc:
+        logger.warning("Orphaned ingestion recovery failed: %s", exc)
+    logger.info("Ingestion consumer started with %d slots", settings.INGEST_WORKER_CONCURRENCY)
+    await asyncio.gather(
+        _maintenance(stopping),
+        *(_slot(i, stopping) for i in range(settings.INGEST_WORKER_CONCURRENCY)),
+    )
+
+
+def unshared_state() -> list[str]:
+    """What a separate worker process would write where the API cannot read it."""
+    problems = []
+    if get_storage_backend().name != "s3":
+        problems.append("storage backend is local disk (LOCAL_STORAGE_DIR)")
+    if get_vector_backend().name != "databricks":
+        problems.append("vector index is local disk (LOCAL_VECTOR_DIR)")
+    if settings.HYBRID_RETRIEVAL_ENABLED:
+        problems.append("BM25 index is local disk (LEXICAL_INDEX_DIR)")
+    return [] if settings.INGEST_WORKER_SHARED_DISK else problems
+
+
+async def main() -> None:
+    if not settings.INGEST_QUEUE_ENABLED or settings.INGEST_QUEUE_CONSUMER != "worker":
+        raise SystemExit("Set INGEST_QUEUE_ENABLED=true and INGEST_QUEUE_CONSUMER=worker to run a separate ingestion worker.")
+    problems = unshared_state()
+    if problems:
+        raise SystemExit(
+            "Refusing to start a separate ingestion worker: " + "; ".join(problems)
+            + ".  Use S3 and Databricks, or set INGEST_WORKER_SHARED_DISK=true if these"
+            " directories are on a volume shared with the API."
+        )
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+
+    init_http_clients()
+    start_upload_workers()
+    try:
+        await consume(stopping)
+    finally:
+        await stop_upload_workers()
+        shutdown_s3()
+        shutdown_pdf_pool()
+        await close_http_clients()
+        await engine.dispose()
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""Benchmark per-call latency: fresh httpx client per call vs the shared pool.
+
+Usage (from verdict-backend/):
+    python scripts/bench_http_pool.py                       # OpenRouter /models via the nemotron pool
+    python scripts/bench_http_pool.py --upstream databricks --path /health -n 50
+
+The "fresh" column is what every live-path call paid before the pooled
+clients in app/services/http_clients.py: a new TCP + TLS handshake per request.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.http_clients import get_http_client, close_http_clients  # noqa: E402
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"{label:<8} n={len(samples):<4} mean={statistics.mean(samples):7.1f}ms "
+        f"p50={statistics.median(samples):7.1f}ms p95={p95:7.1f}ms"
+    )
+
+
+async def _time_fresh(base_url: str, path: str, n: int) -> list[float]:
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            await client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def _time_pooled(upstream: str, path: str, n: int) -> list[float]:
+    client = get_http_client(upstream)
+    await client.get(path)  # warm the connection, as the app lifespan would
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--upstream", default="nemotron", choices=["databricks", "nemotron", "elevenlabs"])
+    parser.add_argument("--path", default="/models")
+    parser.add_argument("-n", type=int, default=20)
+    args = parser.parse_args()
+
+    base_url = str(get_http_client(args.upstream).base_url)
+    print(f"GET {base_url.rstrip('/')}{args.path}  x{args.n}")
+
+    fresh = await _time_fresh(base_url, args.path, args.n)
+    pooled = await _time_pooled(args.upstream, args.path, args.n)
+    await close_http_clients()
+
+    print(_summary("fresh", fresh))
+    print(_summary("pooled", pooled))
+    print(f"saved    {statistics.mean(fresh) - statistics.mean(pooled):.1f}ms per call (mean)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,294 @@
+"""Recall@k benchmark: vector-only vs BM25-only vs hybrid (RRF) prior-statement retrieval.
+
+Usage (from verdict-backend/):
+    python scripts/bench_hybrid_recall.py
+    python scripts/bench_hybrid_recall.py --transcripts depositions/ --eval eval/queries.jsonl -k 1 3 5
+
+Real transcripts: --transcripts is a directory of plain-text deposition
+transcripts (one file per document, pages separated by form feeds, "12" or
+"Page 12" headers and numbered lines as printed).  They are chunked exactly as
+ingestion chunks them (chunk_for_retrieval) and all go into one case, so every
+other document is a distractor.  --eval takes JSONL rows of
+{"query": <live witness answer>, "relevant": [<substring of the prior
+testimony it should retrieve>, ...]}.
+
+Without them the built-in set below is used: two deposition transcripts from
+the Lyman v. CCTD case in data/verdict_cases.json, laid out on numbered
+transcript pages, plus every case-file sentence of all five cases as extra
+documents in the same case.  The transcripts deliberately cover the same
+topics more than once with different specifics (shift lengths on other days,
+other routes, other emails and incidents), and the queries are live answers
+that contradict or restate earlier testimony in different words, so they do
+not share the relevant chunk's numbers, dates or phrasing.
+
+The indexes are built in a temp dir with the local backends (hashed-feature
+vectors, not a learned embedding), so no outside service is needed; rerun
+against a configured Databricks index for vector numbers that matter.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import settings  # noqa: E402
+from app.services import lexical_index  # noqa: E402
+from app.services.chunking import chunk_for_retrieval  # noqa: E402
+from app.services.local_vector import LocalVectorBackend  # noqa: E402
+from app.services.text_extraction import ExtractedChunk  # noqa: E402
+
+INDEX = "bench_prior_statements"
+CASE_ID = "bench_case"
+
+HENSLEY = [
+    ("Please state your name and position for the record.",
+     "Mark Hensley. I'm the route supervisor for Capital City Transit District."),
+    ("How long have you held that position?", "Since the spring of 2019, so almost seven years."),
+    ("What routes do you supervise?", "Routes 9, 12 and 14 out of the Eastside depot."),
+    ("Who builds the weekly driver schedule for those routes?",
+     "I do. Dispatch enters it, but I sign off on every rotation."),
+    ("What is the maximum shift a CCTD driver may work?",
+     "Ten hours behind the wheel. That's section 4.2 of the policy manual."),
+    ("Are there exceptions to the ten-hour cap?",
+     "Only with written approval from the operations director, and only for weather emergencies."),
+    ("Did anyone request such an exception in January 2026?", "Not that I'm aware of."),
+    ("Turning to January 12th. Who was driving Bus 4417?", "Dale Pruitt. He'd been with us about three years."),
+    ("When did Mr. Pruitt's shift start that day?",
+     "The log shows he clocked in at 12:05 a.m. for the overnight run and stayed on."),
+    ("So by 2:32 p.m. he had been on duty for how long?", "Fourteen and a half hours, according to the log."),
+    ("Did you approve that?", "I approved him covering the overnight. I didn't know he stayed on for the day block."),
+    ("Who would have known?", "Dispatch should have flagged it. The system shows a warning after ten hours."),
+    ("Did the system show that warning on January 12th?", "I believe it did, yes. Nobody acted on it."),
+    ("What about the week before, January 5th through 9th?",
+     "Two drivers on Route 12 went to eleven hours on the 7th because of the snow. That was approved."),
+    ("Any other drivers over ten hours that week?", "Not on Route 9. I checked after the accident."),
+    ("You told the police that all drivers were within shift limits that week, correct?",
+     "That's what I believed when I said it."),
+    ("When did you learn that was not accurate?", "A few days later, when I pulled Pruitt's log."),
+    ("Let's talk about staffing. How many drivers does Route 9 need on a weekday?",
+     "Fourteen to cover every block."),
+    ("How many did you have in January?", "Eleven, sometimes ten when people called out."),
+    ("And Route 12?", "Route 12 was fully staffed, sixteen of sixteen."),
+    ("You wrote to HR on January 5th about Route 9?",
+     "Yes. I said we were dangerously short and I might have to double people up."),
+    ("What did HR say?", "They said the hiring freeze stayed in place until March."),
+    ("Did you write to HR about Route 14?", "In November, about a mechanic shortage, not drivers."),
+    ("The internal memo from December 2025, who wrote it?",
+     "Operations. It went to me and the director. It said Route 9 was understaffed and overtime was climbing."),
+    ("Did you respond to the memo?", "I forwarded it to HR with a note asking for two more hires."),
+    ("Let's go to Exhibit A, the dashcam footage. Have you seen it?", "Yes, the clip from 14:31 to 14:33."),
+    ("What does it show three seconds before impact?",
+     "The driver looking down at something in his lap. It looks like a phone."),
+    ("Is personal phone use allowed while driving?",
+     "No. Phones go in the locker or in the bag behind the seat."),
+    ("Had Mr. Pruitt been disciplined for phone use before?", "Once, a verbal warning in August 2025."),
+    ("Was the signal red when the bus entered the intersection?",
+     "From the footage, yes. It had turned red about a second and a half earlier."),
+    ("Where was Ms. Lyman?", "In the crosswalk on the north side of Main, walking east."),
+    ("Are you aware of prior incidents on Route 9?", "There were three between July and December of last year."),
+    ("Describe them.",
+     "A mirror strike in July, a rear-end collision at 3rd and Oak in September, and a curb strike in November."),
+    ("Were any of those drivers over ten hours?",
+     "The September one, I believe. The driver was at about eleven and a half."),
+    ("Did those incidents prompt any change in scheduling?", "We talked about it. We didn't change the rotation."),
+    ("Route 14 incidents over the same period?", "One, a minor sideswipe in the depot yard in October."),
+    ("You spoke to the internal review board on January 20th?", "Yes, with counsel present."),
+    ("And you told the board staffing on Route 9 was adequate?",
+     "I said we had adequate staffing in January. I was counting the drivers who picked up extra blocks."),
+    ("Who reviews the shift logs each week?",
+     "I do, on Mondays. I look for anyone over fifty hours for the week."),
+    ("Did you review the log for the week of January 12th?",
+     "Not until after the accident. The Monday review was skipped because of the storm."),
+    ("What training do drivers get on fatigue?", "A two-hour module at onboarding and a refresher every year."),
+    ("When did Mr. Pruitt last take the refresher?", "His file shows March 2025."),
+    ("Does CCTD have any rule on rest between shifts?",
+     "Eight hours off between the end of one shift and the start of the next."),
+    ("Did Mr. Pruitt get eight hours off before the January 12th shift?",
+     "He finished on the 11th at 4:40 p.m., so yes, he had more than that."),
+    ("How fast was the bus travelling?", "The telematics say 27 miles an hour in a 30 zone."),
+    ("Did the bus brake before the crosswalk?", "Not until after the impact, from what I saw."),
+]
+
+ALVAREZ = [
+    ("What is your job at CCTD?", "I'm the day dispatcher at the Eastside depot."),
+    ("Does the dispatch system warn when a driver passes ten hours?",
+     "It turns the driver's row orange at ten hours and red at twelve."),
+    ("What did you see on January 12th for Bus 4417?", "I came on at 6 a.m. and his row was already orange."),
+    ("Did you tell anyone?",
+     "I messaged Mark Hensley around 9. He said to keep Pruitt on until the relief driver showed up."),
+    ("Did a relief driver show up?", "No. The relief driver called out sick."),
+    ("How often did drivers on Route 9 run past ten hours in January?", "Most weeks, two or three times."),
+    ("And on Route 12?", "Hardly ever. Route 12 had a full board."),
+    ("Did anyone in management tell you to stop flagging long shifts?",
+     "No, but nobody responded when I did."),
+    ("Do drivers keep phones on them?",
+     "Some do. They're supposed to leave them in the bag behind the seat."),
+    ("Did you speak to Mr. Pruitt by radio that afternoon?",
+     "Once, at about 2:15, about a detour on 5th Avenue."),
+    ("How did he sound?", "Tired. He asked me twice which detour I meant."),
+    ("Did you record the 9 a.m. message to Mr. Hensley anywhere?",
+     "It's in the dispatch chat log. I printed it for the investigators."),
+]
+
+# (live witness answer, substrings of the prior testimony it should retrieve)
+QUERIES = [
+    ("No, every driver on my routes was under the cap that whole week.",
+     ["Fourteen and a half hours", "That's what I believed when I said it"]),
+    ("We had the people we needed on that route.", ["Eleven, sometimes ten", "dangerously short"]),
+    ("I never raised any concern with human resources about that route.", ["dangerously short"]),
+    ("Nobody warned us about staffing before the accident.", ["It said Route 9 was understaffed"]),
+    ("He was watching the road the whole time.", ["It looks like a phone"]),
+    ("The light was still yellow when he went through.", ["It had turned red"]),
+    ("She stepped out between parked cars, nowhere near the crossing.", ["In the crosswalk on the north side"]),
+    ("That route had a clean record before this.", ["There were three between July"]),
+    ("He'd never been written up for anything like that.", ["verbal warning in August 2025"]),
+    ("The dispatch software never flagged him.", ["Nobody acted on it", "his row was already orange"]),
+    ("I checked the logs that Monday like I always do.", ["The Monday review was skipped"]),
+    ("He braked hard as soon as he saw her.", ["Not until after the impact"]),
+    ("He was flying, well over the limit.", ["27 miles an hour"]),
+    ("None of the earlier accidents involved tired drivers.", ["about eleven and a half"]),
+    ("The director signed off on the long shifts in advance.",
+     ["Not that I'm aware of", "He said to keep Pruitt on"]),
+    ("I told the review board we were short-handed.", ["I said we had adequate staffing in January"]),
+    ("I had no idea he was still driving that afternoon.", ["I messaged Mark Hensley around 9"]),
+    ("He sounded alert and sharp on the radio.", ["He asked me twice which detour I meant"]),
+]
+
+_LINES_PER_PAGE = 25
+_LINE_WIDTH = 56
+
+
+def _transcript_pages(qa: list[tuple[str, str]], first_page: int) -> list[str]:
+    """Lay Q/A pairs out as printed transcript pages: page header, numbered wrapped lines."""
+    lines = []
+    for question, answer in qa:
+        for prefix, text in (("Q.", question), ("A.", answer)):
+            lines += textwrap.wrap(f"{prefix} {text}", _LINE_WIDTH)
+    pages = []
+    for start in range(0, len(lines), _LINES_PER_PAGE):
+        body = lines[start:start + _LINES_PER_PAGE]
+        numbered = [f"{n:>2}   {text}" for n, text in enumerate(body, start=1)]
+        pages.append("\n".join([str(first_page + len(pages))] + numbered))
+    return pages
+
+
+def _chunk_document(doc_id: str, pages: list[str]) -> list[dict]:
+    chunks = chunk_for_retrieval([ExtractedChunk(content=p, page=i, line=1) for i, p in enumerate(pages, start=1)])
+    rows, seen = [], set()
+    for chunk in chunks:
+        record_id = f"{doc_id}_{chunk.page}_{chunk.line}"
+        while record_id in seen:
+            record_id += "_"
+        seen.add(record_id)
+        rows.append({"case_id": CASE_ID, "id": record_id, "content": chunk.content,
+                     "page": chunk.page, "line": chunk.line})
+    return rows
+
+
+def _builtin_set() -> tuple[list[dict], list[dict]]:
+    corpus = _chunk_document("hensley", _transcript_pages(HENSLEY, first_page=14))
+    corpus += _chunk_document("alvarez", _transcript_pages(ALVAREZ, first_page=3))
+    path = os.path.join(os.path.dirname(__file__), "..", "data", "verdict_cases.json")
+    with open(path) as fh:
+        cases = json.load(fh)
+    for case in cases:
+        text = " ".join(case.get(f) or "" for f in ("extracted_facts", "prior_statements", "exhibit_list"))
+        sentences = [s.strip() for s in re.split(r"(?<=[.;:])\s+", text) if len(s.split()) >= 5]
+        corpus += [
+            {"case_id": CASE_ID, "id": f"{case['id']}_{i}", "content": s, "page": None, "line": None}
+            for i, s in enumerate(sentences)
+        ]
+    queries = [{"query": q, "relevant": relevant} for q, relevant in QUERIES]
+    return corpus, queries
+
+
+def _load_transcripts(directory: str) -> list[dict]:
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), encoding="utf-8", errors="replace") as fh:
+            pages = fh.read().split("\f")
+        corpus += _chunk_document(os.path.splitext(name)[0], pages)
+    return corpus
+
+
+def _load_queries(path: str) -> list[dict]:
+    with open(path) as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def _norm(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _recall(ranked_ids: list[str], relevant: list[str], k: int) -> float:
+    return len(set(ranked_ids[:k]) & set(relevant)) / len(relevant) if relevant else 0.0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transcripts", help="directory of plain-text deposition transcripts")
+    parser.add_argument("--eval", help="JSONL of {query, relevant} rows for --transcripts")
+    parser.add_argument("-k", type=int, nargs="+", default=[1, 3, 5])
+    args = parser.parse_args()
+    if bool(args.transcripts) != bool(args.eval):
+        parser.error("--transcripts and --eval go together")
+
+    if args.transcripts:
+        corpus, queries = _load_transcripts(args.transcripts), _load_queries(args.eval)
+    else:
+        corpus, queries = _builtin_set()
+    for q in queries:
+        q["relevant_ids"] = [
+            c["id"] for c in corpus if any(_norm(s) in _norm(c["content"]) for s in q["relevant"])
+        ]
+    missing = [q["query"] for q in queries if not q["relevant_ids"]]
+    if missing:
+        print(f"warning: {len(missing)} queries match no chunk and are skipped: {missing}")
+    queries = [q for q in queries if q["relevant_ids"]]
+    max_k = max(args.k)
+    candidates = max_k * settings.HYBRID_CANDIDATE_MULTIPLIER
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.LEXICAL_INDEX_DIR = os.path.join(tmp, "lexical")
+        vector = LocalVectorBackend(os.path.join(tmp, "vector"))
+        await vector.upsert(INDEX, corpus)
+        lexical_index.index_records(CASE_ID, corpus)
+
+        recalls = {name: {k: [] for k in args.k} for name in ("vector", "bm25", "hybrid")}
+        latency = {name: [] for name in recalls}
+        for q in queries:
+            start = time.perf_counter()
+            [vec_hits] = vector.search_many(INDEX, [q["query"]], candidates, {"case_id": CASE_ID})
+            vec = [record for _, record in vec_hits]
+            latency["vector"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            bm25 = [record for _, record in lexical_index.search_lexical(CASE_ID, q["query"], candidates)]
+            latency["bm25"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            hybrid = lexical_index.reciprocal_rank_fusion([vec, bm25], k=settings.HYBRID_RRF_K)
+            latency["hybrid"].append(time.perf_counter() - start + latency["vector"][-1] + latency["bm25"][-1])
+
+            for name, ranked in (("vector", vec), ("bm25", bm25), ("hybrid", hybrid)):
+                ids = [r["id"] for r in ranked]
+                for k in args.k:
+                    recalls[name][k].append(_recall(ids, q["relevant_ids"], k))
+
+    print(f"{len(queries)} queries over {len(corpus)} chunks")
+    header = "".join(f"  recall@{k:<3}" for k in args.k)
+    print(f"{'method':<8}{header}  mean latency")
+    for name in recalls:
+        cells = "".join(f"  {statistics.mean(recalls[name][k]):9.3f}" for k in args.k)
+        print(f"{name:<8}{cells}  {statistics.mean(latency[name]) * 1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
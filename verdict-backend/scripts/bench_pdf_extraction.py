@@ -0,0 +1,104 @@
+"""Pages/second benchmark for page-parallel PDF extraction (app/services/text_extraction.py).
+
+Usage (from verdict-backend/):
+    python scripts/bench_pdf_extraction.py                       # synthetic 400-page transcript
+    python scripts/bench_pdf_extraction.py --pdf volume.pdf -w 1 2 4 8
+
+Runs extract_pdf_stream once per worker count (default: 1, 2, 4 … up to the
+CPU count) and prints throughput, time to first chunk and peak RSS.  The
+single-process sequential extract_pdf is included as a baseline.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import settings  # noqa: E402
+from app.services import text_extraction  # noqa: E402
+
+
+def _synthetic_pdf(path: str, pages: int) -> None:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(path, pagesize=letter)
+    for page in range(1, pages + 1):
+        y = 740
+        for line in range(1, 26):
+            c.drawString(
+                60, y,
+                f"{line:>2}  Q. On page {page}, were all drivers within shift limits that week? "
+                f"A. I believe so, yes.",
+            )
+            y -= 26
+        c.showPage()
+    c.save()
+
+
+def _default_workers() -> list[int]:
+    counts, n = [], 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+async def _run(path: str, workers: int) -> tuple[int, float, float]:
+    settings.PDF_EXTRACT_WORKERS = workers
+    text_extraction.shutdown_pdf_pool()
+    await asyncio.get_running_loop().run_in_executor(
+        text_extraction._get_pool(), text_extraction._pdf_page_count, path,
+    )  # warm the pool so spawn cost is not counted
+    start = time.perf_counter()
+    first = None
+    pages = 0
+    async for _ in text_extraction.extract_pdf_stream(path):
+        first = first or time.perf_counter() - start
+        pages += 1
+    elapsed = time.perf_counter() - start
+    text_extraction.shutdown_pdf_pool()
+    return pages, elapsed, first or elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pdf")
+    parser.add_argument("--pages", type=int, default=400, help="synthetic PDF page count")
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=_default_workers())
+    parser.add_argument("--pages-per-task", type=int, default=settings.PDF_PAGES_PER_TASK)
+    args = parser.parse_args()
+    settings.PDF_PAGES_PER_TASK = args.pages_per_task
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.pdf
+        if not path:
+            path = os.path.join(tmp, "synthetic.pdf")
+            _synthetic_pdf(path, args.pages)
+
+        with open(path, "rb") as fh:
+            data = fh.read()
+        start = time.perf_counter()
+        baseline_pages = len(text_extraction.extract_pdf(data))
+        baseline = time.perf_counter() - start
+        del data
+
+        print(f"{os.path.basename(path)}: {baseline_pages} text pages, {os.cpu_count()} CPUs, "
+              f"{settings.PDF_PAGES_PER_TASK} pages/task")
+        print(f"{'mode':<14}{'pages/s':>10}{'total':>10}{'first chunk':>13}")
+        print(f"{'sequential':<14}{baseline_pages / baseline:10.1f}{baseline:9.2f}s{'-':>13}")
+        for workers in args.workers:
+            pages, elapsed, first = await _run(path, workers)
+            print(f"{f'{workers} worker(s)':<14}{pages / elapsed:10.1f}{elapsed:9.2f}s{first:12.2f}s")
+
+    parent_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    worker_mb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(f"peak RSS: parent {parent_mb:.0f}MB (includes the sequential baseline), largest worker {worker_mb:.0f}MB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
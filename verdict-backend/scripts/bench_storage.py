@@ -0,0 +1,78 @@
+"""Throughput benchmark for the object-storage backends (app/services/storage_backends.py).
+
+Usage (from verdict-backend/):
+    python scripts/bench_storage.py                        # local backend in a temp dir
+    python scripts/bench_storage.py --backend s3 --size-mb 32 -n 4
+
+Measures put, streaming put, full get and 64KB range reads through the same
+async wrappers the app uses (storage thread pool included), so local runs
+show the storage layer's own overhead without network effects.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import settings  # noqa: E402
+
+_MB = 1024 * 1024
+
+
+def _report(name: str, timings: list[float], nbytes: int) -> None:
+    mean = statistics.mean(timings)
+    print(f"{name:<14} {mean * 1000:9.2f}ms  {nbytes / mean / _MB:9.1f} MB/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=["local", "s3"], default="local")
+    parser.add_argument("--size-mb", type=float, default=8)
+    parser.add_argument("-n", type=int, default=8, help="objects per operation")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.STORAGE_BACKEND = args.backend
+        settings.LOCAL_STORAGE_DIR = tmp
+        from app.services import s3
+
+        size = int(args.size_mb * _MB)
+        data = os.urandom(size)
+        keys = [f"bench/{os.getpid()}/{i}.bin" for i in range(args.n)]
+        loop = asyncio.get_running_loop()
+
+        def timed(fn):
+            async def run(key):
+                start = time.perf_counter()
+                await fn(key)
+                return time.perf_counter() - start
+            return run
+
+        put = await asyncio.gather(*map(timed(lambda k: s3.upload_bytes_async(k, data)), keys))
+        chunks = [data[i:i + _MB] for i in range(0, size, _MB)]
+        stream = await asyncio.gather(*map(timed(
+            lambda k: loop.run_in_executor(None, s3.upload_stream, k + ".s", iter(chunks))
+        ), keys))
+        get = await asyncio.gather(*map(timed(s3.download_bytes_async), keys))
+        rng = await asyncio.gather(*map(timed(
+            lambda k: s3.download_range_async(k, size // 2, size // 2 + 64 * 1024 - 1)
+        ), keys))
+
+        print(f"{args.backend}: {args.n} concurrent objects of {args.size_mb}MB")
+        _report("put", put, size)
+        _report("put (stream)", stream, size)
+        _report("get", get, size)
+        _report("range 64KB", rng, 64 * 1024)
+
+        for key in keys:
+            await s3.delete_object_async(key)
+            await s3.delete_object_async(key + ".s")
+        s3.shutdown_s3()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
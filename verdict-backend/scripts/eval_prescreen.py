@@ -0,0 +1,196 @@
+"""Precision/recall harness for the local contradiction pre-screen (app/agents/prescreen.py).
+
+Usage (from verdict-backend/):
+    python scripts/eval_prescreen.py                      # built-in labeled sets
+    python scripts/eval_prescreen.py --labels turns.jsonl -v
+
+The built-in sets are reported separately.  BUILTIN is the hand-built set the
+signals were tuned on, so its recall says little.  SHORT is a regression set
+of terse answers (the length a witness actually gives on the record) against
+the case-file statements the detector retrieves; the pre-screen must not
+lose those.  HELD_OUT holds contradictions reported in review that an
+earlier, signal-gated version dropped; it was not used for tuning.  None of
+them replaces --labels with exported live turns.
+
+--labels takes JSONL rows of {"answer", "prior_statements": [str, ...],
+"contradiction": bool} — e.g. exported live turns with the LLM's verdict (or
+an attorney's) as the label.  "Escalated" is the positive class: recall is the
+share of real contradictions still sent to the LLM (flags kept), and
+"LLM calls saved" is the share of turns the pre-screen answered locally.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.agents.prescreen import prescreen_contradiction  # noqa: E402
+
+# Prior statements from data/verdict_cases.json, with hand-labeled answers.
+_LYMAN = [
+    "All drivers were within shift limits that week.",
+    "We had adequate staffing on Route 9 in January.",
+    "We are dangerously short on Route 9 — I may need drivers to double up.",
+]
+_GUNN = [
+    "Our financials are rock solid — fully audited.",
+    "I was not involved in day-to-day accounting decisions.",
+    "If Q2 doesn't hit $12M on paper, we're dead. Fix it.",
+]
+_TAMONTES = [
+    "Everything passed inspection — we're code compliant across the board.",
+    "All subs are licensed, I personally verified.",
+]
+_HALLER = [
+    "Conversion to open was necessary and within standard of care.",
+    "I discussed all potential complications with the patient pre-operatively.",
+    "Consent discussion lasted approximately 4 minutes. Patient asked no questions.",
+]
+_WHITFIELD = [
+    "Mr. Chen was fully aware of and approved every trade.",
+    "Your father specifically asked for aggressive growth strategies.",
+]
+
+BUILTIN = [
+    # Contradictions
+    ("Some drivers were over their shift limits that week.", _LYMAN, True),
+    ("Route 9 was understaffed in January, we knew that.", _LYMAN, True),
+    ("Staffing on Route 9 was never a problem in January.", _LYMAN, True),
+    ("I was involved in the accounting decisions every quarter.", _GUNN, True),
+    ("The financials were not audited at that point.", _GUNN, True),
+    ("The Q2 target was $8M, not twelve.", _GUNN, True),
+    ("One of the subs failed the electrical inspection.", _TAMONTES, True),
+    ("I never verified whether the subs were licensed.", _TAMONTES, True),
+    ("The consent discussion lasted about 30 minutes.", _HALLER, True),
+    ("I didn't discuss complications with the patient before surgery.", _HALLER, True),
+    ("Mr. Chen objected to several of the trades.", _WHITFIELD, True),
+    ("He was unaware of most trades until the statements arrived.", _WHITFIELD, True),
+    # Consistent / non-substantive
+    ("Yes.", _LYMAN, False),
+    ("I don't recall.", _LYMAN, False),
+    ("The drivers were within their shift limits that week.", _LYMAN, False),
+    ("I sent an email to HR in early January about Route 9.", _LYMAN, False),
+    ("Our financials were audited.", _GUNN, False),
+    ("Correct.", _GUNN, False),
+    ("I think I said that on the show.", _GUNN, False),
+    ("The subs were licensed, I checked them myself.", _TAMONTES, False),
+    ("I'm not sure.", _TAMONTES, False),
+    ("Converting to open was necessary and within the standard of care.", _HALLER, False),
+    ("I went over the potential complications with the patient pre-operatively.", _HALLER, False),
+    ("He asked for aggressive growth strategies.", _WHITFIELD, False),
+    ("I joined the firm in 2019.", _WHITFIELD, False),
+]
+
+
+# Case-file passages as the detector retrieves them for these answers.
+_LYMAN_FILE = _LYMAN + [
+    "CCTD Bus #4417 ran a red light at the intersection of 5th Ave and Main St.",
+    "Driver had been on shift for 14.5 hours. CCTD policy caps shifts at 10 hours.",
+    "Dashcam footage shows driver looking at personal phone 3 seconds before impact.",
+]
+_GUNN_FILE = _GUNN + [
+    "SEC filing on August 15 contained projections Gunn personally signed off on.",
+    "Gunn liquidated $1.8M in personal stock options two weeks before the restatement.",
+]
+_HALLER_FILE = _HALLER + [
+    "The consent form signed by Reyes only authorized the laparoscopic approach.",
+]
+_WHITFIELD_FILE = _WHITFIELD + [
+    "Whitfield moved 60% of Chen's portfolio into high-risk crypto derivatives without documented client authorization.",
+]
+
+SHORT = [
+    # Contradictions
+    ("The light was green.", _LYMAN_FILE, True),
+    ("I never signed it.", _GUNN_FILE, True),
+    ("I did not sign the SEC filing.", _GUNN_FILE, True),
+    ("He was on for ten hours.", _LYMAN_FILE, True),
+    ("I was there at 9pm.", _LYMAN_FILE, True),
+    ("I sold in March.", _GUNN_FILE, True),
+    ("He wasn't on his phone.", _LYMAN_FILE, True),
+    ("We had enough drivers.", _LYMAN_FILE, True),
+    ("It took twenty minutes.", _HALLER_FILE, True),
+    ("She authorized the open procedure.", _HALLER_FILE, True),
+    ("Mr. Chen never approved them.", _WHITFIELD_FILE, True),
+    ("Only about 10%.", _WHITFIELD_FILE, True),
+    ("I didn't verify them.", _TAMONTES, True),
+    ("It failed inspection.", _TAMONTES, True),
+    # Consistent / non-answers
+    ("Yes.", _LYMAN_FILE, False),
+    ("No, sir.", _GUNN_FILE, False),
+    ("I don't recall.", _HALLER_FILE, False),
+    ("Not that I remember.", _WHITFIELD_FILE, False),
+    ("Correct.", _TAMONTES, False),
+    ("The light was red.", _LYMAN_FILE, False),
+    ("I signed it.", _GUNN_FILE, False),
+    ("About four minutes.", _HALLER_FILE, False),
+]
+
+
+# Contradictions reported in review that the signal-gated version dropped.
+# Not used for tuning; every one must escalate.
+HELD_OUT = [
+    ("It happened around midnight.", ["The collision happened at about 5 pm."], True),
+    ("The light was green when he went through.", ["The light was yellow when the bus entered the intersection."], True),
+    ("I drove the truck that day.", ["My supervisor drove the truck that day."], True),
+    ("I only went there once.", ["I went to the site several times."], True),
+    ("That was last week.", ["That was back in 2019."], True),
+    ("My partner signed the contract.", ["I signed the contract."], True),
+    ("We never discussed the budget.", ["We discussed the budget at every meeting."], True),
+    ("I signed the contract.", ["I signed the contract."], False),
+    ("Yes, sir.", ["My supervisor drove the truck that day."], False),
+]
+
+
+def _load(path: str | None) -> list[tuple[str, list[str], bool]]:
+    rows = []
+    with open(path) as fh:
+        for line in fh:
+            if line.strip():
+                row = json.loads(line)
+                rows.append((row["answer"], row["prior_statements"], bool(row["contradiction"])))
+    return rows
+
+
+def _evaluate(name: str, rows: list[tuple[str, list[str], bool]], verbose: bool) -> None:
+    print(f"== {name}")
+    tp = fp = fn = tn = 0
+    for answer, statements, label in rows:
+        result = prescreen_contradiction(answer, [{"content": s} for s in statements])
+        if result.escalate and label:
+            tp += 1
+        elif result.escalate:
+            fp += 1
+        elif label:
+            fn += 1
+        else:
+            tn += 1
+        if verbose or (label and not result.escalate):
+            mark = "MISS " if label and not result.escalate else "     "
+            print(f"{mark}{'ESC' if result.escalate else 'skip'} {result.reason:<15} {','.join(result.signals):<22} {answer}")
+
+    total = len(rows)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    print(f"{total} turns  tp={tp} fp={fp} fn={fn} tn={tn}")
+    print(f"precision={precision:.3f}  recall={recall:.3f}  (flags lost: {fn})")
+    print(f"LLM calls saved: {fn + tn}/{total} ({(fn + tn) / total:.0%})\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--labels")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    if args.labels:
+        _evaluate(args.labels, _load(args.labels), args.verbose)
+    else:
+        _evaluate("BUILTIN (tuning set)", BUILTIN, args.verbose)
+        _evaluate("SHORT (short-answer regression set)", SHORT, args.verbose)
+        _evaluate("HELD_OUT (review-reported misses, not tuned on)", HELD_OUT, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ We use a rule-by-rule chunking strategy with sentence-level sub-chunks.
 Usage:
     cd verdict-backend
     python scripts/fre_xml_ingestion.py
+    python scripts/fre_xml_ingestion.py --local   # seed the local index (VECTOR_BACKEND=local)
 
 Requires:
     - data/usc28a.xml  (FRE XML from uscode.house.gov)
@@ -340,11 +341,28 @@ def ingest_rules(client, use_real_embeddings: bool = True):
     print(f"\n   Ingested {success}/{len(HARDCODED_FRE_RULES)} rules successfully")
 
 
+def ingest_rules_local():
+    import asyncio
+    from app.services.local_vector import LocalVectorBackend
+
+    records = [
+        {"id": hashlib.md5(rule["rule_number"].encode()).hexdigest()[:16], **rule}
+        for rule in HARDCODED_FRE_RULES
+    ]
+    backend = LocalVectorBackend(settings.LOCAL_VECTOR_DIR)
+    rejected = asyncio.run(backend.upsert(settings.DATABRICKS_FRE_INDEX, records))
+    print(f"\n   Ingested {len(records) - len(rejected)}/{len(records)} rules into {settings.LOCAL_VECTOR_DIR}")
+
+
 def main():
     print("=" * 60)
     print("VERDICT — FRE Corpus Ingestion")
     print("=" * 60)
 
+    if "--local" in sys.argv:
+        ingest_rules_local()
+        return
+
     if not settings.DATABRICKS_HOST or not settings.DATABRICKS_TOKEN:
         print("❌ DATABRICKS_HOST and DATABRICKS_TOKEN must be set in .env")
         sys.exit(1)
@@ -0,0 +1,63 @@
+"""Layout checks for retrieval chunking (app/services/chunking.py).
+
+Usage (from verdict-backend/):
+    python scripts/test_chunking.py        # or: python -m pytest scripts/test_chunking.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.chunking import chunk_for_retrieval  # noqa: E402
+from app.services.text_extraction import ExtractedChunk  # noqa: E402
+
+
+def _transcript_page(lines: int = 25) -> list[str]:
+    return [f"{n} Q. Question number {n} on this page?" if n % 2 else f"{n} A. Answer {n}." for n in range(1, lines + 1)]
+
+
+def _spans(text: str, pdf_page: int = 3) -> list[tuple]:
+    chunks = chunk_for_retrieval([ExtractedChunk(content=text, page=pdf_page, line=1)])
+    return [(c.page, c.line, c.end_page, c.end_line) for c in chunks]
+
+
+def test_page_header_line():
+    spans = _spans("\n".join(["Page 12"] + _transcript_page()))
+    assert spans[0][:2] == (12, 1) and spans[-1][2:] == (12, 25), spans
+
+
+def test_bare_page_number_first_line():
+    spans = _spans("\n".join(["12"] + _transcript_page()))
+    assert spans[0][:2] == (12, 1) and spans[-1][2:] == (12, 25), spans
+
+
+def test_bare_page_number_footer():
+    spans = _spans("\n".join(_transcript_page() + ["12"]))
+    assert spans[0][:2] == (12, 1) and spans[-1][2:] == (12, 25), spans
+
+
+def test_bare_first_line_is_not_a_header_without_line_one():
+    # "1" followed by line 2 is line 1 with no text, not page 1.
+    spans = _spans("\n".join(["1"] + _transcript_page()[1:]))
+    assert spans[0][:2] == (3, 2), spans
+
+
+def test_unnumbered_continuation_joins_the_line_above():
+    rows = _transcript_page()
+    rows.insert(4, "   and the forklift was still parked by dock 7.")
+    chunks = chunk_for_retrieval([ExtractedChunk(content="\n".join(rows), page=3, line=1)])
+    text = "\n".join(c.content for c in chunks)
+    assert "A. Answer 4. and the forklift was still parked by dock 7." in text, text
+    assert chunks[-1].end_line == 25, chunks[-1]
+
+
+def test_plain_text_keeps_positional_numbering():
+    spans = _spans("A letter.\nSecond line.\nThird line.")
+    assert spans == [(3, 1, 3, 3)], spans
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"ok  {name}")
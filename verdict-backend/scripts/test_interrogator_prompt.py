@@ -0,0 +1,103 @@
+"""Checks that the interrogator's prompt takes claude_stream's prompt-cache path.
+
+Usage (from verdict-backend/):
+    python scripts/test_interrogator_prompt.py        # or: python -m pytest scripts/test_interrogator_prompt.py
+"""
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.agents import interrogator  # noqa: E402
+from app.agents.models import VerdictCase  # noqa: E402
+from app.services import claude  # noqa: E402
+
+_CASE_FIELDS = (
+    "id", "case_name", "case_type", "opposing_party", "deposition_date", "witness_name",
+    "witness_role", "extracted_facts", "prior_statements", "exhibit_list",
+)
+
+
+def _seed_cases() -> list[VerdictCase]:
+    path = os.path.join(os.path.dirname(__file__), "..", "data", "verdict_cases.json")
+    with open(path) as fh:
+        rows = json.load(fh)
+    return [
+        VerdictCase(**{f: row.get(f) or "" for f in _CASE_FIELDS}, focus_areas="", aggression_level="STANDARD")
+        for row in rows
+    ]
+
+
+def _empty_case() -> VerdictCase:
+    return VerdictCase(
+        id="c", case_name="A v. B", case_type="", opposing_party="", deposition_date="TBD",
+        witness_name="W", witness_role="OTHER", extracted_facts="", prior_statements="",
+        exhibit_list="", focus_areas="", aggression_level="STANDARD",
+    )
+
+
+class _Stream:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        yield "Q?"
+
+    async def get_final_message(self):
+        usage = type("Usage", (), {
+            "output_tokens": 1, "input_tokens": 10,
+            "cache_read_input_tokens": 0, "cache_creation_input_tokens": 0,
+        })()
+        return type("Message", (), {"usage": usage})()
+
+
+class _Client:
+    def __init__(self):
+        self.calls: list[str] = []
+        outer = self
+
+        class _Messages:
+            def __init__(self, name):
+                self.name = name
+
+            def stream(self, **kwargs):
+                outer.calls.append(self.name)
+                return _Stream()
+
+        self.messages = _Messages("plain")
+        self.beta = type("Beta", (), {"prompt_caching": type("PC", (), {"messages": _Messages("cached")})()})()
+
+
+def test_every_case_block_is_cacheable():
+    for case in _seed_cases() + [_empty_case()]:
+        block = interrogator._case_block(case)
+        assert claude.prompt_cacheable(interrogator._INTERROGATOR_SYSTEM, block), case.id
+
+
+def test_session_prompt_takes_cached_path():
+    client = _Client()
+
+    async def run():
+        claude._get_client = lambda: client
+        interrogator.search_prior_statements = _no_statements
+        return "".join([t async for t in interrogator.generate_question(_empty_case(), "PRIOR_STATEMENTS", 1)])
+
+    assert asyncio.run(run()) == "Q?"
+    assert client.calls == ["cached"], client.calls
+
+
+async def _no_statements(**kwargs):
+    return []
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print("ok ", name)
@@ -0,0 +1,93 @@
+"""Append-only storage checks for the local BM25 and vector indexes
+(app/services/lexical_index.py, app/services/local_vector.py).
+
+Usage (from verdict-backend/):
+    python scripts/test_local_indexes.py        # or: python -m pytest scripts/test_local_indexes.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import lexical_index, local_vector  # noqa: E402
+from app.services.lexical_index import CaseLexicalIndex  # noqa: E402
+from app.services.local_vector import _Partition, embed_texts  # noqa: E402
+
+
+def _records(prefix: str, n: int) -> list[dict]:
+    return [{"id": f"{prefix}{i}", "content": f"shift {i} ended at {i % 12 + 1} pm on route {prefix}{i}"} for i in range(n)]
+
+
+def test_lexical_delete_and_replace_survive_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "case.jsonl"
+        index = CaseLexicalIndex(path)
+        index.add(_records("a", 3))
+        index.add([{"id": "a1", "content": "the forklift was parked"}])
+        index.delete(["a0"])
+        fresh = CaseLexicalIndex(path)  # another worker reading the same log
+        for idx in (index, fresh):
+            assert [r["id"] for _, r in idx.search("forklift", 5)] == ["a1"]
+            assert {r["id"] for _, r in idx.search("shift route", 5)} == {"a2"}
+
+
+def test_lexical_log_appends_and_compacts():
+    with tempfile.TemporaryDirectory() as tmp, _patched(lexical_index, 8):
+        path = Path(tmp) / "case.jsonl"
+        index = CaseLexicalIndex(path)
+        index.add(_records("a", 4))
+        index.add(_records("b", 4))
+        assert len(path.read_text().splitlines()) == 8
+        index.delete([f"a{i}" for i in range(4)] + ["b0"])
+        assert len(path.read_text().splitlines()) == 3
+        fresh = CaseLexicalIndex(path)
+        fresh.search("shift", 1)
+        assert len(fresh.docs) == 3
+
+
+def test_vector_delete_and_replace_survive_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        partition = _Partition(Path(tmp))
+        partition.upsert(_records("a", 3))
+        partition.upsert([{"id": "a1", "content": "the forklift was parked"}])
+        partition.delete(["a0"])
+        query = embed_texts(["forklift parked", "shift route"])
+        for part in (partition, _Partition(Path(tmp))):
+            by_query = part.search_many(query, 5, {})
+            assert by_query[0][0][1]["content"] == "the forklift was parked"
+            assert sorted(r["id"] for _, r in by_query[1]) == ["a1", "a2"]
+
+
+def test_vector_partition_appends_and_compacts():
+    with tempfile.TemporaryDirectory() as tmp, _patched(local_vector, 8):
+        partition = _Partition(Path(tmp))
+        partition.upsert(_records("a", 4))
+        partition.upsert(_records("b", 4))
+        assert len((Path(tmp) / "records.jsonl").read_text().splitlines()) == 8
+        partition.delete([f"a{i}" for i in range(4)] + ["b0"])
+        fresh = _Partition(Path(tmp))
+        fresh.search_many(embed_texts(["shift"]), 1, {})
+        assert len(fresh.records) == 3 and fresh.live.all()
+        assert fresh.vectors.shape[0] == 3
+
+
+class _patched:
+    def __init__(self, module, limit: int):
+        self.module, self.limit = module, limit
+
+    def __enter__(self):
+        self.name = "_COMPACT_MIN_LINES" if hasattr(self.module, "_COMPACT_MIN_LINES") else "_COMPACT_MIN_ROWS"
+        self.saved = getattr(self.module, self.name)
+        setattr(self.module, self.name, self.limit)
+
+    def __exit__(self, *exc):
+        setattr(self.module, self.name, self.saved)
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"ok  {name}")
@@ -7,6 +7,7 @@ from .config import settings
 from .dependencies import get_case_store
 from .models import HealthResponse
 from .routers import cases, sessions, conversations, analysis, reports, tts
+from .services.elevenlabs import elevenlabs_service
 
 
 @asynccontextmanager
@@ -15,6 +16,7 @@ async def lifespan(app: FastAPI):
     print(f"Loaded {len(store.list_all())} cases from {settings.cases_file}")
     print(f"Agent ID: {settings.agent_id}")
     yield
+    await elevenlabs_service.aclose()
 
 
 app = FastAPI(
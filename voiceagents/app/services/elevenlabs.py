@@ -12,25 +12,34 @@ class ElevenLabsService:
             "xi-api-key": settings.elevenlabs_api_key,
             "Content-Type": "application/json",
         }
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created on first use and closed on shutdown."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self._base,
+                headers=self._headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return self._http
 
-    def _client(self, timeout: float = 30.0) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            base_url=self._base,
-            headers=self._headers,
-            timeout=timeout,
-        )
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     # ── Signed conversation token ────────────────────────────────
 
     async def get_conversation_token(self, agent_id: str) -> str:
         """Get a short-lived signed URL the frontend uses to connect."""
-        async with self._client() as client:
-            resp = await client.get(
-                "/convai/conversation/get-signed-url",
-                params={"agent_id": agent_id},
-            )
-            resp.raise_for_status()
-            return resp.json()["signed_url"]
+        resp = await self._client().get(
+            "/convai/conversation/get-signed-url",
+            params={"agent_id": agent_id},
+        )
+        resp.raise_for_status()
+        return resp.json()["signed_url"]
 
     @staticmethod
     def build_conversation_override(
@@ -69,20 +78,20 @@ class ElevenLabsService:
         voice = voice_id or settings.coach_voice_id
         model = model_id or settings.tts_model_id
 
-        async with self._client(timeout=60.0) as client:
-            resp = await client.post(
-                f"/text-to-speech/{voice}",
-                json={
-                    "text": text,
-                    "model_id": model,
-                    "voice_settings": {
-                        "stability": stability,
-                        "similarity_boost": similarity_boost,
-                    },
+        resp = await self._client().post(
+            f"/text-to-speech/{voice}",
+            json={
+                "text": text,
+                "model_id": model,
+                "voice_settings": {
+                    "stability": stability,
+                    "similarity_boost": similarity_boost,
                 },
-            )
-            resp.raise_for_status()
-            return resp.content
+            },
+            timeout=60.0,
+        )
+        resp.raise_for_status()
+        return resp.content
 
     # ── Conversation history ─────────────────────────────────────
 
@@ -96,24 +105,21 @@ class ElevenLabsService:
         if cursor:
             params["cursor"] = cursor
 
-        async with self._client() as client:
-            resp = await client.get("/convai/conversations", params=params)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get("/convai/conversations", params=params)
+        resp.raise_for_status()
+        return resp.json()
 
     async def get_conversation(self, conversation_id: str) -> dict:
-        async with self._client() as client:
-            resp = await client.get(f"/convai/conversations/{conversation_id}")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get(f"/convai/conversations/{conversation_id}")
+        resp.raise_for_status()
+        return resp.json()
 
     # ── Agent info ───────────────────────────────────────────────
 
     async def get_agent(self, agent_id: str) -> dict:
-        async with self._client() as client:
-            resp = await client.get(f"/convai/agents/{agent_id}")
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self._client().get(f"/convai/agents/{agent_id}")
+        resp.raise_for_status()
+        return resp.json()
 
 
 elevenlabs_service = ElevenLabsService()